@@ -44,9 +44,35 @@ __all__ = [
     "SOCKETS_MAPPER",
     "CoinmarketcapAdapter",
     "CoinmarketcapClient",
+    "CoinmarketcapRankService",
     "DeribitClient",
+    "DeribitWebsocket",
+    "DeribitSocketManager",
+    "DeribitOptionChain",
+    "DeribitOptionChainProvider",
     "CoinalyzeClient",
+    "CoinalyzeHistoryCache",
+    "MarketSnapshotAggregator",
+    "plan_endpoints",
     "init_fixes",
+    "KlineDownloader",
+    "KlineResampler",
+    "KlineSeries",
+    "TradeKlineBuilder",
+    "trade_klines_socket",
+    "RateLimiter",
+    "TokenBucket",
+    "get_rate_limiter",
+    "ConcurrencyLimiter",
+    "get_concurrency_limiter",
+    "RequestMetrics",
+    "get_metrics",
+    "RetryPolicy",
+    "ProxyPool",
+    "ApiKeyPool",
+    "SessionManager",
+    "get_session",
+    "close_shared_session",
 ]
 
 from .abstract import *
@@ -55,12 +81,15 @@ from .bingx import *
 from .bitget import *
 from .bitunix import *
 from .bybit import *
+from .candles import *
 from .coinalyze import *
 from .coinmarketcap import *
 from .deribit import *
 from .fixes import init_fixes
 from .gate import *
+from .http import *
 from .mappers import *
+from .market import *
 from .mexc import *
 from .okx import *
 from .xt import *
@@ -1,5 +1,7 @@
-__all__ = ["AbstractWebsocket", "AbstractClient", "AbstractAdapter", "AbstractSocketManager", "BaseClient", ]
+__all__ = ["AbstractWebsocket", "AbstractClient", "AbstractAdapter", "AbstractSocketManager", "BaseClient",
+           "AbstractMessageFilter", "ClosedKlineFlagFilter", "ClosedKlineBoundaryFilter", ]
 
 from .adapter import AbstractAdapter
 from .client import AbstractClient, BaseClient
+from .filters import AbstractMessageFilter, ClosedKlineFlagFilter, ClosedKlineBoundaryFilter
 from .websocket import AbstractWebsocket, AbstractSocketManager
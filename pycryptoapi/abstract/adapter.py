@@ -1,9 +1,13 @@
 __all__ = ["AbstractAdapter", ]
 
 from abc import ABC, abstractmethod
+from array import array
+from itertools import chain
+from operator import ge, le
 from typing import List, Any, Dict
 
-from ..types import TickerDailyItem, KlineDict, OpenInterestDict, AggTradeDict, LiquidationDict, DepthDict
+from ..types import TickerDailyItem, KlineDict, OpenInterestDict, AggTradeDict, LiquidationDict, DepthDict, \
+    DepthArrays
 from ..exceptions import AdapterException
 
 
@@ -131,28 +135,68 @@ class AbstractAdapter(ABC):
 
     @staticmethod
     @abstractmethod
-    def depth(raw_data: Any) -> DepthDict:
+    def depth(raw_data: Any, as_arrays: bool = False) -> DepthDict | DepthArrays:
         """
         Преобразует сырой ответ с HTTP запроса в унифицированный вид.
         :param raw_data: Сырой ответ с HTTP запроса.
+        :param as_arrays: Если True, возвращает стакан в виде плоских массивов float64 (DepthArrays).
         :return: Унифицированный обьект.
         """
         pass
 
     @staticmethod
-    def _parse_and_sort_depth(asks_raw: List[Any], bids_raw: List[Any]) -> DepthDict:
+    def _parse_and_sort_depth(
+            asks_raw: List[Any],
+            bids_raw: List[Any],
+            as_arrays: bool = False
+    ) -> DepthDict | DepthArrays:
+        """
+        Приводит уровни стакана к float и упорядочивает их: asks ASC, bids DESC.
+
+        Все поддерживаемые биржи уже отдают упорядоченные уровни, поэтому сначала выполняется
+        линейная проверка монотонности, а сортировка запускается только если проверка не прошла.
+
+        :param asks_raw: Уровни asks в формате [[price, size], ...].
+        :param bids_raw: Уровни bids в формате [[price, size], ...].
+        :param as_arrays: Если True, возвращает DepthArrays без создания кортежа на каждый уровень.
+        """
         try:
+            if as_arrays:
+                return DepthArrays(
+                    asks=AbstractAdapter._depth_side_array(asks_raw, descending=False),
+                    bids=AbstractAdapter._depth_side_array(bids_raw, descending=True),
+                )
+
             asks = [(float(price), float(size)) for price, size in asks_raw]
             bids = [(float(price), float(size)) for price, size in bids_raw]
 
             # Унификация: asks ASC, bids DESC
-            asks.sort(key=lambda x: x[0])
-            bids.sort(key=lambda x: x[0], reverse=True)
+            if not AbstractAdapter._is_monotonic([price for price, _ in asks], descending=False):
+                asks.sort(key=lambda x: x[0])
+            if not AbstractAdapter._is_monotonic([price for price, _ in bids], descending=True):
+                bids.sort(key=lambda x: x[0], reverse=True)
 
             return DepthDict(asks=asks, bids=bids)
         except Exception as e:
             raise AdapterException(f"Error parsing orderbook: {e}")
 
+    @staticmethod
+    def _depth_side_array(levels_raw: List[Any], descending: bool) -> array:
+        """Собирает одну сторону стакана в плоский массив [price0, size0, price1, size1, ...]."""
+        levels = array("d", map(float, chain.from_iterable(levels_raw)))
+        if len(levels) != 2 * len(levels_raw):
+            raise ValueError("Each orderbook level must contain exactly two values: price and size")
+
+        if not AbstractAdapter._is_monotonic(levels[0::2], descending=descending):
+            pairs = sorted(zip(levels[0::2], levels[1::2]), key=lambda x: x[0], reverse=descending)
+            levels = array("d", chain.from_iterable(pairs))
+        return levels
+
+    @staticmethod
+    def _is_monotonic(prices: Any, descending: bool) -> bool:
+        """Линейная проверка упорядоченности цен (без аллокации кортежей на каждый уровень)."""
+        return all(map(ge if descending else le, prices, prices[1:]))
+
     @staticmethod
     @abstractmethod
     def futures_last_price(raw_data: Any) -> Any:
@@ -2,15 +2,30 @@ __all__ = ["AbstractClient", "BaseClient", ]
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from itertools import cycle
-from typing import Any, Dict, Optional, Literal, Self
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Literal, Self, \
+    Tuple
+from urllib.parse import urlsplit
 
 import aiohttp
 import loguru
+import orjson
 from loguru._logger import Logger  # noqa
 
-from ..types import JsonLike
+from ..enums import Dataset
+from ..http import AdaptiveLimiter, ConcurrencyLimiter, LatencyWindow, ProxyPool, ProxyStats, RateLimiter, \
+    RequestMetrics, RequestSample, ResponseCache, RetryPolicy, SingleFlight, TokenBucket, get_metrics, \
+    get_rate_limiter, get_session, hedged, is_shared_session
+from ..types import BulkResult, JsonLike, KlineDict, OpenInterestDict
+
+# Части имен заголовков, значения которых не пишутся в лог
+_SENSITIVE_HEADER_PARTS: Tuple[str, ...] = ("auth", "key", "token", "sign", "secret", "passphrase", "cookie")
+
+# Политика повторов запросов текущей задачи, заданная через BaseClient.single_attempt()
+_retry_policy_override: ContextVar[Optional[RetryPolicy]] = ContextVar("retry_policy_override", default=None)
 
 
 class ClientMixin:
@@ -25,24 +40,71 @@ class BaseClient(ABC, ClientMixin):
     Базовый класс для создания клиентов для работы с API.
 
     Параметры:
-        session (aiohttp.ClientSession): Сессия для выполнения HTTP-запросов.
+        session (aiohttp.ClientSession): Сессия для выполнения HTTP-запросов. По умолчанию общая для процесса.
         logger (Logger): Логгер для вывода информации.
         request_kwargs (dict): Дополнительные аргументы для передачи в запросы (например, заголовки).
+        rate_limiter (RateLimiter): Планировщик лимитов запросов. По умолчанию общий для процесса.
+        cache_ttl (dict): Время жизни кэша ответов по префиксам URL (переопределяет _CACHE_TTL).
+        cache_size (int): Максимальное количество закэшированных ответов.
+        retry_policy (RetryPolicy): Политика повторных попыток. По умолчанию строится из max_retries и retry_delay.
+        proxies (list[str]): Список прокси. Из них строится ProxyPool с настройками по умолчанию.
+        proxy_pool (ProxyPool): Пул прокси (переопределяет proxies), можно разделить между клиентами.
+        hedge (dict): Подстраховка запросов по префиксам URL (переопределяет _HEDGE).
+        concurrency_limiter (ConcurrencyLimiter): Адаптивное ограничение одновременных запросов по хостам (AIMD).
+            По умолчанию выключено. Чтобы разделить лимит между клиентами, передайте get_concurrency_limiter().
+        metrics (RequestMetrics): Метрики запросов по эндпоинтам. По умолчанию общие для процесса (get_metrics()).
     """
 
+    # Лимиты запросов: префикс URL без схемы (хост или хост + путь) -> (вместимость, период в секундах).
+    # Ключ "*" относится ко всем запросам клиента. Запрос списывает свой вес из всех подходящих корзин.
+    _RATE_LIMITS: Dict[str, Tuple[int, float]] = {}
+
+    # Методы, одновременные одинаковые запросы которых объединяются в один (single-flight).
+    _COALESCE_METHODS: FrozenSet[str] = frozenset({"GET"})
+
+    # Время жизни кэша ответов: префикс URL без схемы (или "*") -> TTL в секундах. По умолчанию кэш выключен.
+    _CACHE_TTL: Dict[str, float] = {}
+
+    # Подстраховка (hedging) запросов: префикс URL без схемы (или "*") -> перцентиль задержки (0..1).
+    # Если ответ не пришел за это время, отправляется дубликат (через другой прокси или соединение)
+    # и используется тот ответ, который придет первым. Дубликат расходует лимиты. По умолчанию выключено.
+    # Пример: {"fapi.binance.com/fapi/v1/ticker/price": 0.95, "fapi.binance.com/fapi/v1/depth": 0.95}
+    _HEDGE: Dict[str, float] = {}
+
+    # Сколько замеров задержки нужно, прежде чем начать подстраховку.
+    _HEDGE_MIN_SAMPLES: int = 20
+
     def __init__(
             self,
-            session: aiohttp.ClientSession,
+            session: Optional[aiohttp.ClientSession] = None,
             logger: logging.Logger | Logger = loguru.logger,
             max_retries: Optional[int] = 3,
             retry_delay: Optional[int | float] = 0.1,
             proxies: Optional[list[str]] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            cache_ttl: Optional[Dict[str, float]] = None,
+            cache_size: int = 256,
+            retry_policy: Optional[RetryPolicy] = None,
+            proxy_pool: Optional[ProxyPool] = None,
+            hedge: Optional[Dict[str, float]] = None,
+            concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+            metrics: Optional[RequestMetrics] = None,
     ) -> None:
-        self._session: aiohttp.ClientSession = session
+        self._client_session: Optional[aiohttp.ClientSession] = session
         self._logger: logging.Logger | Logger = logger
         self._max_retries: int = max(max_retries, 1)
         self._retry_delay: int | float = max(retry_delay, 0)
-        self._proxies_cycle: cycle | None = cycle(proxies) if proxies else None
+        self._proxy_pool: Optional[ProxyPool] = proxy_pool or (ProxyPool(proxies) if proxies else None)
+        self._rate_limiter: RateLimiter = rate_limiter or get_rate_limiter()
+        self._cache_ttl: Dict[str, float] = self._CACHE_TTL if cache_ttl is None else cache_ttl
+        self._cache: ResponseCache = ResponseCache(maxsize=cache_size)
+        self._single_flight: SingleFlight = SingleFlight()
+        self._retry_policy: RetryPolicy = retry_policy or RetryPolicy(
+            max_attempts=self._max_retries, base_delay=self._retry_delay)
+        self._hedge: Dict[str, float] = self._HEDGE if hedge is None else hedge
+        self._latencies: Dict[str, LatencyWindow] = {}
+        self._concurrency_limiter: Optional[ConcurrencyLimiter] = concurrency_limiter
+        self._metrics: RequestMetrics = metrics or get_metrics()
 
     @classmethod
     async def create(
@@ -52,23 +114,49 @@ class BaseClient(ABC, ClientMixin):
             max_retries: Optional[int] = 3,
             retry_delay: Optional[int | float] = 0.1,
             proxies: Optional[list[str]] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            cache_ttl: Optional[Dict[str, float]] = None,
+            cache_size: int = 256,
+            retry_policy: Optional[RetryPolicy] = None,
+            proxy_pool: Optional[ProxyPool] = None,
+            hedge: Optional[Dict[str, float]] = None,
+            concurrency_limiter: Optional[ConcurrencyLimiter] = None,
+            metrics: Optional[RequestMetrics] = None,
     ) -> Self:
         """
         Создает инстанцию клиента.
-        Создать клиент можно и через __init__, но в таком случае session: aiohttp.ClientSession - обязательный параметр.
+        Если session не передана, используется общая для процесса сессия с настроенным пулом соединений.
         :return:
         """
         return cls(
-            session=session or aiohttp.ClientSession(),
+            session=session,
             logger=logger,
             max_retries=max_retries,
             retry_delay=retry_delay,
-            proxies=proxies
+            proxies=proxies,
+            rate_limiter=rate_limiter,
+            cache_ttl=cache_ttl,
+            cache_size=cache_size,
+            retry_policy=retry_policy,
+            proxy_pool=proxy_pool,
+            hedge=hedge,
+            concurrency_limiter=concurrency_limiter,
+            metrics=metrics,
         )
 
+    @property
+    def _session(self) -> aiohttp.ClientSession:
+        """Сессия клиента: переданная явно или общая для процесса."""
+        return self._client_session or get_session()
+
+    def proxy_stats(self) -> Dict[str, ProxyStats]:
+        """Возвращает статистику по прокси клиента (задержка, доля ошибок, исключен ли из ротации)."""
+        return self._proxy_pool.stats() if self._proxy_pool else {}
+
     async def close(self) -> None:
-        """Закрывает сессию."""
-        await self._session.close()
+        """Закрывает сессию клиента. Общая сессия не закрывается, ее закрывает close_shared_session()."""
+        if self._client_session is not None and not is_shared_session(self._client_session):
+            await self._client_session.close()
 
     async def _make_request(
             self,
@@ -77,7 +165,10 @@ class BaseClient(ABC, ClientMixin):
             params: Optional[Dict[str, Any]] = None,
             data: Optional[Dict[str, Any]] = None,
             headers: Optional[Dict[str, Any]] = None,
-    ) -> JsonLike:
+            raw: bool = False,
+            retry_policy: Optional[RetryPolicy] = None,
+            hedge: bool = True,
+    ) -> JsonLike | bytes:
         """
         Выполняет HTTP-запрос к API биржи.
 
@@ -87,48 +178,356 @@ class BaseClient(ABC, ClientMixin):
             params (dict, optional): Параметры запроса (query string).
             data (dict, optional): Тело запроса для POST/PUT.
             headers (dict, optional): Заголовки запроса.
+            raw (bool): Вернуть тело ответа как bytes, без декодирования JSON (например, для адаптера,
+                который разбирает только нужные поля).
+            retry_policy (RetryPolicy, optional): Политика повторов для этого запроса вместо self._retry_policy.
+            hedge (bool): Разрешить подстраховку (_HEDGE). Неидемпотентные запросы (ордера) не дублируются.
 
         Возвращает:
-            dict или list: Ответ API в формате JSON.
+            dict или list: Ответ API в формате JSON (или bytes, если raw=True).
+        """
+        ttl: Optional[float] = self._request_cache_ttl(url)
+        if method not in self._COALESCE_METHODS and not ttl:
+            return await self._send_hedged(
+                method=method, url=url, params=params, data=data, headers=headers, raw=raw,
+                retry_policy=retry_policy, hedge=hedge)
+
+        key: bytes = orjson.dumps(
+            [method, url, params, data, headers], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+        if ttl:
+            payload: Optional[bytes] = self._cache.get(key)
+            if payload is not None:
+                self._logger.debug(f"Cache hit: {method} {url} | Params: {params}")
+                return payload if raw else orjson.loads(payload)
+
+        async def _fetch() -> bytes:
+            body: bytes = await self._send_hedged(
+                method=method, url=url, params=params, data=data, headers=headers, raw=True,
+                retry_policy=retry_policy, hedge=hedge)
+            if ttl:
+                self._cache.set(key, body, ttl)
+            return body
+
+        # Общий результат - неизменяемые bytes, каждый вызывающий декодирует свою копию: fixes изменяют ответ на месте
+        payload: bytes = await self._single_flight.do(key, _fetch)
+        return payload if raw else orjson.loads(payload)
+
+    async def _send_hedged(
+            self,
+            method: Literal["GET", "POST", "PUT", "DELETE"],
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            data: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, Any]] = None,
+            raw: bool = False,
+            retry_policy: Optional[RetryPolicy] = None,
+            hedge: bool = True,
+    ) -> JsonLike | bytes:
+        """
+        Выполняет HTTP-запрос с подстраховкой, если она включена для url (см. _HEDGE) и hedge=True.
+
+        Дубликат отправляется, если ответ не пришел за заданный перцентиль задержки по последним
+        запросам на этот префикс. Пока замеров меньше _HEDGE_MIN_SAMPLES, запрос не дублируется.
+        """
+        prefix: Optional[str] = self._longest_prefix(url, self._hedge) if hedge else None
+        if prefix is None:
+            return await self._send_request(
+                method=method, url=url, params=params, data=data, headers=headers, raw=raw,
+                retry_policy=retry_policy)
+
+        window: LatencyWindow = self._latencies.setdefault(prefix, LatencyWindow())
+        used_proxies: List[str] = []  # Дубликат уходит через другой прокси, чем исходный запрос
+
+        async def _call() -> JsonLike | bytes:
+            started: float = time.monotonic()
+            result: JsonLike | bytes = await self._send_request(
+                method=method, url=url, params=params, data=data, headers=headers, raw=raw,
+                used_proxies=used_proxies, retry_policy=retry_policy)
+            window.observe(time.monotonic() - started)
+            return result
+
+        delay: Optional[float] = window.percentile(self._hedge[prefix]) \
+            if len(window) >= self._HEDGE_MIN_SAMPLES else None
+        if delay is None:
+            return await _call()
+        return await hedged(_call, delay)
+
+    async def _send_request(
+            self,
+            method: Literal["GET", "POST", "PUT", "DELETE"],
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            data: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, Any]] = None,
+            raw: bool = False,
+            used_proxies: Optional[List[str]] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+    ) -> JsonLike | bytes:
         """
-        self._logger.debug(f"Request: {method} {url} | Params: {params} | Data: {data} | Headers: {headers}")
+        Выполняет HTTP-запрос с учетом лимитов и повторными попытками по политике self._retry_policy.
 
-        for attempt in range(1, self._max_retries + 1):
+        :param used_proxies: Список прокси, через которые уже отправлялся этот запрос. Следующая попытка
+            по возможности уходит через другой прокси. Список дополняется выбранными прокси.
+        :param retry_policy: Политика повторов для этого запроса вместо self._retry_policy.
+        """
+        self._logger.debug(
+            f"Request: {method} {url} | Params: {params} | Data: {data} | Headers: {self._redact(headers)}")
+
+        weight: int | float = self._request_weight(method, url, params) if self._RATE_LIMITS else 0
+
+        policy: RetryPolicy = retry_policy or _retry_policy_override.get() or self._retry_policy
+        deadline: Optional[float] = policy.deadline()
+        attempt: int = 0
+        used_proxies = [] if used_proxies is None else used_proxies
+        limiter: Optional[AdaptiveLimiter] = self._concurrency_limiter.limiter(urlsplit(url).netloc) \
+            if self._concurrency_limiter else None
+
+        while True:
+            attempt += 1
+            # Повтор по возможности уходит через другой прокси, чем предыдущая попытка
+            proxy: Optional[str] = None
+            if self._proxy_pool:
+                proxy = self._proxy_pool.acquire(exclude=used_proxies[-1] if used_proxies else None)
+                used_proxies.append(proxy)
+            buckets: List[TokenBucket] = self._rate_limit_buckets(url, proxy)
+            latency: Optional[float] = None
+            started: Optional[float] = None
+            response: Optional[aiohttp.ClientResponse] = None
+            slot: Optional[AdaptiveLimiter] = None
             try:
+                if limiter is not None:
+                    await limiter.acquire()
+                    slot = limiter
+                # Запрос, который превысит лимит, ждет в очереди, а не уходит на биржу
+                await self._rate_limiter.acquire((bucket, weight) for bucket in buckets)
+                started = time.monotonic()
                 async with self._session.request(
                         method=method,
                         url=url,
                         params=params,
                         json=data if method in {"POST", "PUT"} else None,  # Передача тела запроса
                         headers=headers,
-                        proxy=next(self._proxies_cycle) if self._proxies_cycle else None,
+                        proxy=proxy,
                 ) as response:
-                    return await self._handle_response(response=response)
+                    latency = time.monotonic() - started
+                    if buckets:
+                        self._update_rate_limits(response, buckets)
+                    result: JsonLike | bytes = await self._handle_response(response=response, raw=raw)
+
+            except Exception as e:
+                self._report_attempt(proxy, slot, latency, e)
+                if started is not None:
+                    self._record_metrics(method, url, attempt, started, latency, response, buckets, e)
+                if not policy.is_retryable(e):
+                    raise
+
+                delay: float = policy.delay(attempt, policy.retry_after(e))
+                out_of_budget: bool = deadline is not None and time.monotonic() + delay > deadline
+                if attempt >= policy.max_attempts or out_of_budget:
+                    self._logger.error(f"Max retries reached ({attempt} attempts). Giving up on {method} {url}: "
+                                       f"{type(e)} -> {e}")
+                    if isinstance(e, (aiohttp.ServerTimeoutError, aiohttp.ConnectionTimeoutError)):
+                        raise TimeoutError(f"Timeout error after {attempt} request on {method} {url}") from e
+                    raise
+
+                self._logger.debug(f"Attempt {attempt}/{policy.max_attempts} failed: {type(e)} -> {e}. "
+                                   f"Retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+            except BaseException:
+                # Отмена запроса: прокси и сервер не виноваты, но слоты должны освободиться без изменения лимита
+                if proxy is not None:
+                    self._proxy_pool.release(proxy)
+                if slot is not None:
+                    slot.discard()
+                raise
+
+            else:
+                self._report_attempt(proxy, slot, latency)
+                self._record_metrics(method, url, attempt, started, latency, response, buckets)
+                return result
+
+    def bulk_concurrency(self, max_concurrency: int) -> int:
+        """
+        Возвращает число одновременных запросов для массовой загрузки.
+
+        Если задан concurrency_limiter, реальную параллельность определяет его адаптивный лимит в _send_request,
+        поэтому возвращается его максимальный лимит. Иначе действует фиксированный max_concurrency.
+        """
+        if self._concurrency_limiter is not None:
+            return self._concurrency_limiter.max_limit
+        return max(max_concurrency, 1)
+
+    @staticmethod
+    def _redact(headers: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Заменяет значения заголовков с ключами и токенами (Authorization, api_key и т.д.) для лога."""
+        if not headers:
+            return headers
+        return {
+            name: "***" if any(part in name.lower() for part in _SENSITIVE_HEADER_PARTS) else value
+            for name, value in headers.items()
+        }
+
+    @contextmanager
+    def single_attempt(self) -> Iterator[None]:
+        """
+        Запросы внутри блока (в текущей задаче) выполняются одной попыткой.
+        Нужен, когда повторы делает вызывающий код: иначе его попытки умножаются на попытки retry_policy.
+        """
+        token = _retry_policy_override.set(self._retry_policy.replace(max_attempts=1))
+        try:
+            yield
+        finally:
+            _retry_policy_override.reset(token)
+
+    def _report_attempt(
+            self,
+            proxy: Optional[str],
+            slot: Optional[AdaptiveLimiter],
+            latency: Optional[float],
+            error: Optional[Exception] = None,
+    ) -> None:
+        """
+        Сообщает результат попытки пулу прокси и ограничителю одновременных запросов.
+
+        Ошибкой прокси считаются только сбои соединения (таймауты, обрывы): HTTP ошибки означают,
+        что прокси исправно доставил ответ. При 429/418 прокси исключается из ротации на Retry-After
+        секунд, так как лимит биржи исчерпан именно для его IP.
+
+        Перегрузкой сервера для ограничителя считаются 429/418, 5xx, таймауты и сбои соединения (обрывы,
+        сбросы). Прочие ошибки без HTTP статуса (например, разбор ответа) освобождают слот без изменения лимита.
+        """
+        status: Optional[int] = self._retry_policy.status(error) if error is not None else None
+        connection_error: bool = error is not None and status is None and self._retry_policy.is_retryable(error)
+        if proxy is not None:
+            self._proxy_pool.release(proxy, latency=latency, ok=not connection_error)
+            if status in (418, 429):
+                self._proxy_pool.eject(proxy, self._retry_policy.retry_after(error) or 1)
+        if slot is not None:
+            overloaded: bool = connection_error or status in (418, 429) or (status is not None and status >= 500)
+            if error is not None and status is None and not overloaded:
+                slot.discard()
+            else:
+                slot.release(latency=latency, overloaded=overloaded)
+
+    def _record_metrics(
+            self,
+            method: str,
+            url: str,
+            attempt: int,
+            started: float,
+            latency: Optional[float],
+            response: Optional[aiohttp.ClientResponse],
+            buckets: List[TokenBucket],
+            error: Optional[Exception] = None,
+    ) -> None:
+        """Записывает замер попытки в метрики: задержки, размер ответа, статус и оставшийся лимит."""
+        elapsed: float = time.monotonic() - started
+        parts = urlsplit(url)
+        status: Optional[int] = None
+        if response is not None:
+            status = response.status
+        elif error is not None:
+            status = self._retry_policy.status(error)
+        content = getattr(response, "content", None)
+        self._metrics.record(RequestSample(
+            method=method,
+            host=parts.netloc,
+            path=parts.path,
+            status=status,
+            attempt=attempt,
+            latency=elapsed,
+            ttfb=latency,
+            body_time=elapsed - latency if latency is not None else None,
+            size=getattr(content, "total_bytes", None),
+            error=type(error).__name__ if error is not None else None,
+            headroom=min((max(b.available, 0) / b.capacity for b in buckets), default=None),
+        ))
 
-            except (aiohttp.ServerTimeoutError, aiohttp.ConnectionTimeoutError) as e:
-                self._logger.debug(f"Attempt {attempt}/{self._max_retries} failed: {type(e)} -> {e}")
-                if attempt < self._max_retries:
-                    await asyncio.sleep(self._retry_delay)
+    @staticmethod
+    def _matches(url: str, prefixes: Dict[str, Any]) -> List[str]:
+        """Возвращает префиксы URL (без схемы), под которые подходит url. Префикс "*" подходит под любой url."""
+        parts = urlsplit(url)
+        target: str = parts.netloc + parts.path
+        return [prefix for prefix in prefixes if prefix == "*" or target.startswith(prefix)]
 
-        self._logger.error("Max retries reached. Giving up.")
-        raise TimeoutError(f"Timeout error after {self._max_retries} request on {method} {url}")
+    def _rate_limit_buckets(self, url: str, proxy: Optional[str] = None) -> List[TokenBucket]:
+        """
+        Возвращает корзины токенов, из которых списывается вес запроса на url.
+        Биржи считают лимиты по IP, поэтому у каждого прокси свои корзины.
+        """
+        if not self._RATE_LIMITS:
+            return []
+        suffix: str = f"@{proxy}" if proxy else ""
+        return [
+            self._rate_limiter.bucket(f"{type(self).__name__}:{prefix}{suffix}", *self._RATE_LIMITS[prefix])
+            for prefix in self._matches(url, self._RATE_LIMITS)
+        ]
+
+    @classmethod
+    def _longest_prefix(cls, url: str, prefixes: Dict[str, Any]) -> Optional[str]:
+        """Возвращает самый длинный подходящий под url префикс ("*" - самый короткий) или None."""
+        if not prefixes:
+            return None
+        matches: List[str] = cls._matches(url, prefixes)
+        if not matches:
+            return None
+        return max(matches, key=lambda p: 0 if p == "*" else len(p))
+
+    def _request_cache_ttl(self, url: str) -> Optional[float]:
+        """Возвращает время жизни кэша для url (самый длинный подходящий префикс) или None."""
+        prefix: Optional[str] = self._longest_prefix(url, self._cache_ttl)
+        return None if prefix is None else self._cache_ttl[prefix]
+
+    def _request_weight(
+            self,
+            method: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+    ) -> int | float:
+        """Возвращает вес запроса для лимитов биржи. По умолчанию каждый запрос весит 1."""
+        return 1
 
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> JsonLike:
+    def _update_rate_limits(self, response: aiohttp.ClientResponse, buckets: List[TokenBucket]) -> None:
+        """
+        Обновляет корзины токенов по ответу биржи.
+
+        При 429 (Too Many Requests) и 418 (IP забанен) корзины блокируются на Retry-After секунд,
+        чтобы следующие запросы ждали, а не продлевали бан. Клиенты могут переопределить метод,
+        чтобы сверять счетчики с заголовками об израсходованном лимите.
+        """
+        if response.status in (418, 429):
+            try:
+                retry_after: float = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after: float = 1
+            self._logger.warning(f"{self} Rate limit hit ({response.status}), pausing for {retry_after}s")
+            for bucket in buckets:
+                bucket.penalize(retry_after)
+
+    async def _handle_response(self, response: aiohttp.ClientResponse, raw: bool = False) -> JsonLike | bytes:
         """
         Функция обрабатывает ответ от HTTP запроса.
+        :param raw: Вернуть тело ответа как bytes, без декодирования JSON.
         :return:
         """
         response.raise_for_status()
-        result = await response.json()
-
-        # try to log result if it's not too large
-        try:
-            result_str: str = str(result)
-            self._logger.debug(f"Response: {result_str[:100]} {'...' if len(result_str) > 100 else ''}")
-        except Exception as e:
-            self._logger.error(f"Error while log response: {e}")
+        body: bytes = await response.read()
+        self._log_response(body)
+        return body if raw else orjson.loads(body)
+
+    def _log_response(self, body: bytes, suffix: str = "") -> None:
+        """Логирует начало тела ответа. Превью строится из сырых байт и только если включен уровень DEBUG."""
+        if isinstance(self._logger, logging.Logger):
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(f"Response: {self._preview(body)}{suffix}")
+        else:
+            self._logger.opt(lazy=True).debug("Response: {}{}", lambda: self._preview(body), lambda: suffix)
 
-        return result
+    @staticmethod
+    def _preview(body: bytes, size: int = 100) -> str:
+        return body[:size].decode("utf-8", errors="replace") + (" ..." if len(body) > size else "")
 
     def __str__(self) -> str:
         return f"APIClient"
@@ -140,6 +539,15 @@ class BaseClient(ABC, ClientMixin):
 class AbstractClient(BaseClient, ABC):
     """Абстрактный класс для создания клиентов для работы с API криптобирж."""
 
+    # True, если open_interest() без аргументов возвращает данные сразу по всем тикерам.
+    _OPEN_INTEREST_BULK: bool = False
+
+    # Методы без аргументов, которые возвращают данные по всем тикерам -> наборы данных, которые можно получить
+    # из их ответа адаптером. Используется планировщиком запросов (pycryptoapi.market.plan_endpoints).
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS}),
+    }
+
     @abstractmethod
     async def ticker(self, *args, **kwargs) -> Any:
         """Возвращает JSON, в котором содержится информация о изменении цены и объеме монет за 24ч."""
@@ -180,3 +588,161 @@ class AbstractClient(BaseClient, ABC):
         """Возвращает JSON, в котором содержится информация о последней цене на тикерах
         фьючерсного рынка."""
         pass
+
+    def _resolve_adapter(self, adapter: Any = None) -> Any:
+        """Возвращает адаптер биржи этого клиента (через ADAPTERS_MAPPER), если он не передан явно."""
+        if adapter is not None:
+            return adapter
+        from ..mappers import ADAPTERS_MAPPER, CLIENTS_MAPPER  # Ленивый импорт: mappers импортирует клиентов
+        for exchange, client_cls in CLIENTS_MAPPER.items():
+            if isinstance(self, client_cls):
+                return ADAPTERS_MAPPER[exchange]
+        raise ValueError(f"Can not resolve adapter for {type(self).__name__}, pass adapter explicitly")
+
+    async def _fan_out(
+            self,
+            symbols: Iterable[str],
+            fetch: Callable[[str], Awaitable[Any]],
+            max_concurrency: int,
+            retries: int,
+    ) -> BulkResult:
+        """
+        Выполняет fetch(symbol) по каждому тикеру с ограничением параллельности и повторными попытками.
+
+        Лимиты биржи соблюдаются планировщиком в _make_request, семафор ограничивает число одновременных запросов:
+        при заданном concurrency_limiter - его максимальным лимитом (фактический лимит подстраивается AIMD),
+        иначе фиксированным max_concurrency (см. bulk_concurrency).
+        Повторяются только временные ошибки по retry_policy: ошибки адаптера и 4xx сразу попадают в errors.
+        Повторы делаются только здесь (запросы внутри fetch идут одной попыткой), пауза перед повтором
+        не занимает слот семафора.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.bulk_concurrency(max_concurrency))
+        result: BulkResult = BulkResult(data={}, errors={})
+        retries = max(retries, 1)
+
+        async def _one(symbol: str) -> None:
+            for attempt in range(1, retries + 1):
+                try:
+                    async with semaphore:
+                        with self.single_attempt():
+                            data: Any = await fetch(symbol)
+                    result["data"][symbol] = data
+                    result["errors"].pop(symbol, None)
+                    return
+                except Exception as e:
+                    result["errors"][symbol] = f"{type(e).__name__}: {e}"
+                    self._logger.debug(f"{self} {symbol} attempt {attempt}/{retries} failed: {type(e)} -> {e}")
+                    if attempt >= retries or not self._retry_policy.is_retryable(e):
+                        return
+                    delay: float = self._retry_policy.delay(attempt, self._retry_policy.retry_after(e))
+                await asyncio.sleep(delay)
+
+        await asyncio.gather(*(_one(symbol) for symbol in dict.fromkeys(symbols)))
+        return result
+
+    async def open_interest_many(
+            self,
+            symbols: Iterable[str],
+            adapter: Any = None,
+            fix: Optional[Callable[[Any], Any]] = None,
+            max_concurrency: int = 20,
+            retries: int = 3,
+    ) -> BulkResult:
+        """
+        Получает открытый интерес по списку тикеров и объединяет его в один OpenInterestDict.
+
+        Если биржа отдает открытый интерес по всем тикерам одним запросом, выполняется один запрос.
+
+        :param symbols: Список тикеров.
+        :param adapter: Адаптер биржи. По умолчанию определяется по клиенту.
+        :param fix: Функция из pycryptoapi.fixes, которую нужно применить к сырому ответу.
+        :param max_concurrency: Максимальное количество одновременных запросов. Если задан concurrency_limiter,
+            используется его адаптивный лимит.
+        :param retries: Количество попыток по каждому тикеру.
+        :return: BulkResult, где data - OpenInterestDict по успешным тикерам, errors - ошибки по остальным.
+        """
+        adapter = self._resolve_adapter(adapter)
+        symbols = list(dict.fromkeys(symbols))
+
+        async def _fetch(symbol: Optional[str] = None) -> OpenInterestDict:
+            raw_data = await (self.open_interest() if symbol is None else self.open_interest(symbol=symbol))
+            return adapter.open_interest(fix(raw_data) if fix else raw_data)
+
+        if self._OPEN_INTEREST_BULK:
+            bulk: BulkResult = await self._fan_out(["*"], lambda _: _fetch(), 1, retries)
+            if bulk["errors"]:
+                return BulkResult(data={}, errors={symbol: bulk["errors"]["*"] for symbol in symbols})
+            everything: OpenInterestDict = bulk["data"]["*"]
+            return BulkResult(
+                data={symbol: everything[symbol] for symbol in symbols if symbol in everything},
+                errors={symbol: "Symbol not found" for symbol in symbols if symbol not in everything},
+            )
+
+        result: BulkResult = await self._fan_out(symbols, _fetch, max_concurrency, retries)
+        merged: OpenInterestDict = {}
+        for item in result["data"].values():
+            merged.update(item)
+        result["data"] = merged
+        return result
+
+    async def _klines_many(
+            self,
+            fetch: Callable[..., Awaitable[Any]],
+            adapt: Callable[[Any], List[KlineDict]],
+            symbols: Iterable[str],
+            max_concurrency: int,
+            retries: int,
+            **kwargs
+    ) -> BulkResult:
+        async def _fetch(symbol: str) -> List[KlineDict]:
+            klines: List[KlineDict] = adapt(await fetch(symbol=symbol, **kwargs))
+            for kline in klines:
+                kline["s"] = symbol
+            return klines
+
+        return await self._fan_out(symbols, _fetch, max_concurrency, retries)
+
+    async def klines_many(
+            self,
+            symbols: Iterable[str],
+            adapter: Any = None,
+            max_concurrency: int = 10,
+            retries: int = 3,
+            **kwargs
+    ) -> BulkResult:
+        """
+        Получает свечи спотового рынка по списку тикеров.
+
+        :param symbols: Список тикеров.
+        :param adapter: Адаптер биржи. По умолчанию определяется по клиенту.
+        :param max_concurrency: Максимальное количество одновременных запросов. Если задан concurrency_limiter,
+            используется его адаптивный лимит.
+        :param retries: Количество попыток по каждому тикеру.
+        :param kwargs: Аргументы для klines (interval, limit и т.д.).
+        :return: BulkResult, где data - symbol -> List[KlineDict], errors - ошибки по тикерам.
+        """
+        adapter = self._resolve_adapter(adapter)
+        return await self._klines_many(self.klines, adapter.kline, symbols, max_concurrency, retries, **kwargs)
+
+    async def futures_klines_many(
+            self,
+            symbols: Iterable[str],
+            adapter: Any = None,
+            max_concurrency: int = 10,
+            retries: int = 3,
+            **kwargs
+    ) -> BulkResult:
+        """
+        Получает свечи фьючерсного рынка по списку тикеров.
+
+        :param symbols: Список тикеров.
+        :param adapter: Адаптер биржи. По умолчанию определяется по клиенту.
+        :param max_concurrency: Максимальное количество одновременных запросов. Если задан concurrency_limiter,
+            используется его адаптивный лимит.
+        :param retries: Количество попыток по каждому тикеру.
+        :param kwargs: Аргументы для futures_klines (interval, limit и т.д.).
+        :return: BulkResult, где data - symbol -> List[KlineDict], errors - ошибки по тикерам.
+        """
+        adapter = self._resolve_adapter(adapter)
+        return await self._klines_many(
+            self.futures_klines, adapter.futures_kline, symbols, max_concurrency, retries, **kwargs)
@@ -0,0 +1,112 @@
+__all__ = ["AbstractMessageFilter", "ClosedKlineFlagFilter", "ClosedKlineBoundaryFilter", ]
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class AbstractMessageFilter(ABC):
+    """
+    Фильтр сообщений вебсокета, который применяется до того, как сообщение попадет в очередь воркеров.
+
+    Возвращает список сообщений, которые нужно поставить в очередь: пустой список - сообщение отброшено.
+    """
+
+    @abstractmethod
+    def __call__(self, message: Any) -> List[Any]:
+        pass
+
+
+class ClosedKlineFlagFilter(AbstractMessageFilter):
+    """
+    Пропускает только закрытые свечи для бирж, которые передают флаг закрытия свечи (Binance "x",
+    Bybit "confirm", OKX "confirm").
+
+    Если в одном сообщении несколько свечей (Bybit, OKX), функция флага возвращает список флагов
+    по элементам message["data"], и в очередь попадает копия сообщения только с закрытыми свечами.
+    """
+
+    def __init__(self, is_closed: Callable[[Any], Optional[bool | List[bool]]]) -> None:
+        """
+        :param is_closed: Функция, которая возвращает флаг закрытия свечи из сырого сообщения (или список
+            флагов по элементам message["data"]), или None, если сообщение не является свечой
+            (подтверждение подписки, pong и т.д.). Такие сообщения пропускаются без изменений.
+        """
+        self._is_closed: Callable[[Any], Optional[bool | List[bool]]] = is_closed
+
+    def __call__(self, message: Any) -> List[Any]:
+        try:
+            closed: Optional[bool | List[bool]] = self._is_closed(message)
+        except (KeyError, IndexError, TypeError, AttributeError):
+            closed = None
+        if isinstance(closed, list):
+            if all(closed):
+                return [message]
+            data: List[Any] = [entry for entry, flag in zip(message["data"], closed) if flag]
+            return [{**message, "data": data}] if data else []
+        if closed is None or closed:
+            return [message]
+        return []
+
+
+class ClosedKlineBoundaryFilter(AbstractMessageFilter):
+    """
+    Пропускает только закрытые свечи для бирж без флага закрытия (MEXC, Bitget).
+
+    Для каждого тикера хранится последнее обновление текущей свечи. Когда приходит обновление
+    свечи со следующим временем открытия, сохраненное сообщение отдается как закрытая свеча.
+    Поэтому закрытая свеча доставляется с задержкой до первого обновления следующей свечи.
+
+    Если в одном сообщении несколько свечей (Bitget присылает финальное обновление прошлой свечи вместе
+    с новой), функция split делит его на сообщения по одной свече, и каждое обрабатывается отдельно.
+    """
+
+    def __init__(
+            self,
+            key: Callable[[Any], Optional[Tuple[str, int]]],
+            drop: Optional[Callable[[Any], bool]] = None,
+            split: Optional[Callable[[Any], List[Any]]] = None,
+    ) -> None:
+        """
+        :param key: Функция, которая возвращает (тикер, время открытия свечи) из сырого сообщения,
+            или None, если сообщение не является свечой. Такие сообщения пропускаются без изменений.
+        :param drop: Функция, которая возвращает True для сообщений, которые нужно отбросить
+            (например, снимок истории свечей при подписке).
+        :param split: Функция, которая делит сообщение на сообщения по одной свече (по возрастанию времени).
+        """
+        self._key: Callable[[Any], Optional[Tuple[str, int]]] = key
+        self._drop: Optional[Callable[[Any], bool]] = drop
+        self._split: Optional[Callable[[Any], List[Any]]] = split
+        self._pending: Dict[str, Tuple[int, Any]] = {}  # symbol -> (open time, last message)
+
+    def __call__(self, message: Any) -> List[Any]:
+        if self._drop is not None:
+            try:
+                if self._drop(message):
+                    return []
+            except (KeyError, IndexError, TypeError, AttributeError):
+                pass
+        if self._split is None:
+            return self._filter(message)
+        try:
+            messages: List[Any] = self._split(message)
+        except (KeyError, IndexError, TypeError, AttributeError, ValueError):
+            messages = [message]
+        return [closed for part in messages for closed in self._filter(part)]
+
+    def _filter(self, message: Any) -> List[Any]:
+        try:
+            key: Optional[Tuple[str, int]] = self._key(message)
+        except (KeyError, IndexError, TypeError, AttributeError, ValueError):
+            key = None
+        if key is None:
+            return [message]
+
+        symbol, open_time = key
+        pending: Optional[Tuple[int, Any]] = self._pending.get(symbol)
+        if pending is None or open_time == pending[0]:
+            self._pending[symbol] = (open_time, message)
+            return []
+        if open_time > pending[0]:
+            self._pending[symbol] = (open_time, message)
+            return [pending[1]]
+        return []  # Запоздавшее обновление уже закрытой свечи
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import List, Callable, Optional, Awaitable, Union
+from typing import List, Callable, Optional, Awaitable, Union, Any
 
 import loguru
 import orjson
@@ -14,6 +14,7 @@ from websockets.asyncio.client import ClientConnection
 
 from ..enums import MarketType
 from ..exceptions import QueueOverflowException
+from .filters import AbstractMessageFilter
 
 
 class AbstractWebsocket(ABC):
@@ -35,6 +36,7 @@ class AbstractWebsocket(ABC):
             reconnect_interval: int = 30,
             no_message_reconnect_timeout: int = 60,
             num_workers: int = 3,
+            message_filter: Optional[AbstractMessageFilter] = None,
             **ws_kwargs  # websocket kwargs
     ) -> None:
         """
@@ -51,6 +53,7 @@ class AbstractWebsocket(ABC):
             reconnect_interval (int): Интервал для повторного подключения при ошибке.
             no_message_reconnect_timeout (int): Макс. секунд без сообщений до попытки переподключения.
             num_workers (int): Количество воркеров для обработки сообщений.
+            message_filter (AbstractMessageFilter, optional): Фильтр сообщений до постановки в очередь.
             **ws_kwargs (dict): Дополнительные аргументы для WebSocket-соединения.
         """
         self._topic: str = topic
@@ -62,6 +65,7 @@ class AbstractWebsocket(ABC):
         self._reconnect_interval: int = reconnect_interval
         self._no_message_reconnect_timeout: int = no_message_reconnect_timeout
         self._logger: logging.Logger | Logger = logger
+        self._message_filter: Optional[AbstractMessageFilter] = message_filter
 
         # Очередь и список рабочих
         self._queue = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
@@ -177,7 +181,7 @@ class AbstractWebsocket(ABC):
                 message = await conn.recv()
                 self._last_message_time = time.time()
                 self._logger.trace(f"{self} Received message: {message}")
-                await self._queue.put(orjson.loads(message))
+                await self._put(orjson.loads(message))
             except orjson.JSONDecodeError:
                 if message not in ["ping", "pong"]:
                     self._logger.error(f"{self} orjson.JSONDecodeError whilte handling message: {message}")
@@ -187,6 +191,19 @@ class AbstractWebsocket(ABC):
                 self._logger.error(f"{self} Error({type(e)}) while handling message: {e}")
                 break
 
+    async def _put(self, message: Any) -> None:
+        """
+        Ставит сообщение в очередь воркеров, предварительно пропустив его через фильтр (если он задан).
+
+        Параметры:
+            message (Any): Декодированное сообщение.
+        """
+        if self._message_filter is None:
+            await self._queue.put(message)
+        else:
+            for filtered in self._message_filter(message):
+                await self._queue.put(filtered)
+
     async def _ping_task(self, conn: ClientConnection) -> None:
         """
         Отправляет ping-сообщения на сервер WebSocket.
@@ -3,7 +3,7 @@ from typing import Any, List, Dict, Union
 from ..abstract import AbstractAdapter
 from ..exceptions import AdapterException
 from ..types import TickerDailyItem, OpenInterestItem, KlineDict, AggTradeDict, LiquidationDict, OpenInterestDict, \
-    DepthDict
+    DepthDict, DepthArrays
 
 
 class BinanceAdapter(AbstractAdapter):
@@ -204,9 +204,9 @@ class BinanceAdapter(AbstractAdapter):
         raise NotImplementedError("Not implemented yet...")
 
     @staticmethod
-    def depth(raw_data: Any) -> DepthDict:
+    def depth(raw_data: Any, as_arrays: bool = False) -> DepthDict | DepthArrays:
         try:
-            return AbstractAdapter._parse_and_sort_depth(raw_data["asks"], raw_data["bids"])
+            return AbstractAdapter._parse_and_sort_depth(raw_data["asks"], raw_data["bids"], as_arrays)
         except Exception as e:
             raise AdapterException(f"BybitAdapter error: {e}")
 
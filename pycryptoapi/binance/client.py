@@ -1,12 +1,15 @@
 __all__ = ["BinanceClient"]
 
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple, FrozenSet
+from urllib.parse import urlsplit
 
 import aiohttp
+import orjson
 
 from ..abstract import AbstractClient
-from ..enums import Timeframe, Exchange
+from ..enums import Timeframe, Exchange, Dataset
 from ..exceptions import APIException
+from ..http import TokenBucket
 from ..types import JsonLike
 
 
@@ -14,36 +17,75 @@ class BinanceClient(AbstractClient):
     _BASE_SPOT_URL: str = "https://api.binance.com"
     _BASE_FUTURES_URL: str = "https://fapi.binance.com"
 
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> JsonLike:
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS, Dataset.LAST_PRICE}),
+        "funding_rate": frozenset({Dataset.FUNDING_RATE}),
+    }
+
+    # REQUEST_WEIGHT лимиты на IP (GET /api/v3/exchangeInfo, GET /fapi/v1/exchangeInfo)
+    _RATE_LIMITS: Dict[str, Tuple[int, float]] = {
+        "api.binance.com": (6000, 60),
+        "fapi.binance.com": (2400, 60),
+    }
+
+    # Вес эндпоинтов: (с параметром symbol, без него)
+    _SYMBOL_WEIGHTS: Dict[str, Tuple[int, int]] = {
+        "/api/v3/ticker/24hr": (2, 80),
+        "/fapi/v1/ticker/24hr": (1, 40),
+        "/fapi/v1/premiumIndex": (1, 10),
+    }
+
+    def _request_weight(
+            self,
+            method: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Возвращает вес запроса по документации Binance."""
+        params = params or {}
+        path: str = urlsplit(url).path
+
+        if path in self._SYMBOL_WEIGHTS:
+            with_symbol, without_symbol = self._SYMBOL_WEIGHTS[path]
+            return with_symbol if params.get("symbol") else without_symbol
+
+        limit: int = int(params.get("limit") or 500)
+        if path == "/api/v3/depth":
+            return 5 if limit <= 100 else 25 if limit <= 500 else 50 if limit <= 1000 else 250
+        if path == "/fapi/v1/depth":
+            return 2 if limit <= 50 else 5 if limit <= 100 else 10 if limit <= 500 else 20
+        if path == "/api/v3/klines":
+            return 2
+        if path == "/fapi/v1/klines":
+            return 1 if limit < 100 else 2 if limit < 500 else 5 if limit <= 1000 else 10
+        return 1
+
+    def _update_rate_limits(self, response: aiohttp.ClientResponse, buckets: List[TokenBucket]) -> None:
+        """Сверяет корзины с израсходованным весом, который сообщает Binance, и обрабатывает 429/418."""
+        super()._update_rate_limits(response, buckets)
+        used_weight: Optional[str] = response.headers.get("x-mbx-used-weight-1m")
+        if used_weight is not None:
+            for bucket in buckets:
+                bucket.reconcile(int(used_weight))
+
+    async def _handle_response(self, response: aiohttp.ClientResponse, raw: bool = False) -> JsonLike | bytes:
         """
         Функция обрабатывает ответ от HTTP запроса.
+        :param raw: Вернуть тело ответа как bytes, без декодирования JSON.
         :return:
         """
         # Handle 429 status code
         if response.status == 429:
-            raise APIException(429, "Rate limit is violated...")
+            retry_after: Optional[str] = response.headers.get("Retry-After")
+            raise APIException(429, "Rate limit is violated...", float(retry_after) if retry_after else None)
 
         # Handle other bad codes
         response.raise_for_status()
 
-        # Handle used weight
-        try:
-            used_weight: int = int(response.headers.get("x-mbx-used-weight-1m"))
-        except Exception as e:
-            used_weight: int = 0
-            self._logger.error(f"Can not handle used weight: {e}")
-
-        result = await response.json()
-
-        # try to log result if it's not too large
-        try:
-            result_str: str = str(result)
-            self._logger.debug(
-                f"Response: {result_str[:100]} {'...' if len(result_str) > 100 else ''}. Used weight={used_weight}")
-        except Exception as e:
-            self._logger.error(f"Error while log response: {e}")
-
-        return result
+        body: bytes = await response.read()
+        self._log_response(body, f". Used weight={response.headers.get('x-mbx-used-weight-1m')}")
+        return body if raw else orjson.loads(body)
 
     # 1 for a single symbol; 40 when the symbol parameter is omitted
     async def ticker(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -2,7 +2,7 @@ __all__ = ["BinanceWebsocket", "BinanceSocketManager", ]
 
 from typing import Optional, Callable, Awaitable, List, Tuple
 
-from ..abstract import AbstractWebsocket, AbstractSocketManager
+from ..abstract import AbstractWebsocket, AbstractSocketManager, ClosedKlineFlagFilter
 from ..enums import MarketType, Timeframe, Exchange
 from ..exceptions import MarketException
 
@@ -40,6 +40,12 @@ class BinanceWebsocket(AbstractWebsocket):
     def _subscribe_message(self) -> Optional[str]:
         return None
 
+    @staticmethod
+    def _kline_is_closed(raw_msg: dict) -> Optional[bool]:
+        """Возвращает флаг закрытия свечи из сообщения kline (None, если это не свеча)."""
+        kline = raw_msg.get("data", raw_msg).get("k")
+        return None if kline is None else kline["x"]
+
 
 class BinanceSocketManager(AbstractSocketManager):
 
@@ -62,8 +68,14 @@ class BinanceSocketManager(AbstractSocketManager):
             tickers: List[str] | Tuple[str, ...],
             timeframe: Timeframe,  # АЯЗ ИЗ БУДУЩЕГО - ИЗМЕНИ ЭТО НАЗВАНИЕ НА INTERVAL
             callback: Callable[..., Awaitable],
+            closed_only: bool = False,
             **kwargs
     ) -> BinanceWebsocket:
+        """
+        :param closed_only: Если True, в callback попадают только закрытые свечи (по флагу "x").
+        """
+        if closed_only:
+            kwargs["message_filter"] = ClosedKlineFlagFilter(BinanceWebsocket._kline_is_closed)
         return BinanceWebsocket(
             topic="@kline" + "_" + timeframe.to_exchange_format(Exchange.BINANCE),
             tickers=tickers,
@@ -4,6 +4,7 @@ from ..abstract import AbstractAdapter
 from ..exceptions import AdapterException
 from ..types import (
     AggTradeDict,
+    DepthArrays,
     DepthDict,
     KlineDict,
     LiquidationDict,
@@ -208,7 +209,7 @@ class BingxAdapter(AbstractAdapter):
         raise NotImplementedError()
 
     @staticmethod
-    def depth(raw_data: Any) -> DepthDict:
+    def depth(raw_data: Any, as_arrays: bool = False) -> DepthDict | DepthArrays:
         try:
             data = (
                 raw_data.get("data", raw_data)
@@ -219,7 +220,7 @@ class BingxAdapter(AbstractAdapter):
                 raise ValueError("depth data is not a dict")
             asks = data.get("asks") or data.get("a")
             bids = data.get("bids") or data.get("b")
-            return AbstractAdapter._parse_and_sort_depth(asks, bids)
+            return AbstractAdapter._parse_and_sort_depth(asks, bids, as_arrays)
         except Exception as e:
             raise AdapterException(f"Error adapting BingX depth data: {e}")
 
@@ -1,16 +1,26 @@
 __all__ = ["BingxClient"]
 
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple, FrozenSet
 
 from ..abstract import AbstractClient
-from ..enums import Timeframe
+from ..enums import Timeframe, Dataset
 from ..types import JsonLike
 
 
 class BingxClient(AbstractClient):
     _BASE_URL: str = "https://open-api.bingx.com"
 
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS}),
+        "funding_rate": frozenset({Dataset.FUNDING_RATE}),
+        "futures_last_price": frozenset({Dataset.LAST_PRICE}),
+    }
+
+    # Лимит на IP для публичных рыночных эндпоинтов: 100 запросов за 10 секунд
+    _RATE_LIMITS: Dict[str, Tuple[int, float]] = {"*": (100, 10)}
+
     def _prepare_params(
         self, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
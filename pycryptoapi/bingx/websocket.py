@@ -61,7 +61,7 @@ class BingxWebsocket(AbstractWebsocket):
                     await conn.send("Pong")
                     self._logger.debug(f"{self} Pong sent.")
                     continue
-                await self._queue.put(decoded)
+                await self._put(decoded)
             except orjson.JSONDecodeError:
                 if message not in ["Ping", "Pong"]:
                     self._logger.error(
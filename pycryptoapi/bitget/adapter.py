@@ -3,7 +3,7 @@ from typing import Any, List, Dict, Union
 from ..abstract import AbstractAdapter
 from ..exceptions import AdapterException
 from ..types import TickerDailyItem, KlineDict, OpenInterestItem, AggTradeDict, LiquidationDict, OpenInterestDict, \
-    DepthDict
+    DepthDict, DepthArrays
 
 
 class BitgetAdapter(AbstractAdapter):
@@ -199,10 +199,10 @@ class BitgetAdapter(AbstractAdapter):
         raise NotImplementedError("Not implemented yet...")
 
     @staticmethod
-    def depth(raw_data: Any) -> DepthDict:
+    def depth(raw_data: Any, as_arrays: bool = False) -> DepthDict | DepthArrays:
         try:
             data = raw_data["data"]
-            return AbstractAdapter._parse_and_sort_depth(data["asks"], data["bids"])
+            return AbstractAdapter._parse_and_sort_depth(data["asks"], data["bids"], as_arrays)
         except Exception as e:
             raise AdapterException(f"BybitAdapter error: {e}")
 
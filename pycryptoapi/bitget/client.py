@@ -1,14 +1,23 @@
 __all__ = ["BitgetClient"]
 
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, FrozenSet
 
 from ..abstract import AbstractClient
+from ..enums import Dataset
 
 
 class BitgetClient(AbstractClient):
-
     _BASE_URL: str = "https://api.bitget.com"
 
+    # open_interest() без аргументов отдает открытый интерес по всем тикерам
+    _OPEN_INTEREST_BULK: bool = True
+
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS, Dataset.OPEN_INTEREST, Dataset.LAST_PRICE}),
+        "funding_rate": frozenset({Dataset.FUNDING_RATE}),
+    }
+
     async def klines(self, *args, **kwargs) -> Any:
         raise NotImplementedError()
 
@@ -3,6 +3,7 @@ __all__ = ["BitgetWebsocket", "BitgetSocketManager", ]
 import json
 from typing import Optional, Callable, Awaitable, List, Tuple
 
+from ..abstract.filters import ClosedKlineBoundaryFilter
 from ..abstract.websocket import AbstractWebsocket, AbstractSocketManager
 from ..enums import MarketType, Timeframe, Exchange
 
@@ -33,6 +34,25 @@ class BitgetWebsocket(AbstractWebsocket):
             }
         )
 
+    @staticmethod
+    def _kline_key(raw_msg: dict) -> Optional[Tuple[str, int]]:
+        """Возвращает (тикер, время открытия свечи) из обновления candle (None, если это не обновление свечи)."""
+        if raw_msg.get("action") != "update" or not raw_msg["arg"]["channel"].startswith("candle"):
+            return None
+        return raw_msg["arg"]["instId"], int(raw_msg["data"][-1][0])
+
+    @staticmethod
+    def _kline_split(raw_msg: dict) -> List[dict]:
+        """Делит обновление candle с несколькими свечами на сообщения по одной свече (по возрастанию времени)."""
+        if raw_msg.get("action") != "update" or len(raw_msg.get("data") or []) < 2:
+            return [raw_msg]
+        return [{**raw_msg, "data": [kline]} for kline in sorted(raw_msg["data"], key=lambda k: int(k[0]))]
+
+    @staticmethod
+    def _kline_is_snapshot(raw_msg: dict) -> bool:
+        """Снимок при подписке содержит историю и незакрытую свечу, в режиме closed_only он отбрасывается."""
+        return raw_msg.get("action") == "snapshot" and raw_msg["arg"]["channel"].startswith("candle")
+
 
 class BitgetSocketManager(AbstractSocketManager):
 
@@ -59,8 +79,19 @@ class BitgetSocketManager(AbstractSocketManager):
             tickers: List[str] | Tuple[str, ...],
             callback: Callable[..., Awaitable],
             timeframe: Timeframe,
+            closed_only: bool = False,
             **kwargs
     ) -> BitgetWebsocket:
+        """
+        :param closed_only: Если True, в callback попадают только закрытые свечи. Bitget не передает флаг
+            закрытия, поэтому свеча считается закрытой, когда приходит обновление следующей свечи.
+        """
+        if closed_only:
+            kwargs["message_filter"] = ClosedKlineBoundaryFilter(
+                BitgetWebsocket._kline_key,
+                drop=BitgetWebsocket._kline_is_snapshot,
+                split=BitgetWebsocket._kline_split,
+            )
         return BitgetWebsocket(
             topic="candle" + timeframe.to_exchange_format(Exchange.BITGET),
             tickers=tickers,
@@ -3,7 +3,7 @@ from typing import Any, List, Dict
 from ..abstract import AbstractAdapter
 from ..exceptions import AdapterException
 from ..types import TickerDailyItem, KlineDict, OpenInterestItem, AggTradeDict, LiquidationDict, OpenInterestDict, \
-    DepthDict
+    DepthDict, DepthArrays
 
 
 class BybitAdapter(AbstractAdapter):
@@ -222,10 +222,10 @@ class BybitAdapter(AbstractAdapter):
         return BybitAdapter.kline(raw_data)
 
     @staticmethod
-    def depth(raw_data: Any) -> DepthDict:
+    def depth(raw_data: Any, as_arrays: bool = False) -> DepthDict | DepthArrays:
         try:
             result = raw_data["result"]
-            return AbstractAdapter._parse_and_sort_depth(result["a"], result["b"])
+            return AbstractAdapter._parse_and_sort_depth(result["a"], result["b"], as_arrays)
         except Exception as e:
             raise AdapterException(f"BybitAdapter error: {e}")
 
@@ -1,14 +1,25 @@
 __all__ = ["BybitClient"]
 
-from typing import Any, Optional, Dict, Literal
+from typing import Any, Optional, Dict, Literal, Tuple, FrozenSet
 
 from ..abstract import AbstractClient
-from ..enums import Timeframe, Exchange
+from ..enums import Timeframe, Exchange, Dataset
 
 
 class BybitClient(AbstractClient):
     _BASE_URL: str = "https://api.bybit.kz"  # Kazakhstan as default
 
+    # open_interest() без аргументов отдает открытый интерес по всем тикерам
+    _OPEN_INTEREST_BULK: bool = True
+
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS, Dataset.FUNDING_RATE, Dataset.OPEN_INTEREST, Dataset.LAST_PRICE}),
+    }
+
+    # Лимит на IP для всех HTTP запросов: 600 запросов за 5 секунд
+    _RATE_LIMITS: Dict[str, Tuple[int, float]] = {"*": (600, 5)}
+
     @classmethod
     def set_tld(cls, tld: Literal["nl", "tr", "hk", "testnet", "kz"]) -> None:
         """
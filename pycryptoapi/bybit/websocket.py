@@ -3,7 +3,7 @@ __all__ = ["BybitWebsocket", "BybitSocketManager", ]
 import json
 from typing import Optional, Callable, List, Awaitable, Tuple
 
-from ..abstract import AbstractWebsocket, AbstractSocketManager
+from ..abstract import AbstractWebsocket, AbstractSocketManager, ClosedKlineFlagFilter
 from ..enums import MarketType, Timeframe, Exchange
 from ..exceptions import MarketException
 
@@ -32,6 +32,13 @@ class BybitWebsocket(AbstractWebsocket):
     def _ping_message(self) -> Optional[str]:
         return json.dumps({"op": "ping"})
 
+    @staticmethod
+    def _kline_is_closed(raw_msg: dict) -> Optional[List[bool]]:
+        """Возвращает флаги закрытия свечей сообщения kline по элементам data (None, если это не свеча)."""
+        if not raw_msg.get("topic", "").startswith("kline"):
+            return None
+        return [bool(kline["confirm"]) for kline in raw_msg["data"]]
+
 
 class BybitSocketManager(AbstractSocketManager):
 
@@ -58,8 +65,14 @@ class BybitSocketManager(AbstractSocketManager):
             tickers: List[str] | Tuple[str, ...],
             timeframe: Timeframe,
             callback: Callable[..., Awaitable],
+            closed_only: bool = False,
             **kwargs
     ) -> BybitWebsocket:
+        """
+        :param closed_only: Если True, в callback попадают только закрытые свечи (по флагу "confirm").
+        """
+        if closed_only:
+            kwargs["message_filter"] = ClosedKlineFlagFilter(BybitWebsocket._kline_is_closed)
         return BybitWebsocket(
             topic="kline" + "." + timeframe.to_exchange_format(Exchange.BYBIT),
             tickers=tickers,
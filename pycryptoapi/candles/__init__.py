@@ -0,0 +1,6 @@
+__all__ = ["KlineDownloader", "KlineResampler", "KlineSeries", "TradeKlineBuilder", "trade_klines_socket", ]
+
+from .builder import TradeKlineBuilder, trade_klines_socket
+from .downloader import KlineDownloader
+from .resampler import KlineResampler
+from .series import KlineSeries
@@ -0,0 +1,184 @@
+__all__ = ["TradeKlineBuilder", "trade_klines_socket", ]
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..abstract import AbstractWebsocket
+from ..enums import Exchange, MarketType, Timeframe
+from ..exceptions import AdapterException, TimeframeException
+from ..mappers import ADAPTERS_MAPPER, SOCKETS_MAPPER
+from ..types import AggTradeDict, KlineDict
+from .resampler import _bucket_start
+
+
+class _Candle:
+    """Свеча, собираемая из сделок."""
+
+    __slots__ = ("start", "end", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: int, end: int, price: float) -> None:
+        self.start: int = start
+        self.end: int = end
+        self.open: float = price
+        self.high: float = price
+        self.low: float = price
+        self.close: float = price
+        self.volume: float = 0.0
+
+    def to_kline(self, symbol: str, timeframe: Timeframe, closed: bool) -> KlineDict:
+        return KlineDict(
+            s=symbol,
+            t=self.start,
+            o=self.open,
+            h=self.high,
+            l=self.low,
+            c=self.close,
+            v=self.volume,
+            i=timeframe.value,
+            T=self.end - 1,
+            x=closed,
+        )
+
+
+class TradeKlineBuilder:
+    """
+    Собирает OHLCV свечи (KlineDict) из унифицированного потока сделок (AggTradeDict).
+
+    Нужен для бирж, у которых нет kline вебсокета (Gate, BingX, XT, KCEX, Hyperliquid).
+    Обработка одной сделки - O(1). Объем свечи считается в валюте котировки (price * size).
+    Свеча закрывается, когда приходит сделка следующего периода, либо при вызове expire().
+    Периоды без сделок свечей не образуют. Сделки уже закрытого периода отбрасываются.
+    """
+
+    def __init__(self, timeframe: Timeframe, emit_updates: bool = True) -> None:
+        """
+        :param timeframe: Таймфрейм собираемых свечей.
+        :param emit_updates: Если False, update() возвращает только закрытые свечи.
+        """
+        if timeframe == Timeframe.MONTH_1:
+            raise TimeframeException("Monthly candles can not be aligned with Timeframe.to_seconds")
+        self._timeframe: Timeframe = timeframe
+        self._size_ms: int = timeframe.to_seconds * 1000
+        self._emit_updates: bool = emit_updates
+        self._candles: Dict[str, _Candle] = {}
+        self._closed_until: Dict[str, int] = {}  # Конец последнего закрытого через expire() периода по тикеру
+        self._last_trade_time: int = 0
+
+    @property
+    def last_trade_time(self) -> int:
+        """Время самой свежей обработанной сделки (мс)."""
+        return self._last_trade_time
+
+    def update(self, trade: AggTradeDict) -> List[KlineDict]:
+        """
+        Обрабатывает сделку.
+
+        :param trade: Унифицированная сделка.
+        :return: Закрытая предыдущая свеча (если сделка открыла новый период) и, если emit_updates=True,
+            текущее состояние свечи.
+        """
+        symbol: str = trade["s"]
+        t: int = trade["t"]
+        price: float = trade["p"]
+        result: List[KlineDict] = []
+
+        if t > self._last_trade_time:
+            self._last_trade_time = t
+
+        candle: Optional[_Candle] = self._candles.get(symbol)
+        if candle is None and t < self._closed_until.get(symbol, 0):
+            return result  # Запоздавшая сделка периода, уже закрытого через expire()
+        if candle is None or t >= candle.end:
+            if candle is not None:
+                result.append(candle.to_kline(symbol, self._timeframe, closed=True))
+            start: int = _bucket_start(t, self._timeframe)
+            candle = _Candle(start=start, end=start + self._size_ms, price=price)
+            self._candles[symbol] = candle
+        elif t < candle.start:
+            return result  # Запоздавшая сделка уже закрытого периода
+
+        if price > candle.high:
+            candle.high = price
+        elif price < candle.low:
+            candle.low = price
+        candle.close = price
+        candle.volume += price * trade["v"]
+
+        if self._emit_updates:
+            result.append(candle.to_kline(symbol, self._timeframe, closed=False))
+        return result
+
+    def expire(self, now: Optional[int] = None) -> List[KlineDict]:
+        """
+        Закрывает свечи, период которых уже закончился, даже если новых сделок по тикеру не было.
+
+        :param now: Текущее время в мс. По умолчанию - время самой свежей сделки по всем тикерам,
+            чтобы не зависеть от расхождения локальных часов и часов биржи.
+        :return: Список закрытых свечей.
+        """
+        now = self._last_trade_time if now is None else now
+        result: List[KlineDict] = []
+        for symbol, candle in list(self._candles.items()):
+            if candle.end <= now:
+                result.append(candle.to_kline(symbol, self._timeframe, closed=True))
+                self._closed_until[symbol] = candle.end
+                del self._candles[symbol]
+        return result
+
+
+def trade_klines_socket(
+        exchange: Exchange,
+        market_type: MarketType,
+        tickers: List[str] | Tuple[str, ...],
+        timeframe: Timeframe,
+        callback: Callable[[List[KlineDict]], Awaitable],
+        emit_updates: bool = True,
+        fix: Optional[Callable[[Any], Any]] = None,
+        expire_interval: int = 1000,
+        **kwargs
+) -> AbstractWebsocket:
+    """
+    Возвращает вебсокет, который подписывается на сделки и отдает в callback уже готовые свечи.
+
+    В отличие от klines_socket, callback получает не сырое сообщение, а List[KlineDict].
+    Работает для любой биржи, у которой реализован aggtrades_socket.
+
+    :param exchange: Биржа.
+    :param market_type: Тип рынка.
+    :param tickers: Список тикеров.
+    :param timeframe: Таймфрейм собираемых свечей.
+    :param callback: Асинхронная функция, которая получает список обновленных свечей.
+    :param emit_updates: Если False, в callback попадают только закрытые свечи.
+    :param fix: Функция из pycryptoapi.fixes, которую нужно применить к сырому сообщению
+        (например, перевод контрактов в монеты).
+    :param expire_interval: Как часто (мс по времени сделок) закрывать свечи тикеров без новых сделок.
+    :param kwargs: Дополнительные аргументы для вебсокета.
+    """
+    adapter = ADAPTERS_MAPPER[exchange]
+    builder = TradeKlineBuilder(timeframe=timeframe, emit_updates=emit_updates)
+    last_expire: List[int] = [0]
+
+    async def _callback(raw_msg: Any) -> None:
+        if fix:
+            raw_msg = fix(raw_msg)
+        try:
+            trades: List[AggTradeDict] = adapter.aggtrades_message(raw_msg)
+        except AdapterException:
+            return  # Служебные сообщения (подписка, pong и т.д.)
+
+        klines: List[KlineDict] = []
+        for trade in trades:
+            klines.extend(builder.update(trade))
+
+        if builder.last_trade_time - last_expire[0] >= expire_interval:
+            last_expire[0] = builder.last_trade_time
+            klines.extend(builder.expire())
+
+        if klines:
+            await callback(klines)
+
+    return SOCKETS_MAPPER[exchange].aggtrades_socket(
+        market_type=market_type,
+        tickers=tickers,
+        callback=_callback,
+        **kwargs
+    )
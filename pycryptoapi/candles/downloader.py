@@ -0,0 +1,256 @@
+__all__ = ["KlineDownloader", ]
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import loguru
+import orjson
+from loguru._logger import Logger  # noqa
+
+from ..abstract import AbstractClient
+from ..enums import Exchange, MarketType, Timeframe
+from ..exceptions import TimeframeException
+from ..mappers import ADAPTERS_MAPPER
+from ..types import BulkResult, KlineDict
+from .resampler import _bucket_start
+
+# Параметры пагинации: биржа -> (параметр начала, параметр конца, макс. limit на споте, макс. limit на фьючерсах)
+_PAGINATION: Dict[Exchange, Tuple[str, str, int, int]] = {
+    Exchange.BINANCE: ("start_time", "end_time", 1000, 1500),
+    Exchange.BYBIT: ("start", "end", 1000, 1000),
+    Exchange.BINGX: ("start_time", "end_time", 1000, 1000),
+}
+
+
+class _SymbolState:
+    """Состояние загрузки одного тикера: упорядочивание страниц перед отдачей в sink."""
+
+    __slots__ = ("next_page", "pages", "last_t", "emitted", "failed", "lock", "progress")
+
+    def __init__(self, last_t: int) -> None:
+        self.next_page: int = 0  # Номер следующей страницы, которую нужно отдать в sink
+        self.pages: Dict[int, List[KlineDict]] = {}  # Загруженные страницы, опередившие next_page
+        self.last_t: int = last_t  # Время открытия последней отданной свечи
+        self.emitted: int = 0
+        self.failed: bool = False
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.progress: asyncio.Condition = asyncio.Condition()  # Сдвиг next_page или остановка тикера
+
+
+class KlineDownloader:
+    """
+    Параллельная постраничная загрузка истории свечей.
+
+    Диапазон времени делится на окна размером в одну страницу (limit свечей), окна всех тикеров
+    загружаются параллельно через клиент биржи (лимиты соблюдаются планировщиком клиента).
+    Страницы каждого тикера отдаются в sink строго по порядку времени, без дублей на стыках окон.
+    В памяти хранятся только страницы, загруженные раньше предыдущих, и только до отдачи в sink:
+    по каждому тикеру загрузка опережает next_page не больше чем на max_pages_ahead страниц.
+
+    Если указан checkpoint_path, в файл раз в checkpoint_interval секунд и в конце загрузки сохраняется
+    время последней отданной свечи по ключу "биржа:рынок:таймфрейм:тикер", и повторный запуск продолжает
+    загрузку с этого места (после падения - с последнего сохранения, повторно отданные страницы возможны).
+
+    Пример:
+        async def sink(symbol: str, klines: List[KlineDict]) -> None:
+            ...
+
+        client = await BinanceClient.create()
+        downloader = KlineDownloader(client, Exchange.BINANCE, MarketType.FUTURES, Timeframe.MIN_1,
+                                     checkpoint_path="klines.checkpoint.json")
+        result = await downloader.download(["BTCUSDT", "ETHUSDT"], start=1704067200000, end=1735689600000, sink=sink)
+    """
+
+    def __init__(
+            self,
+            client: AbstractClient,
+            exchange: Exchange,
+            market_type: MarketType,
+            timeframe: Timeframe,
+            max_concurrency: int = 10,
+            retries: int = 3,
+            retry_delay: int | float = 1,
+            limit: Optional[int] = None,
+            max_pages_ahead: int = 20,
+            checkpoint_path: Optional[str] = None,
+            checkpoint_interval: float = 5,
+            logger: logging.Logger | Logger = loguru.logger,
+    ) -> None:
+        """
+        :param client: Клиент биржи.
+        :param exchange: Биржа (определяет параметры пагинации и адаптер).
+        :param market_type: Тип рынка.
+        :param timeframe: Таймфрейм свечей.
+        :param max_concurrency: Максимальное количество одновременных запросов. Если у клиента задан concurrency_limiter,
+            используется его адаптивный лимит (см. BaseClient.bulk_concurrency).
+        :param retries: Количество попыток загрузки одной страницы.
+        :param retry_delay: Задержка между попытками (сек).
+        :param limit: Размер страницы. По умолчанию максимальный для биржи.
+        :param max_pages_ahead: Сколько страниц тикера можно загрузить впереди еще не отданной в sink.
+        :param checkpoint_path: Путь к JSON файлу с прогрессом загрузки.
+        :param checkpoint_interval: Как часто сохранять прогресс в файл (сек). В конце загрузки он сохраняется всегда.
+        :param logger: Логгер.
+        """
+        if exchange not in _PAGINATION:
+            raise NotImplementedError(f"Paginated klines are not supported for {exchange}")
+        if timeframe == Timeframe.MONTH_1:
+            raise TimeframeException("Monthly candles can not be aligned with Timeframe.to_seconds")
+
+        start_param, end_param, spot_limit, futures_limit = _PAGINATION[exchange]
+        max_limit: int = spot_limit if market_type == MarketType.SPOT else futures_limit
+
+        self._client: AbstractClient = client
+        self._exchange: Exchange = exchange
+        self._adapter = ADAPTERS_MAPPER[exchange]
+        self._market_type: MarketType = market_type
+        self._timeframe: Timeframe = timeframe
+        self._size_ms: int = timeframe.to_seconds * 1000
+        self._start_param: str = start_param
+        self._end_param: str = end_param
+        self._limit: int = min(limit or max_limit, max_limit)
+        self._max_pages_ahead: int = max(max_pages_ahead, 1)
+        self._max_concurrency: int = client.bulk_concurrency(max_concurrency)
+        self._retries: int = max(retries, 1)
+        self._retry_delay: int | float = retry_delay
+        self._checkpoint_path: Optional[str] = checkpoint_path
+        self._checkpoint_interval: float = checkpoint_interval
+        self._logger: logging.Logger | Logger = logger
+
+    def _checkpoint_key(self, symbol: str) -> str:
+        return f"{self._exchange.value}:{self._market_type.value}:{self._timeframe.value}:{symbol}"
+
+    def _load_checkpoint(self) -> Dict[str, int]:
+        if not self._checkpoint_path or not os.path.exists(self._checkpoint_path):
+            return {}
+        with open(self._checkpoint_path, "rb") as f:
+            return orjson.loads(f.read())
+
+    def _save_checkpoint(self, checkpoint: Dict[str, int]) -> None:
+        if not self._checkpoint_path:
+            return
+        tmp_path: str = self._checkpoint_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(checkpoint))
+        os.replace(tmp_path, self._checkpoint_path)  # Атомарная запись: файл не повредится при падении
+
+    async def _fetch_page(self, symbol: str, start: int, end: int) -> List[KlineDict]:
+        kwargs: Dict[str, Any] = {
+            "symbol": symbol,
+            "interval": self._timeframe,
+            "limit": self._limit,
+            self._start_param: start,
+            self._end_param: end - 1,
+        }
+        klines: List[KlineDict]
+        if self._market_type == MarketType.SPOT:
+            klines = self._adapter.kline(await self._client.klines(**kwargs))
+        else:
+            klines = self._adapter.futures_kline(await self._client.futures_klines(**kwargs))
+        klines.sort(key=lambda k: k["t"])  # Bybit отдает свечи от новых к старым
+        for kline in klines:
+            kline["s"] = symbol
+            kline["i"] = self._timeframe.value
+            kline["T"] = kline["t"] + self._size_ms - 1
+            kline["x"] = True
+        return klines
+
+    async def download(
+            self,
+            symbols: List[str],
+            start: int,
+            end: int,
+            sink: Callable[[str, List[KlineDict]], Awaitable],
+    ) -> BulkResult:
+        """
+        Загружает свечи по тикерам за период [start, end) и отдает их в sink страницами.
+
+        :param symbols: Список тикеров.
+        :param start: Начало периода (мс).
+        :param end: Конец периода (мс, не включительно).
+        :param sink: Асинхронная функция (symbol, klines), которая получает страницы свечей по порядку.
+        :return: BulkResult, где data - количество отданных свечей по тикеру, errors - ошибки по тикерам.
+        """
+        start = _bucket_start(start, self._timeframe)
+        page_ms: int = self._limit * self._size_ms
+        checkpoint: Dict[str, int] = self._load_checkpoint()
+        saved_at: List[float] = [time.monotonic()]  # Время последнего сохранения прогресса
+
+        states: Dict[str, _SymbolState] = {}
+        jobs: asyncio.Queue[Tuple[str, int, int, int]] = asyncio.Queue()
+        for symbol in dict.fromkeys(symbols):
+            last_t: int = checkpoint.get(self._checkpoint_key(symbol), start - self._size_ms)
+            states[symbol] = _SymbolState(last_t)
+            for page, page_start in enumerate(range(max(start, last_t + self._size_ms), end, page_ms)):
+                jobs.put_nowait((symbol, page, page_start, min(page_start + page_ms, end)))
+
+        result: BulkResult = BulkResult(data={}, errors={})
+
+        async def _emit(symbol: str, state: _SymbolState) -> None:
+            # Отдаем в sink все страницы, которые идут подряд начиная с next_page
+            async with state.lock:
+                while state.next_page in state.pages:
+                    klines: List[KlineDict] = [
+                        k for k in state.pages.pop(state.next_page) if state.last_t < k["t"] < end]
+                    state.next_page += 1
+                    async with state.progress:
+                        state.progress.notify_all()
+                    if not klines:
+                        continue
+                    await sink(symbol, klines)
+                    state.last_t = klines[-1]["t"]
+                    state.emitted += len(klines)
+                    checkpoint[self._checkpoint_key(symbol)] = state.last_t
+                    # Файл перезаписывается целиком, поэтому не после каждой страницы
+                    if time.monotonic() - saved_at[0] >= self._checkpoint_interval:
+                        self._save_checkpoint(checkpoint)
+                        saved_at[0] = time.monotonic()
+
+        async def _worker() -> None:
+            while not jobs.empty():
+                symbol, page, page_start, page_end = jobs.get_nowait()
+                state: _SymbolState = states[symbol]
+                # Страница next_page всегда загружается воркером, который взял ее раньше, поэтому ожидание
+                # не блокирует все воркеры
+                async with state.progress:
+                    await state.progress.wait_for(
+                        lambda: state.failed or page - state.next_page < self._max_pages_ahead)
+                if state.failed:
+                    continue
+                for attempt in range(1, self._retries + 1):
+                    try:
+                        # Повторы страницы делаются здесь, запрос клиента идет одной попыткой
+                        with self._client.single_attempt():
+                            klines: List[KlineDict] = await self._fetch_page(symbol, page_start, page_end)
+                        if not state.failed:  # Тикер мог остановиться, пока загружалась страница
+                            state.pages[page] = klines
+                        break
+                    except Exception as e:
+                        self._logger.debug(f"{self} {symbol} page {page} attempt {attempt}/{self._retries} "
+                                           f"failed: {type(e)} -> {e}")
+                        if attempt < self._retries:
+                            await asyncio.sleep(self._retry_delay)
+                        else:
+                            # Дальше пропуска отдавать нельзя: тикер останавливается на последней целой странице
+                            state.failed = True
+                            state.pages.clear()
+                            async with state.progress:
+                                state.progress.notify_all()
+                            result["errors"][symbol] = f"{type(e).__name__}: {e}"
+                            self._logger.error(f"{self} Can not download {symbol} page {page}: {e}")
+                if not state.failed:
+                    await _emit(symbol, state)
+
+        try:
+            await asyncio.gather(*(_worker() for _ in range(self._max_concurrency)))
+        finally:
+            self._save_checkpoint(checkpoint)
+
+        for symbol, state in states.items():
+            result["data"][symbol] = state.emitted
+        return result
+
+    def __repr__(self) -> str:
+        return f"<KlineDownloader {type(self._client).__name__} {self._market_type.value} {self._timeframe.value}>"
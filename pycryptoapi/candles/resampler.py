@@ -0,0 +1,179 @@
+__all__ = ["KlineResampler", ]
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..enums import Timeframe
+from ..exceptions import TimeframeException
+from ..types import KlineDict
+
+# 1970-01-01 - четверг, а недельные свечи на биржах открываются в понедельник (1970-01-05).
+_WEEK_OFFSET_MS: int = 4 * 86400 * 1000
+
+
+def _bucket_start(open_time: int, timeframe: Timeframe) -> int:
+    """Возвращает время открытия свечи таймфрейма timeframe, в которую попадает open_time (мс)."""
+    size: int = timeframe.to_seconds * 1000
+    if timeframe == Timeframe.WEEK_1:
+        return (open_time - _WEEK_OFFSET_MS) // size * size + _WEEK_OFFSET_MS
+    return open_time // size * size
+
+
+class _Bucket:
+    """Агрегат одной старшей свечи, собранный из базовых свечей."""
+
+    __slots__ = ("start", "end", "open_time", "open", "high", "low", "close_time", "close", "volume", "parts",
+                 "closed")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start: int = start
+        self.end: int = end
+        self.open_time: int = end
+        self.open: float = 0.0
+        self.high: float = float("-inf")
+        self.low: float = float("inf")
+        self.close_time: int = -1
+        self.close: float = 0.0
+        self.volume: float = 0.0
+        self.parts: Dict[int, Tuple[float, float, float, float, float]] = {}  # t -> (o, h, l, c, v)
+        self.closed: bool = False
+
+    def apply(self, t: int, o: float, h: float, l: float, c: float, v: float) -> None:  # noqa: E741
+        """Применяет новую или повторную (in-progress) версию базовой свечи. O(1) в обычном случае."""
+        prev = self.parts.get(t)
+        self.parts[t] = (o, h, l, c, v)
+
+        if prev is None:
+            self.volume += v
+            self.high = max(self.high, h)
+            self.low = min(self.low, l)
+        else:
+            self.volume += v - prev[4]
+            # Пересчитываем экстремумы только если базовая свеча "откатила" свой high/low
+            if (h < prev[1] == self.high) or (l > prev[2] == self.low):
+                self.high = max(part[1] for part in self.parts.values())
+                self.low = min(part[2] for part in self.parts.values())
+            else:
+                self.high = max(self.high, h)
+                self.low = min(self.low, l)
+
+        if t <= self.open_time:
+            self.open_time, self.open = t, o
+        if t >= self.close_time:
+            self.close_time, self.close = t, c
+
+    def to_kline(self, symbol: str, timeframe: Timeframe) -> KlineDict:
+        return KlineDict(
+            s=symbol,
+            t=self.start,
+            o=self.open,
+            h=self.high,
+            l=self.low,
+            c=self.close,
+            v=self.volume,
+            i=timeframe.value,
+            T=self.end - 1,
+            x=self.closed,
+        )
+
+
+class KlineResampler:
+    """
+    Собирает свечи старших таймфреймов из одного потока свечей базового таймфрейма.
+
+    Позволяет подписаться на klines_socket один раз (например, на 1m) и получать 5m, 15m, 1h, 4h
+    без дополнительных подключений. Повторные обновления незакрытой базовой свечи и сообщения,
+    пришедшие не по порядку, корректно учитываются. Базовые свечи, относящиеся к уже закрытой
+    старшей свече, отбрасываются.
+
+    Пример:
+        resampler = KlineResampler(Timeframe.MIN_1, [Timeframe.MIN_5, Timeframe.HOUR_1])
+        for kline in BinanceAdapter.kline_message(raw_msg):
+            for higher in resampler.update(kline):
+                ...
+    """
+
+    def __init__(self, base: Timeframe, targets: Iterable[Timeframe]) -> None:
+        """
+        :param base: Таймфрейм входящего потока свечей.
+        :param targets: Таймфреймы, которые нужно поддерживать. Должны быть кратны базовому.
+        """
+        self._base: Timeframe = base
+        self._base_ms: int = base.to_seconds * 1000
+        self._targets: List[Timeframe] = []
+
+        for target in targets:
+            if target == Timeframe.MONTH_1:
+                raise TimeframeException("Monthly candles can not be aligned with Timeframe.to_seconds")
+            if target.to_seconds <= base.to_seconds or target.to_seconds % base.to_seconds:
+                raise TimeframeException(f"Timeframe {target} is not a multiple of base timeframe {base}")
+            self._targets.append(target)
+
+        # (symbol, timeframe) -> текущая старшая свеча
+        self._buckets: Dict[Tuple[str, Timeframe], _Bucket] = {}
+
+    @property
+    def targets(self) -> List[Timeframe]:
+        return list(self._targets)
+
+    def update(self, kline: KlineDict) -> List[KlineDict]:
+        """
+        Обрабатывает базовую свечу и возвращает обновления старших свечей.
+
+        В результат попадают: закрытые свечи (x=True), если базовая свеча открыла новый период или
+        закрыла последний интервал старшей свечи, и текущее состояние незакрытых свечей (x=False).
+
+        :param kline: Унифицированная свеча базового таймфрейма.
+        :return: Список обновленных свечей старших таймфреймов.
+        """
+        symbol: str = kline["s"]
+        t: int = kline["t"]
+        base_closed: bool = bool(kline.get("x"))
+        result: List[KlineDict] = []
+
+        for target in self._targets:
+            key = (symbol, target)
+            start: int = _bucket_start(t, target)
+            bucket: Optional[_Bucket] = self._buckets.get(key)
+
+            if bucket is not None and start < bucket.start:
+                continue  # Запоздавшая свеча уже закрытого периода
+            if bucket is not None and start == bucket.start and bucket.closed:
+                continue  # Период уже отдан как закрытый
+
+            if bucket is None or start > bucket.start:
+                if bucket is not None and not bucket.closed:
+                    bucket.closed = True
+                    result.append(bucket.to_kline(symbol, target))
+                bucket = _Bucket(start=start, end=start + target.to_seconds * 1000)
+                self._buckets[key] = bucket
+
+            bucket.apply(t, kline["o"], kline["h"], kline["l"], kline["c"], kline["v"])
+
+            # Последняя базовая свеча периода закрыта - старшая свеча тоже закрыта
+            if base_closed and t + self._base_ms >= bucket.end:
+                bucket.closed = True
+                bucket.parts.clear()
+
+            result.append(bucket.to_kline(symbol, target))
+
+        return result
+
+    def flush(self, symbol: Optional[str] = None) -> List[KlineDict]:
+        """
+        Принудительно закрывает текущие старшие свечи (например, при остановке потока).
+
+        :param symbol: Если указан, закрываются только свечи этого тикера.
+        :return: Список закрытых свечей.
+        """
+        result: List[KlineDict] = []
+        for (s, target), bucket in self._buckets.items():
+            if (symbol is None or s == symbol) and not bucket.closed:
+                bucket.closed = True
+                bucket.parts.clear()
+                result.append(bucket.to_kline(s, target))
+        return result
+
+    def current(self, symbol: str, timeframe: Timeframe) -> Optional[KlineDict]:
+        """Возвращает текущее состояние старшей свечи или None, если данных еще нет."""
+        bucket = self._buckets.get((symbol, timeframe))
+        return bucket.to_kline(symbol, timeframe) if bucket else None
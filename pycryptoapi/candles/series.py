@@ -0,0 +1,246 @@
+__all__ = ["KlineSeries", ]
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import loguru
+from loguru._logger import Logger  # noqa
+
+from ..abstract import AbstractClient, AbstractWebsocket
+from ..enums import Exchange, MarketType, Timeframe
+from ..exceptions import AdapterException, PyCryptoAPIException
+from ..mappers import ADAPTERS_MAPPER, SOCKETS_MAPPER
+from ..types import KlineDict
+
+
+class _SymbolSeries:
+    """Непрерывный ряд свечей одного тикера."""
+
+    __slots__ = ("candles", "buffer", "ready", "live")
+
+    def __init__(self, maxlen: int) -> None:
+        self.candles: Deque[KlineDict] = deque(maxlen=maxlen)
+        self.buffer: List[KlineDict] = []  # Свечи с вебсокета, пришедшие до окончания загрузки истории
+        self.ready: bool = False
+        self.live: asyncio.Event = asyncio.Event()  # Устанавливается первой свечой тикера с вебсокета
+
+    def merge(self, kline: KlineDict) -> bool:
+        """
+        Добавляет свечу в конец ряда или заменяет последнюю свечу с тем же временем открытия.
+
+        :return: False, если свеча старше последней свечи ряда и была отброшена.
+        """
+        if self.candles:
+            last_t: int = self.candles[-1]["t"]
+            if kline["t"] == last_t:
+                self.candles[-1] = kline
+                return True
+            if kline["t"] < last_t:
+                return False
+        self.candles.append(kline)
+        return True
+
+
+class KlineSeries:
+    """
+    Непрерывный ряд свечей по каждому тикеру: история с REST API + живые обновления с вебсокета.
+
+    Порядок работы:
+        1. Запускается klines_socket, сообщения по каждому тикеру буферизуются.
+        2. По каждому тикеру ожидается первая свеча с вебсокета (не дольше live_timeout), чтобы история
+           и буфер перекрывались.
+        3. История загружается через klines / futures_klines с ограничением параллельных запросов.
+           Если между последней свечой истории и первой свечой буфера есть пропуск, история загружается заново.
+        4. Буфер склеивается с историей по времени открытия свечи (без дублей и пропусков на границе).
+        5. Тикер переключается на живую доставку.
+
+    Если историю тикера не удалось загрузить за max_retries попыток, start() останавливает вебсокет
+    и пробрасывает ошибку.
+
+    Первый вызов callback по тикеру получает весь склеенный ряд, последующие - по одной свече
+    из каждого сообщения вебсокета. Текущий ряд можно получить через series().
+
+    Пример:
+        client = await BinanceClient.create()
+        series = KlineSeries(Exchange.BINANCE, MarketType.FUTURES, ["BTCUSDT"], Timeframe.MIN_1,
+                             callback=callback, client=client, history=500)
+        await series.start()
+    """
+
+    def __init__(
+            self,
+            exchange: Exchange,
+            market_type: MarketType,
+            tickers: List[str] | Tuple[str, ...],
+            timeframe: Timeframe,
+            callback: Callable[[List[KlineDict]], Awaitable],
+            client: AbstractClient,
+            history: int = 500,
+            max_concurrency: int = 10,
+            max_retries: int = 3,
+            retry_delay: int | float = 1,
+            live_timeout: int | float = 30,
+            fix: Optional[Callable[[Any], Any]] = None,
+            logger: logging.Logger | Logger = loguru.logger,
+            **kwargs
+    ) -> None:
+        """
+        :param exchange: Биржа.
+        :param market_type: Тип рынка.
+        :param tickers: Список тикеров.
+        :param timeframe: Таймфрейм свечей.
+        :param callback: Асинхронная функция, которая получает список свечей одного тикера.
+        :param client: Клиент биржи для загрузки истории.
+        :param history: Сколько свечей загружать и хранить по каждому тикеру.
+        :param max_concurrency: Максимальное количество одновременных запросов истории. Если у клиента задан
+            concurrency_limiter, используется его адаптивный лимит (см. BaseClient.bulk_concurrency).
+        :param max_retries: Количество попыток загрузки истории по одному тикеру.
+        :param retry_delay: Задержка между попытками (сек).
+        :param live_timeout: Сколько ждать первую свечу тикера с вебсокета перед загрузкой истории (сек).
+        :param fix: Функция из pycryptoapi.fixes, которую нужно применить к сырому сообщению вебсокета.
+        :param logger: Логгер.
+        :param kwargs: Дополнительные аргументы для вебсокета.
+        """
+        self._exchange: Exchange = exchange
+        self._market_type: MarketType = market_type
+        self._tickers: List[str] = list(tickers)
+        self._timeframe: Timeframe = timeframe
+        self._callback: Callable[[List[KlineDict]], Awaitable] = callback
+        self._client: AbstractClient = client
+        self._adapter = ADAPTERS_MAPPER[exchange]
+        self._history: int = history
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(client.bulk_concurrency(max_concurrency))
+        self._max_retries: int = max(max_retries, 1)
+        self._retry_delay: int | float = retry_delay
+        self._live_timeout: int | float = live_timeout
+        self._fix: Optional[Callable[[Any], Any]] = fix
+        self._logger: logging.Logger | Logger = logger
+
+        self._size_ms: int = timeframe.to_seconds * 1000
+        self._series: Dict[str, _SymbolSeries] = {ticker: _SymbolSeries(history) for ticker in self._tickers}
+
+        self._socket: AbstractWebsocket = SOCKETS_MAPPER[exchange].klines_socket(
+            market_type=market_type,
+            tickers=self._tickers,
+            timeframe=timeframe,
+            callback=self._on_message,
+            logger=logger,
+            **kwargs
+        )
+        self._socket_task: Optional[asyncio.Task] = None
+
+    def series(self, symbol: str) -> List[KlineDict]:
+        """Возвращает текущий ряд свечей тикера (от старых к новым)."""
+        return list(self._series[symbol].candles)
+
+    def is_ready(self, symbol: str) -> bool:
+        """Возвращает True, если история по тикеру загружена и он переключен на живую доставку."""
+        return self._series[symbol].ready
+
+    async def start(self) -> None:
+        """Запускает вебсокет, загружает историю и работает до вызова stop()."""
+        self._socket_task = asyncio.create_task(self._socket.start())
+        try:
+            await asyncio.gather(*(self._backfill(ticker) for ticker in self._tickers))
+        except Exception:
+            await self.stop()
+            raise
+        await self._socket_task
+
+    async def stop(self) -> None:
+        """Останавливает вебсокет."""
+        await self._socket.stop()
+        if self._socket_task:
+            self._socket_task.cancel()
+
+    async def _on_message(self, raw_msg: Any) -> None:
+        if self._fix:
+            raw_msg = self._fix(raw_msg)
+        try:
+            klines: List[KlineDict] = self._adapter.kline_message(raw_msg)
+        except AdapterException:
+            return  # Служебные сообщения (подписка, pong и т.д.)
+
+        for kline in klines:
+            series: Optional[_SymbolSeries] = self._series.get(kline["s"])
+            if series is None:
+                continue
+            kline["i"] = self._timeframe.value  # Bybit отдает таймфрейм в минутах
+            series.live.set()
+            if not series.ready:
+                series.buffer.append(kline)
+            elif series.merge(kline):
+                await self._callback([kline])
+
+    async def _fetch_history(self, symbol: str) -> List[KlineDict]:
+        klines: List[KlineDict]
+        if self._market_type == MarketType.SPOT:
+            raw_data = await self._client.klines(symbol=symbol, interval=self._timeframe, limit=self._history)
+            klines = self._adapter.kline(raw_data)
+        else:
+            raw_data = await self._client.futures_klines(symbol=symbol, interval=self._timeframe, limit=self._history)
+            klines = self._adapter.futures_kline(raw_data)
+
+        # Некоторые биржи (Bybit) отдают свечи от новых к старым и не заполняют тикер и таймфрейм
+        klines.sort(key=lambda k: k["t"])
+        for kline in klines:
+            kline["s"] = symbol
+            kline["i"] = self._timeframe.value
+            kline["T"] = kline["t"] + self._size_ms - 1
+            kline["x"] = True
+        if klines:
+            klines[-1]["x"] = False  # Последняя свеча истории - текущая, еще не закрытая
+        return klines
+
+    async def _backfill(self, symbol: str) -> None:
+        series: _SymbolSeries = self._series[symbol]
+
+        # История загружается после первой свечи с вебсокета: иначе свечи между ответом REST API
+        # и подпиской не попадут ни в историю, ни в буфер
+        try:
+            await asyncio.wait_for(series.live.wait(), timeout=self._live_timeout)
+        except asyncio.TimeoutError:
+            self._logger.warning(f"{self} No {symbol} klines from websocket in {self._live_timeout}s, "
+                                 f"fetching history anyway")
+
+        klines: List[KlineDict] = []
+        async with self._semaphore:
+            for attempt in range(1, self._max_retries + 1):
+                try:
+                    klines = await self._fetch_history(symbol)
+                except Exception as e:
+                    self._logger.error(f"{self} Error while fetching {symbol} history "
+                                       f"(attempt {attempt}/{self._max_retries}): {type(e)}: {e}")
+                    if attempt == self._max_retries:
+                        raise
+                    await asyncio.sleep(self._retry_delay)
+                    continue
+                # Между await выше и этой проверкой переключения не происходит, поэтому сообщения,
+                # пришедшие во время загрузки, уже лежат в буфере
+                if not self._has_gap(klines, series.buffer):
+                    break
+                self._logger.warning(f"{self} Gap between {symbol} history and websocket buffer "
+                                     f"(attempt {attempt}/{self._max_retries})")
+                if attempt == self._max_retries:
+                    raise PyCryptoAPIException(f"Can not close gap between {symbol} history and websocket klines")
+
+        for kline in klines:
+            series.merge(kline)
+        for kline in sorted(series.buffer, key=lambda k: k["t"]):
+            series.merge(kline)
+        series.buffer.clear()
+        series.ready = True
+
+        if series.candles:
+            await self._callback(list(series.candles))
+
+    def _has_gap(self, klines: List[KlineDict], buffer: List[KlineDict]) -> bool:
+        """Проверяет, есть ли пропущенные свечи между концом истории и началом буфера вебсокета."""
+        if not klines or not buffer:
+            return False
+        return min(kline["t"] for kline in buffer) > klines[-1]["t"] + self._size_ms
+
+    def __repr__(self) -> str:
+        return f"<KlineSeries {self._exchange.value} {self._market_type.value} {self._timeframe.value}>"
@@ -1,3 +1,4 @@
-__all__ = ["CoinalyzeClient", ]
+__all__ = ["CoinalyzeClient", "CoinalyzeHistoryCache", ]
 
 from .client import CoinalyzeClient
+from .history import CoinalyzeHistoryCache
@@ -1,7 +1,9 @@
-import itertools
+__all__ = ["CoinalyzeClient", ]
+
+import asyncio
 import logging
 import time
-from typing import Dict, Any, Literal, Optional, Self, Union
+from typing import Dict, Any, Literal, Optional, Self, Tuple, Union
 from typing import List
 
 import aiohttp
@@ -9,6 +11,7 @@ import loguru
 from loguru._logger import Logger  # noqa
 
 from ..abstract import BaseClient
+from ..http import ApiKeyPool, RetryPolicy
 
 
 class CoinalyzeClient(BaseClient):
@@ -16,18 +19,51 @@ class CoinalyzeClient(BaseClient):
 
     _BASE_URL: str = "https://api.coinalyze.net/v1"
 
+    # Лимит запросов одного API ключа: (запросов, период в секундах)
+    _KEY_RATE_LIMIT: Tuple[int, float] = (40, 60)
+
+    # Максимальное количество тикеров в одном запросе
+    _MAX_SYMBOLS: int = 20
+
+    # Длительность интервала (сек)
+    TIMEFRAME_SECONDS: Dict[str, int] = {
+        "1min": 60,
+        "5min": 60 * 5,
+        "15min": 60 * 15,
+        "30min": 60 * 30,
+        "1hour": 60 * 60,
+        "2hour": 60 * 60 * 2,
+        "4hour": 60 * 60 * 4,
+        "6hour": 60 * 60 * 6,
+        "12hour": 60 * 60 * 12,
+        "daily": 60 * 60 * 24,
+        "weekly": 60 * 60 * 24 * 7,
+    }
+
     def __init__(
             self,
-            session: aiohttp.ClientSession,
-            api_keys: Union[List[str], str],
+            session: Optional[aiohttp.ClientSession],
+            api_keys: Union[List[str], str, None] = None,
             max_retries: Optional[int] = 3,
             retry_delay: Optional[int | float] = 0.1,
             logger: logging.Logger | Logger = loguru.logger,
+            key_pool: Optional[ApiKeyPool] = None,
+            **kwargs
     ) -> None:
-        super().__init__(session=session, logger=logger, max_retries=max_retries, retry_delay=retry_delay)
-
-        # next(self._keys_generator) to use it
-        self._keys_generator = itertools.cycle(api_keys if isinstance(api_keys, list) else [api_keys])
+        """
+        :param api_keys: API ключ или список ключей.
+        :param key_pool: Пул ключей (переопределяет api_keys), можно разделить между клиентами.
+        :param kwargs: Остальные параметры BaseClient (proxies, rate_limiter, retry_policy и т.д.).
+        """
+        super().__init__(session=session, logger=logger, max_retries=max_retries, retry_delay=retry_delay, **kwargs)
+        if key_pool is None:
+            if not api_keys:
+                raise ValueError("api_keys or key_pool required")
+            key_pool = ApiKeyPool([api_keys] if isinstance(api_keys, str) else api_keys, *self._KEY_RATE_LIMIT)
+        self._key_pool: ApiKeyPool = key_pool
+        # Каждая попытка должна расходовать лимит своего ключа, поэтому HTTP запрос идет одной попыткой,
+        # а все повторы делает _keyed_request, получая ключ из пула заново
+        self._keyed_retry_policy: RetryPolicy = self._retry_policy.replace(max_attempts=1)
 
     @classmethod
     async def create(
@@ -40,21 +76,73 @@ class CoinalyzeClient(BaseClient):
     ) -> Self:
         """
         Создает инстанцию клиента.
-        Создать клиент можно и через __init__, но в таком случае session: aiohttp.ClientSession - обязательный параметр.
+        Если session не передана, используется общая для процесса сессия с настроенным пулом соединений.
         :return:
         """
-        api_keys: Union[List[str], str, None] = kwargs.get("api_keys")
-        if not api_keys:
+        api_keys: Union[List[str], str, None] = kwargs.pop("api_keys", None)
+        if not api_keys and kwargs.get("key_pool") is None:
             raise ValueError("api_key required paramets and it must be a string")
 
         return cls(
             api_keys=api_keys,
-            session=session or aiohttp.ClientSession(),
+            session=session,
             logger=logger,
             max_retries=max_retries,
-            retry_delay=retry_delay
+            retry_delay=retry_delay,
+            **kwargs
         )
 
+    @property
+    def key_pool(self) -> ApiKeyPool:
+        return self._key_pool
+
+    async def _keyed_request(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Выполняет запрос с ключом из пула, у которого есть свободный лимит. Каждая попытка берет ключ из пула.
+
+        Если ключ получил 429, он блокируется на Retry-After секунд, и запрос сразу повторяется с другим ключом
+        (не больше числа ключей раз). Прочие временные ошибки (5xx, таймауты) повторяются по retry_policy клиента.
+        """
+        policy: RetryPolicy = self._retry_policy
+        rate_limited: int = 0
+        failures: int = 0
+        while True:
+            api_key: str = await self._key_pool.acquire()
+            try:
+                return await self._make_request(
+                    "GET", self._BASE_URL + path, params, headers={"api_key": api_key},
+                    retry_policy=self._keyed_retry_policy)
+            except Exception as e:
+                if policy.status(e) == 429:
+                    rate_limited += 1
+                    retry_after: float = policy.retry_after(e) or self._KEY_RATE_LIMIT[1]
+                    self._key_pool.penalize(api_key, retry_after)
+                    self._logger.debug(f"Coinalyze key ...{api_key[-4:]} rate limited for {retry_after}s")
+                    if rate_limited >= len(self._key_pool):
+                        raise
+                    continue
+                failures += 1
+                if not policy.is_retryable(e) or failures >= policy.max_attempts:
+                    raise
+                delay: float = policy.delay(failures, policy.retry_after(e))
+            await asyncio.sleep(delay)
+
+    async def _history(self, path: str, tickers: Union[List[str], str], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Запрашивает историю по тикерам частями по _MAX_SYMBOLS тикеров.
+        Части запрашиваются параллельно (ключи распределяются пулом), результат - в порядке tickers.
+        """
+        symbols: List[str] = tickers.split(",") if isinstance(tickers, str) else list(tickers)
+        chunks: List[List[str]] = [
+            symbols[i:i + self._MAX_SYMBOLS] for i in range(0, len(symbols), self._MAX_SYMBOLS)]
+        responses: List[List[Dict[str, Any]]] = await asyncio.gather(
+            *(self._keyed_request(path, {"symbols": ",".join(chunk), **params}) for chunk in chunks))
+
+        order: Dict[str, int] = {symbol: i for i, symbol in enumerate(symbols)}
+        result: List[Dict[str, Any]] = [item for response in responses for item in response]
+        result.sort(key=lambda item: order.get(item.get("symbol"), len(order)))
+        return result
+
     async def open_interest(
             self,
             tickers: Union[List[str], str],
@@ -62,23 +150,25 @@ class CoinalyzeClient(BaseClient):
                 "1min", "5min", "15min", "30min",
                 "1hour", "2hour", "4hour", "6hour",
                 "12hour", "daily", "weekly"],
-            limit: int
+            limit: int,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """ Returns open interest history.
         Tickers example: ["BTCUSDT_PERP.{E}", "ETHUSDT_PERP.{E}"] or "BTCUSDT_PERP.{E},ETHUSDT_PERP.{3}"
+        Long ticker lists are split into requests of _MAX_SYMBOLS tickers.
+        start / end (unix seconds) override the window computed from limit.
          """
-        start, end = self._get_request_time(timeframe=timeframe, limit=limit)
-        return await self._make_request(
-            "GET",
-            self._BASE_URL + "/open-interest-history",
+        start, end = self._get_request_time(timeframe=timeframe, limit=limit, start=start, end=end)
+        return await self._history(
+            "/open-interest-history",
+            tickers,
             {
-                "symbols": tickers if isinstance(tickers, str) else ",".join(tickers),
                 "interval": timeframe,
                 "from": start,
                 "to": end,
                 "convert_to_usd": "false"
             },
-            headers={"api_key": next(self._keys_generator)},
         )
 
     async def liquidations(
@@ -89,46 +179,42 @@ class CoinalyzeClient(BaseClient):
                 "1hour", "2hour", "4hour", "6hour",
                 "12hour", "daily", "weekly"],
             limit: int,
-            convert_to_usd: bool = False
+            convert_to_usd: bool = False,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """ Returns liquidations history.
          Tickers example: ["BTCUSDT_PERP.{E}", "ETHUSDT_PERP.{E}"] or "BTCUSDT_PERP.{E},ETHUSDT_PERP.{3}"
+         Long ticker lists are split into requests of _MAX_SYMBOLS tickers.
+         start / end (unix seconds) override the window computed from limit.
          """
-        start, end = self._get_request_time(timeframe=timeframe, limit=limit)
-        return await self._make_request(
-            "GET",
-            self._BASE_URL + "/liquidation-history",
+        start, end = self._get_request_time(timeframe=timeframe, limit=limit, start=start, end=end)
+        return await self._history(
+            "/liquidation-history",
+            tickers,
             {
-                "symbols": tickers if isinstance(tickers, str) else ",".join(tickers),
                 "interval": timeframe,
                 "from": start,
                 "to": end,
                 "convert_to_usd": "true" if convert_to_usd else "false"
             },
-            headers={"api_key": next(self._keys_generator)},
         )
 
     async def exchanges(self) -> List[Dict[str, str]]:
         """Returns list of supported exhanges."""
-        return await self._make_request(
-            "GET",
-            self._BASE_URL + "/exchanges",
-            headers={"api_key": next(self._keys_generator)},
-        )
+        return await self._keyed_request("/exchanges")
 
-    def _get_request_time(self, timeframe: str, limit: int) -> tuple[int, int]:
-        """ Function defines start and end time. """
-        timeframe_to_seconds: int = {
-            "1min": 60,
-            "5min": 60 * 5,
-            "15min": 60 * 15,
-            "30min": 60 * 30,
-            "1hour": 60 * 60,
-            "2hour": 60 * 60 * 2,
-            "4hour": 60 * 60 * 4,
-            "6hour": 60 * 60 * 6,
-            "12hour": 60 * 60 * 12,
-            "daily": 60 * 60 * 24,
-            "weekly": 60 * 60 * 24 * 7,
-        }[timeframe]
-        return int(time.time() - timeframe_to_seconds * limit - 3), int(time.time() + 10)
+    def _get_request_time(
+            self,
+            timeframe: str,
+            limit: int,
+            start: Optional[int] = None,
+            end: Optional[int] = None,
+    ) -> tuple[int, int]:
+        """ Function defines start and end time. Explicit start / end take precedence. """
+        now: float = time.time()
+        if start is None:
+            start = int(now - self.TIMEFRAME_SECONDS[timeframe] * limit - 3)
+        if end is None:
+            end = int(now + 10)
+        return start, end
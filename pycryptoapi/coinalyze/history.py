@@ -0,0 +1,231 @@
+__all__ = ["CoinalyzeHistoryCache", ]
+
+import asyncio
+import logging
+import os
+import time
+from array import array
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import loguru
+import orjson
+from loguru._logger import Logger  # noqa
+
+from .client import CoinalyzeClient
+
+# Поля баров истории: тип истории -> поля (кроме времени "t")
+_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "open_interest": ("o", "h", "l", "c"),
+    "liquidations": ("l", "s"),
+}
+
+
+class _Series:
+    """История одного тикера в колоночном виде: время баров и значения полей в отдельных массивах."""
+
+    __slots__ = ("fields", "depth", "fetched", "t", "columns")
+
+    def __init__(self, fields: Tuple[str, ...], depth: int = 0, fetched: int = 0) -> None:
+        self.fields: Tuple[str, ...] = fields
+        self.depth: int = depth  # Глубина истории (баров), которая уже была загружена целиком
+        self.fetched: int = fetched  # Время последней загрузки (сек)
+        self.t: array = array("q")
+        self.columns: Dict[str, array] = {field: array("d") for field in fields}
+
+    @property
+    def since(self) -> int:
+        """Время, с которого нужно догружать историю: последний бар или, если баров нет, последняя загрузка."""
+        return self.t[-1] if self.t else self.fetched
+
+    def merge(self, bars: List[Dict[str, Any]]) -> None:
+        """Добавляет бары, заменяя закэшированные бары начиная с времени первого нового бара."""
+        if not bars:
+            return
+        bars = sorted(bars, key=lambda bar: bar["t"])
+        first_t: int = bars[0]["t"]
+        keep: int = len(self.t)
+        while keep and self.t[keep - 1] >= first_t:
+            keep -= 1
+        del self.t[keep:]
+        for column in self.columns.values():
+            del column[keep:]
+        for bar in bars:
+            self.t.append(int(bar["t"]))
+            for field, column in self.columns.items():
+                column.append(float(bar.get(field) or 0))
+
+    def trim(self, max_length: int) -> None:
+        """Оставляет последние max_length баров."""
+        excess: int = len(self.t) - max_length
+        if excess > 0:
+            del self.t[:excess]
+            for column in self.columns.values():
+                del column[:excess]
+
+    def to_list(self, limit: int) -> List[Dict[str, Any]]:
+        """Возвращает последние limit баров в формате ответа Coinalyze."""
+        start: int = max(len(self.t) - limit, 0)
+        return [
+            {"t": self.t[i], **{field: column[i] for field, column in self.columns.items()}}
+            for i in range(start, len(self.t))
+        ]
+
+    def dump(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "fetched": self.fetched,
+            "t": self.t.tolist(),
+            **{field: column.tolist() for field, column in self.columns.items()},
+        }
+
+    @classmethod
+    def load(cls, fields: Tuple[str, ...], data: Dict[str, Any]) -> "_Series":
+        series: _Series = cls(fields, depth=data.get("depth", 0), fetched=data.get("fetched", 0))
+        series.t.extend(data["t"])
+        for field, column in series.columns.items():
+            column.extend(data[field])
+        return series
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+
+class CoinalyzeHistoryCache:
+    """
+    Инкрементальный кэш истории Coinalyze (открытый интерес, ликвидации) по тикерам и интервалам.
+
+    Первый запрос тикера загружает окно из limit баров, следующие - только бары начиная с последнего
+    закэшированного (последний бар мог быть незакрытым, поэтому он перезапрашивается). Тикеры с одинаковым
+    временем последнего бара запрашиваются вместе, клиент делит их на части и распределяет по ключам.
+    История хранится в массивах array и обрезается до max_length баров.
+
+    Если указан path, кэш загружается из JSON файла при создании и сохраняется после каждого обновления,
+    поэтому после перезапуска догружаются только новые бары.
+
+    Пример:
+        cache = CoinalyzeHistoryCache(client, max_length=2000, path="coinalyze.history.json")
+        history = await cache.open_interest(["BTCUSDT_PERP.A", "ETHUSDT_PERP.A"], "1hour", limit=500)
+    """
+
+    def __init__(
+            self,
+            client: CoinalyzeClient,
+            max_length: int = 1000,
+            path: Optional[str] = None,
+            logger: logging.Logger | Logger = loguru.logger,
+    ) -> None:
+        """
+        :param client: Клиент Coinalyze.
+        :param max_length: Максимальное количество баров в истории одного тикера.
+        :param path: Путь к JSON файлу кэша.
+        :param logger: Логгер.
+        """
+        self._client: CoinalyzeClient = client
+        self._max_length: int = max_length
+        self._path: Optional[str] = path
+        self._logger: logging.Logger | Logger = logger
+        self._series: Dict[str, _Series] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._load()
+
+    async def open_interest(
+            self,
+            tickers: Union[List[str], str],
+            timeframe: str,
+            limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Возвращает историю открытого интереса в формате CoinalyzeClient.open_interest."""
+        return await self._history("open_interest", timeframe, tickers, limit, self._client.open_interest)
+
+    async def liquidations(
+            self,
+            tickers: Union[List[str], str],
+            timeframe: str,
+            limit: int,
+            convert_to_usd: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Возвращает историю ликвидаций в формате CoinalyzeClient.liquidations."""
+
+        async def _fetch(symbols: List[str], timeframe_: str, limit_: int, start: int) -> List[Dict[str, Any]]:
+            return await self._client.liquidations(
+                symbols, timeframe_, limit_, convert_to_usd=convert_to_usd, start=start)
+
+        name: str = "liquidations:usd" if convert_to_usd else "liquidations"
+        return await self._history(name, timeframe, tickers, limit, _fetch)
+
+    async def _history(
+            self,
+            name: str,
+            timeframe: str,
+            tickers: Union[List[str], str],
+            limit: int,
+            fetch: Callable[..., Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        symbols: List[str] = tickers.split(",") if isinstance(tickers, str) else list(tickers)
+        limit = min(limit, self._max_length)
+        fields: Tuple[str, ...] = _FIELDS[name.split(":")[0]]
+
+        async with self._lock:
+            # Тикеры группируются по времени, с которого нужно догрузить историю
+            now: int = int(time.time())
+            full_start: int = now - self._client.TIMEFRAME_SECONDS[timeframe] * limit - 3
+            groups: Dict[int, List[str]] = {}
+            for symbol in symbols:
+                series: Optional[_Series] = self._series.get(self._key(name, timeframe, symbol))
+                if series is None or series.depth < limit:
+                    groups.setdefault(full_start, []).append(symbol)
+                else:
+                    groups.setdefault(series.since, []).append(symbol)
+
+            responses: List[List[Dict[str, Any]]] = await asyncio.gather(
+                *(fetch(group, timeframe, limit, start=start) for start, group in groups.items()))
+
+            for start, response in zip(groups, responses):
+                history: Dict[str, List[Dict[str, Any]]] = {
+                    item["symbol"]: item.get("history") or [] for item in response}
+                # Тикеры без данных в ответе тоже учитываются: окно загружено, баров в нем нет
+                for symbol in groups[start]:
+                    key: str = self._key(name, timeframe, symbol)
+                    series = self._series.get(key)
+                    if series is None:
+                        series = self._series[key] = _Series(fields)
+                    series.merge(history.get(symbol, []))
+                    series.trim(self._max_length)
+                    series.fetched = now
+                    if start == full_start:
+                        series.depth = max(series.depth, limit)
+
+            self._save()
+
+        result: List[Dict[str, Any]] = []
+        for symbol in symbols:
+            series = self._series.get(self._key(name, timeframe, symbol))
+            result.append({"symbol": symbol, "history": series.to_list(limit) if series is not None else []})
+        return result
+
+    @staticmethod
+    def _key(name: str, timeframe: str, symbol: str) -> str:
+        return f"{name}|{timeframe}|{symbol}"
+
+    def _load(self) -> None:
+        if not self._path or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, "rb") as f:
+                data: Dict[str, Dict[str, Any]] = orjson.loads(f.read())
+            for key, value in data.items():
+                self._series[key] = _Series.load(_FIELDS[key.split("|")[0].split(":")[0]], value)
+        except Exception as e:
+            self._logger.warning(f"{self} can not load cache from {self._path}: {type(e).__name__}: {e}")
+            self._series.clear()
+
+    def _save(self) -> None:
+        if not self._path:
+            return
+        tmp_path: str = self._path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps({key: series.dump() for key, series in self._series.items()}))
+        os.replace(tmp_path, self._path)  # Атомарная запись: файл не повредится при падении
+
+    def __repr__(self) -> str:
+        return f"<CoinalyzeHistoryCache series={len(self._series)} max_length={self._max_length}>"
@@ -1,4 +1,5 @@
-__all__ = ["CoinmarketcapClient", "CoinmarketcapAdapter", ]
+__all__ = ["CoinmarketcapClient", "CoinmarketcapAdapter", "CoinmarketcapRankService", ]
 
 from .adapter import CoinmarketcapAdapter
 from .client import CoinmarketcapClient
+from .rank import CoinmarketcapRankService
@@ -8,5 +8,16 @@ class CoinmarketcapAdapter:
 
     @staticmethod
     def cryptocurrency_map(raw_data: Any) -> Dict[str, int]:
-        """Преобразует сырые данные из запроса в словарь: {ticker: rank}"""
-        return {el["symbol"]: el["rank"] for el in raw_data["data"]}
+        """
+        Преобразует сырые данные из запроса в словарь: {ticker: rank}.
+        Один тикер может быть у нескольких монет: берется лучший (минимальный) рейтинг.
+        Монеты без рейтинга пропускаются.
+        """
+        ranks: Dict[str, int] = {}
+        for el in raw_data["data"]:
+            rank: Any = el.get("rank")
+            if rank is None:
+                continue
+            if el["symbol"] not in ranks or rank < ranks[el["symbol"]]:
+                ranks[el["symbol"]] = rank
+        return ranks
@@ -16,7 +16,7 @@ class CoinmarketcapClient(BaseClient):
 
     def __init__(
             self,
-            session: aiohttp.ClientSession,
+            session: Optional[aiohttp.ClientSession],
             api_key: str,
             max_retries: Optional[int] = 3,
             retry_delay: Optional[int | float] = 0.1,
@@ -37,7 +37,7 @@ class CoinmarketcapClient(BaseClient):
     ) -> Self:
         """
         Создает инстанцию клиента.
-        Создать клиент можно и через __init__, но в таком случае session: aiohttp.ClientSession - обязательный параметр.
+        Если session не передана, используется общая для процесса сессия с настроенным пулом соединений.
         :return:
         """
         api_key: str | None = kwargs.get("api_key")
@@ -46,7 +46,7 @@ class CoinmarketcapClient(BaseClient):
 
         return cls(
             api_key=api_key,
-            session=session or aiohttp.ClientSession(),
+            session=session,
             logger=logger,
             max_retries=max_retries,
             retry_delay=retry_delay
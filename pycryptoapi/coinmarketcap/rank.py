@@ -0,0 +1,135 @@
+__all__ = ["CoinmarketcapRankService", ]
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import loguru
+import orjson
+from loguru._logger import Logger  # noqa
+
+from ..http import SingleFlight
+from .adapter import CoinmarketcapAdapter
+from .client import CoinmarketcapClient
+
+
+class CoinmarketcapRankService:
+    """
+    Кэш рейтинга Coinmarketcap: {symbol: rank}.
+
+    Рейтинг запрашивается не чаще одного раза за ttl секунд, одновременные обновления объединяются
+    в один запрос. Если нужно больше page_size монет, страницы запрашиваются параллельно. При ошибке
+    обновления остается прошлый рейтинг, а следующая попытка откладывается на _RETRY_INTERVAL.
+
+    Рейтинг строится CoinmarketcapAdapter.cryptocurrency_map по всем страницам сразу: для тикера
+    нескольких монет берется лучший (минимальный) рейтинг.
+
+    Если указан path, рейтинг сохраняется в JSON файл и при создании сервиса загружается из него:
+    пока сохраненный рейтинг не старше ttl, запросов к API нет. Файл, сохраненный с другим limit,
+    игнорируется.
+
+    Пример:
+        service = CoinmarketcapRankService(client, ttl=3600, path="cmc.rank.json")
+        ranks = await service.get()
+        service.rank("BTC")
+    """
+
+    # Пауза перед повторным обновлением после ошибки, пока отдается прошлый рейтинг (сек)
+    _RETRY_INTERVAL: float = 60
+
+    def __init__(
+            self,
+            client: CoinmarketcapClient,
+            ttl: float = 3600,
+            path: Optional[str] = None,
+            limit: int = 5000,
+            page_size: int = 5000,
+            logger: logging.Logger | Logger = loguru.logger,
+    ) -> None:
+        """
+        :param client: Клиент Coinmarketcap.
+        :param ttl: Время жизни рейтинга (сек).
+        :param path: Путь к JSON файлу рейтинга.
+        :param limit: Сколько монет загружать.
+        :param page_size: Монет на страницу (максимум API - 5000).
+        :param logger: Логгер.
+        """
+        self._client: CoinmarketcapClient = client
+        self._ttl: float = ttl
+        self._path: Optional[str] = path
+        self._limit: int = limit
+        self._page_size: int = min(page_size, 5000)
+        self._logger: logging.Logger | Logger = logger
+        self._ranks: Dict[str, int] = {}
+        self._updated: float = 0.0  # Время обновления рейтинга (time.time(), сохраняется в файл)
+        self._retry_at: float = 0.0  # После ошибки обновления следующая попытка не раньше этого времени
+        self._single_flight: SingleFlight = SingleFlight()
+        self._load()
+
+    @property
+    def fresh(self) -> bool:
+        return bool(self._ranks) and time.time() < self._updated + self._ttl
+
+    async def get(self) -> Dict[str, int]:
+        """Возвращает рейтинг, обновляя его, если он устарел."""
+        if not self.fresh and time.monotonic() >= self._retry_at:
+            await self._single_flight.do("refresh", self._refresh)
+        return self._ranks
+
+    def rank(self, symbol: str) -> Optional[int]:
+        """Возвращает рейтинг монеты из памяти без запросов к API (None - монеты нет в рейтинге)."""
+        return self._ranks.get(symbol)
+
+    async def _refresh(self) -> None:
+        try:
+            pages: List[List[Dict[str, Any]]] = await asyncio.gather(*(
+                self._fetch_page(start) for start in range(1, self._limit + 1, self._page_size)))
+        except Exception as e:
+            if not self._ranks:
+                raise
+            self._retry_at = time.monotonic() + min(self._ttl, self._RETRY_INTERVAL)
+            self._logger.warning(f"{self} refresh failed, serving stale ranks: {type(e).__name__}: {e}")
+            return
+
+        self._ranks = CoinmarketcapAdapter.cryptocurrency_map({"data": [item for page in pages for item in page]})
+        self._updated = time.time()
+        try:
+            self._save()
+        except Exception as e:
+            # Рейтинг уже обновлен в памяти: ошибка записи файла не должна ломать get()
+            self._logger.warning(f"{self} can not save ranks to {self._path}: {type(e).__name__}: {e}")
+
+    async def _fetch_page(self, start: int) -> List[Dict[str, Any]]:
+        raw_data: Dict[str, Any] = await self._client.cryptocurrency_map(
+            start=start, limit=min(self._page_size, self._limit - start + 1))
+        return raw_data["data"]
+
+    def _load(self) -> None:
+        if not self._path or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, "rb") as f:
+                data: Dict[str, Any] = orjson.loads(f.read())
+            if data.get("limit") != self._limit:
+                self._logger.info(f"{self} ignoring {self._path}: saved with limit={data.get('limit')}")
+                return
+            self._ranks = data["ranks"]
+            self._updated = data["updated"]
+        except Exception as e:
+            self._logger.warning(f"{self} can not load ranks from {self._path}: {type(e).__name__}: {e}")
+
+    def _save(self) -> None:
+        if not self._path:
+            return
+        tmp_path: str = self._path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps({"updated": self._updated, "limit": self._limit, "ranks": self._ranks}))
+        os.replace(tmp_path, self._path)  # Атомарная запись: файл не повредится при падении
+
+    def __len__(self) -> int:
+        return len(self._ranks)
+
+    def __repr__(self) -> str:
+        return f"<CoinmarketcapRankService ranks={len(self._ranks)} ttl={self._ttl}s>"
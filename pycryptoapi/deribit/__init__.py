@@ -1,3 +1,6 @@
-__all__ = ["DeribitClient", ]
+__all__ = ["DeribitClient", "DeribitWebsocket", "DeribitSocketManager", "DeribitOptionChain",
+           "DeribitOptionChainProvider", ]
 
+from .chain import DeribitOptionChain, DeribitOptionChainProvider
 from .client import DeribitClient
+from .websocket import DeribitWebsocket, DeribitSocketManager
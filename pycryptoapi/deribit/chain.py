@@ -0,0 +1,225 @@
+__all__ = ["DeribitOptionChain", "DeribitOptionChainProvider", ]
+
+import asyncio
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+from ..exceptions import AdapterException, APIException
+from .client import DeribitClient
+
+_NAN: float = float("nan")
+
+
+class _Instruments:
+    """Неизменяемые параметры опционов из public/get_instruments: имя, страйк, экспирация, тип."""
+
+    __slots__ = ("names", "index", "strike", "expiry", "is_call")
+
+    def __init__(self, raw_data: List[Dict[str, Any]]) -> None:
+        self.names: List[str] = []
+        self.strike: array = array("d")
+        self.expiry: array = array("q")
+        self.is_call: array = array("b")
+        for item in sorted(raw_data, key=lambda i: (i["expiration_timestamp"], i["strike"], i["option_type"])):
+            self.names.append(item["instrument_name"])
+            self.strike.append(float(item["strike"]))
+            self.expiry.append(int(item["expiration_timestamp"]))
+            self.is_call.append(item["option_type"] == "call")
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+
+class DeribitOptionChain:
+    """
+    Снимок опционной доски одной валюты в колоночном виде.
+
+    i-й элемент каждого массива относится к инструменту names[i]. Инструменты отсортированы по экспирации,
+    страйку и типу. Цены (bid, ask, mark_price) в валюте базового актива, mark_iv в процентах.
+    Отсутствующие значения (нет заявок) - nan.
+    """
+
+    __slots__ = ("currency", "t", "names", "index", "strike", "expiry", "is_call",
+                 "mark_iv", "bid", "ask", "mark_price", "open_interest", "underlying_price")
+
+    def __init__(self, currency: str, t: int, instruments: _Instruments) -> None:
+        self.currency: str = currency
+        self.t: int = t  # Время получения ответа (мс)
+        # Параметры инструментов общие для снимков с одним списком инструментов
+        self.names: List[str] = instruments.names
+        self.index: Dict[str, int] = instruments.index
+        self.strike: array = instruments.strike
+        self.expiry: array = instruments.expiry
+        self.is_call: array = instruments.is_call
+        size: int = len(instruments.names)
+        self.mark_iv: array = array("d", [_NAN]) * size
+        self.bid: array = array("d", [_NAN]) * size
+        self.ask: array = array("d", [_NAN]) * size
+        self.mark_price: array = array("d", [_NAN]) * size
+        self.open_interest: array = array("d", [_NAN]) * size
+        self.underlying_price: array = array("d", [_NAN]) * size
+
+    @classmethod
+    def from_raw(
+            cls,
+            currency: str,
+            instruments: _Instruments,
+            raw_data: List[Dict[str, Any]],
+            t: Optional[int] = None,
+    ) -> "DeribitOptionChain":
+        """
+        Заполняет рыночные колонки из ответа public/get_book_summary_by_currency.
+        Инструменты, которых нет в списке инструментов, пропускаются.
+        """
+        chain: DeribitOptionChain = cls(currency, int(time.time() * 1000) if t is None else t, instruments)
+        try:
+            for item in raw_data:
+                i: Optional[int] = chain.index.get(item["instrument_name"])
+                if i is None:
+                    continue
+                chain.mark_iv[i] = _float(item.get("mark_iv"))
+                chain.bid[i] = _float(item.get("bid_price"))
+                chain.ask[i] = _float(item.get("ask_price"))
+                chain.mark_price[i] = _float(item.get("mark_price"))
+                chain.open_interest[i] = _float(item.get("open_interest"))
+                chain.underlying_price[i] = _float(item.get("underlying_price"))
+        except Exception as e:
+            raise AdapterException(f"Error parsing book summary: {e}")
+        return chain
+
+    def expiries(self) -> List[int]:
+        """Возвращает экспирации (мс) по возрастанию."""
+        return sorted(set(self.expiry))
+
+    def select(self, expiry: Optional[int] = None, is_call: Optional[bool] = None) -> List[int]:
+        """Возвращает индексы инструментов с заданной экспирацией и (или) типом опциона."""
+        return [
+            i for i in range(len(self.names))
+            if (expiry is None or self.expiry[i] == expiry) and (is_call is None or self.is_call[i] == is_call)
+        ]
+
+    def row(self, instrument_name: str) -> Dict[str, Any]:
+        """Возвращает данные одного инструмента."""
+        i: int = self.index[instrument_name]
+        return {
+            "instrument_name": instrument_name,
+            "strike": self.strike[i],
+            "expiry": self.expiry[i],
+            "is_call": bool(self.is_call[i]),
+            "mark_iv": self.mark_iv[i],
+            "bid": self.bid[i],
+            "ask": self.ask[i],
+            "mark_price": self.mark_price[i],
+            "open_interest": self.open_interest[i],
+            "underlying_price": self.underlying_price[i],
+        }
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"<DeribitOptionChain {self.currency} instruments={len(self.names)} t={self.t}>"
+
+
+class DeribitOptionChainProvider:
+    """
+    Источник DeribitOptionChain с временем жизни.
+
+    Рыночные данные всей доски приходят одним запросом public/get_book_summary_by_currency не чаще
+    одного раза за ttl секунд. Список инструментов (страйки, экспирации) меняется редко: он запрашивается
+    раз в instruments_ttl секунд в том же HTTP запросе, что и сводка (DeribitClient.batch), а также
+    когда прошла ближайшая экспирация списка или в сводке появился инструмент, которого нет в списке
+    (листинг). Обновление из-за нового инструмента выполняется не чаще раза в _LISTING_REFRESH_INTERVAL
+    секунд, чтобы постоянное расхождение двух методов API не удваивало число запросов. Между обновлениями
+    списка колонки инструментов не перестраиваются, обновляются только рыночные колонки.
+
+    Пример:
+        provider = DeribitOptionChainProvider(await DeribitClient.create(), currency="BTC", ttl=5)
+        chain = await provider.get()
+        for i in chain.select(expiry=chain.expiries()[0], is_call=True):
+            print(chain.names[i], chain.strike[i], chain.mark_iv[i])
+    """
+
+    # Минимальный интервал между обновлениями списка инструментов из-за новых инструментов в сводке (сек)
+    _LISTING_REFRESH_INTERVAL: float = 60
+
+    def __init__(
+            self,
+            client: DeribitClient,
+            currency: str = "BTC",
+            ttl: float = 5,
+            instruments_ttl: float = 3600,
+    ) -> None:
+        """
+        :param client: Клиент Deribit.
+        :param currency: Валюта опционов (BTC, ETH, ...).
+        :param ttl: Время жизни снимка (сек).
+        :param instruments_ttl: Время жизни списка инструментов (сек).
+        """
+        self._client: DeribitClient = client
+        self._currency: str = currency
+        self._ttl: float = ttl
+        self._instruments_ttl: float = instruments_ttl
+        self._instruments: Optional[_Instruments] = None
+        self._instruments_expires_at: float = 0.0
+        self._instruments_fetched_at: float = 0.0
+        self._chain: Optional[DeribitOptionChain] = None
+        self._expires_at: float = 0.0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def get(self) -> DeribitOptionChain:
+        """Возвращает актуальный снимок, обновляя его при необходимости."""
+        if self._chain is not None and time.monotonic() < self._expires_at:
+            return self._chain
+        async with self._lock:
+            # Пока ждали блокировку, снимок мог обновить другой вызов
+            if self._chain is None or time.monotonic() >= self._expires_at:
+                self._chain = await self._refresh()
+                self._expires_at = time.monotonic() + self._ttl
+        return self._chain
+
+    async def _refresh(self) -> DeribitOptionChain:
+        summary_call = ("public/get_book_summary_by_currency", {"currency": self._currency, "kind": "option"})
+        instruments_call = ("public/get_instruments", {"currency": self._currency, "kind": "option"})
+
+        if self._instruments_stale():
+            # Список инструментов устарел: запрашиваем его вместе со сводкой одним пакетом
+            summary, instruments = _result(await self._client.batch([summary_call, instruments_call]))
+            self._set_instruments(instruments)
+        else:
+            summary = _result([await self._client.get_book_summary_by_currency(self._currency, kind="option")])[0]
+            listed: bool = any(item["instrument_name"] not in self._instruments.index for item in summary)
+            if listed and time.monotonic() >= self._instruments_fetched_at + self._LISTING_REFRESH_INTERVAL:
+                # В сводке новый инструмент (листинг): обновляем список
+                self._set_instruments(_result([await self._client.get_instruments(self._currency, kind="option")])[0])
+
+        return DeribitOptionChain.from_raw(self._currency, self._instruments, summary)
+
+    def _instruments_stale(self) -> bool:
+        """Список нужно обновить: его нет, истек instruments_ttl или прошла ближайшая экспирация."""
+        if self._instruments is None or time.monotonic() >= self._instruments_expires_at:
+            return True
+        # Инструменты отсортированы по экспирации: первая - ближайшая
+        return bool(self._instruments.expiry) and self._instruments.expiry[0] <= time.time() * 1000
+
+    def _set_instruments(self, raw_data: List[Dict[str, Any]]) -> None:
+        try:
+            self._instruments = _Instruments(raw_data)
+        except Exception as e:
+            raise AdapterException(f"Error parsing instruments: {e}")
+        self._instruments_fetched_at = time.monotonic()
+        self._instruments_expires_at = self._instruments_fetched_at + self._instruments_ttl
+
+    def __repr__(self) -> str:
+        return f"<DeribitOptionChainProvider {self._currency} ttl={self._ttl}s chain={self._chain!r}>"
+
+
+def _float(value: Any) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _result(responses: List[Dict[str, Any]]) -> List[Any]:
+    """Возвращает result ответов JSON-RPC или бросает исключение с первой ошибкой."""
+    for response in responses:
+        if "error" in response:
+            raise APIException(code=response["error"].get("code", 0), message=str(response["error"]))
+    return [response["result"] for response in responses]
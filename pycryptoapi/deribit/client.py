@@ -1,71 +1,227 @@
 __all__ = ["DeribitClient"]
 
+import asyncio
+import hashlib
+import hmac
+import itertools
+import logging
+import secrets
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Self, Tuple
 
 import aiohttp
+import loguru
+import orjson
+from loguru._logger import Logger  # noqa
 
+from ..abstract import BaseClient
+from ..exceptions import APIException
+from ..http import RetryPolicy
+from ..types import JsonLike
+
+
+def _signature_auth_params(client_id: str, client_secret: str) -> Dict[str, Any]:
+    """
+    Параметры public/auth с grant_type=client_signature: подпись HMAC-SHA256 от времени и одноразового nonce.
+    client_secret не передается, поэтому сообщение можно логировать. Для каждой авторизации нужны новые параметры.
+    """
+    timestamp: int = int(time.time() * 1000)
+    nonce: str = secrets.token_hex(8)
+    signature: str = hmac.new(client_secret.encode(), f"{timestamp}\n{nonce}\n".encode(), hashlib.sha256).hexdigest()
+    return {
+        "grant_type": "client_signature",
+        "client_id": client_id,
+        "timestamp": timestamp,
+        "nonce": nonce,
+        "signature": signature,
+        "data": "",
+    }
+
+
+class DeribitClient(BaseClient):
+    """
+    Клиент JSON-RPC API Deribit.
+
+    Запросы идут через общую (или переданную) сессию BaseClient с ее пулом соединений, лимитами и повторами.
+    Приватные методы (ордера) и авторизация выполняются одной попыткой без подстраховки: повтор
+    неидемпотентного вызова может выставить ордер дважды.
+
+    Токен доступа запрашивается только для приватных методов, кэшируется и обновляется заранее, за
+    _TOKEN_REFRESH_MARGIN секунд до истечения. Авторизация идет подписью client_signature, поэтому
+    client_secret не передается и не попадает в логи. Одновременные запросы во время обновления ждут
+    один и тот же запрос токена.
+
+    Методы возвращают ответ JSON-RPC целиком: {"jsonrpc": "2.0", "id": ..., "result": ...}.
+    """
 
-class DeribitClient:
     BASE_URL = "https://www.deribit.com/api/v2/"
 
-    def __init__(self, api_key: str, api_secret: str) -> None:
-        super().__init__()
+    # За сколько секунд до истечения токена он обновляется
+    _TOKEN_REFRESH_MARGIN: float = 60
 
-        self._client_id: str = api_key
-        self._client_secret: str = api_secret
+    def __init__(
+            self,
+            api_key: Optional[str] = None,
+            api_secret: Optional[str] = None,
+            session: Optional[aiohttp.ClientSession] = None,
+            logger: logging.Logger | Logger = loguru.logger,
+            max_retries: Optional[int] = 3,
+            retry_delay: Optional[int | float] = 0.1,
+            **kwargs
+    ) -> None:
+        """
+        :param api_key: Client ID. Нужен только для приватных методов.
+        :param api_secret: Client secret.
+        :param kwargs: Остальные параметры BaseClient (proxies, rate_limiter, retry_policy и т.д.).
+        """
+        super().__init__(session=session, logger=logger, max_retries=max_retries, retry_delay=retry_delay, **kwargs)
+
+        self._client_id: Optional[str] = api_key
+        self._client_secret: Optional[str] = api_secret
         self._token: Optional[str] = None
         self._token_expiry: float = 0
+        self._private_retry_policy: RetryPolicy = self._retry_policy.replace(max_attempts=1)
+        self._auth_lock: asyncio.Lock = asyncio.Lock()
+        self._ids: Iterator[int] = itertools.count(1)
+        self._batch_supported: Optional[bool] = None  # None - еще неизвестно, поддерживает ли API пакетные запросы
 
-    async def _authenticate(self) -> None:
-        """Authenticate and get access token using client credentials."""
-        if self._token is None or time.time() >= self._token_expiry:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "client_id": self._client_id,
-                    "client_secret": self._client_secret,
-                    "grant_type": "client_credentials"
-                }
+    @classmethod
+    async def create(
+            cls,
+            session: Optional[aiohttp.ClientSession] = None,
+            logger: logging.Logger | Logger = loguru.logger,
+            max_retries: Optional[int] = 3,
+            retry_delay: Optional[int | float] = 0.1,
+            **kwargs
+    ) -> Self:
+        """
+        Создает инстанцию клиента.
+        Если session не передана, используется общая для процесса сессия с настроенным пулом соединений.
+        :return:
+        """
+        return cls(session=session, logger=logger, max_retries=max_retries, retry_delay=retry_delay, **kwargs)
 
-                async with session.get(f"{self.BASE_URL}public/auth", params=params) as response:
-                    data = await response.json()
+    @property
+    def _token_valid(self) -> bool:
+        return self._token is not None and time.time() < self._token_expiry - self._TOKEN_REFRESH_MARGIN
 
-                    if "error" in data:
-                        raise Exception(f"Authentication error: {data['error']}")
+    async def _authenticate(self) -> str:
+        """Возвращает действующий токен доступа, при необходимости запрашивая новый."""
+        if self._token_valid:
+            return self._token
+        async with self._auth_lock:
+            # Пока ждали блокировку, токен мог обновить другой запрос
+            if self._token_valid:
+                return self._token
+            if not self._client_id or not self._client_secret:
+                raise ValueError("api_key and api_secret required for private methods")
 
-                    self.token = data["result"]["access_token"]
-                    # Обновляем токен за минуту до истечения
-                    self.token_expiry = time.time() + data["result"]["expires_in"] - 60
+            # Подпись с nonce одноразовая: повтор запроса с ней бессмыслен
+            data: Dict[str, Any] = await self._make_request(
+                "POST", self.BASE_URL,
+                data=self._payload("public/auth", _signature_auth_params(self._client_id, self._client_secret)),
+                headers={"Content-Type": "application/json"}, retry_policy=self._private_retry_policy, hedge=False)
+            if "error" in data:
+                raise APIException(code=data["error"].get("code", 0),
+                                   message=f"Authentication error: {data['error']}")
 
-    async def _send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a request to the Deribit API."""
-        await self._authenticate()
+            self._token = data["result"]["access_token"]
+            self._token_expiry = time.time() + data["result"]["expires_in"]
+            return self._token
 
-        payload = {
+    def _payload(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {
             "jsonrpc": "2.0",
-            "id": int(time.time() * 1000),  # Генерация уникального ID
-            "method": method,
+            "id": next(self._ids),
+            "method": method.lstrip("/"),
             "params": params or {}
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
+    @staticmethod
+    def _is_private(methods: Iterable[str]) -> bool:
+        return any(method.lstrip("/").startswith("private/") for method in methods)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.BASE_URL, headers=headers, json=payload) as response:
-                data = await response.json()
-                return data
+    async def _headers(self, private: bool) -> Dict[str, str]:
+        """Заголовки запроса: токен добавляется только для приватных методов."""
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if private:
+            headers["Authorization"] = f"Bearer {await self._authenticate()}"
+        return headers
+
+    async def _post(self, data: Any, private: bool) -> JsonLike:
+        """Отправляет JSON-RPC запрос: приватные вызовы - одной попыткой и без подстраховки."""
+        return await self._make_request(
+            "POST", self.BASE_URL, data=data, headers=await self._headers(private),
+            retry_policy=self._private_retry_policy if private else None, hedge=not private)
+
+    async def _rpc(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a request to the Deribit API."""
+        return await self._post(self._payload(method, params), self._is_private([method]))
+
+    async def batch(self, calls: Iterable[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """
+        Выполняет несколько вызовов одним HTTP запросом (пакетный JSON-RPC).
+
+        Если API отвечает, что пакетные запросы не поддерживаются (ошибка JSON-RPC Invalid Request или
+        ответ не списком), вызовы выполняются параллельно отдельными запросами, и следующие вызовы batch
+        сразу идут этим путем. Остальные ошибки пробрасываются.
+
+        :param calls: Пары (метод, параметры), например [("public/ticker", {"instrument_name": "BTC-PERPETUAL"})].
+        :return: Ответы JSON-RPC в порядке calls.
+        """
+        calls = [(method, params) for method, params in calls]
+        if not calls:
+            return []
+
+        if self._batch_supported is not False:
+            payloads: List[Dict[str, Any]] = [self._payload(method, params) for method, params in calls]
+            try:
+                data: JsonLike = await self._post(payloads, self._is_private(method for method, _ in calls))
+            except APIException as e:
+                if not self._is_batch_unsupported(e):
+                    raise
+                data = None
+            if isinstance(data, list):
+                self._batch_supported = True
+                responses: Dict[int, Dict[str, Any]] = {item.get("id"): item for item in data}
+                return [responses.get(payload["id"], {"id": payload["id"], "error": {"message": "no response"}})
+                        for payload in payloads]
+            self._batch_supported = False
+            self._logger.debug(f"{self} batch requests are not supported, falling back to concurrent requests")
+
+        return list(await asyncio.gather(*(self._rpc(method, params) for method, params in calls)))
+
+    @staticmethod
+    def _is_batch_unsupported(error: APIException) -> bool:
+        """Ответ на пакет означает, что пакетные запросы не поддерживаются, а не ошибку одного из вызовов."""
+        message: str = str(error).lower()
+        return error.code == 400 and ("-32600" in message or "batch" in message)
+
+    async def _handle_response(self, response: aiohttp.ClientResponse, raw: bool = False) -> JsonLike | bytes:
+        """Ошибки Deribit приходят с HTTP 4xx и телом JSON-RPC: текст ошибки сохраняется в APIException."""
+        if response.status >= 400:
+            body: bytes = await response.read()
+            self._log_response(body)
+            try:
+                message: str = str(orjson.loads(body).get("error"))
+            except Exception:
+                message = self._preview(body)
+            retry_after: Optional[str] = response.headers.get("Retry-After")
+            raise APIException(
+                code=response.status,
+                message=message,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        return await super()._handle_response(response=response, raw=raw)
 
     async def get_price(self, instrument_name: str) -> Dict[str, Any]:
         """Example method to get the current price of an instrument."""
-        return await self._send_request("public/ticker", {"instrument_name": instrument_name})
+        return await self._rpc("public/ticker", {"instrument_name": instrument_name})
 
     async def get_orderbook(self, instrument_name: str, depth: Optional[int] = 10) -> Dict[str, Any]:
         """  https://docs.deribit.com/?shell#public-get_order_book """
-        return await self._send_request(
-            "/public/get_order_book",
+        return await self._rpc(
+            "public/get_order_book",
             {
                 "instrument_name": instrument_name,
                 "depth": depth
@@ -74,8 +230,8 @@ class DeribitClient:
 
     async def get_instrument(self, instrument_name: str) -> Dict[str, Any]:
         """ https://docs.deribit.com/#public-get_index_price_names """
-        return await self._send_request(
-            "/public/get_instrument",
+        return await self._rpc(
+            "public/get_instrument",
             {
                 "instrument_name": instrument_name
             }
@@ -83,18 +239,28 @@ class DeribitClient:
 
     async def get_instruments(self, currency: str, kind: str = "option") -> Dict[str, Any]:
         """ https://docs.deribit.com/?shell#public-get_instruments """
-        return await self._send_request(
-            "/public/get_instruments",
+        return await self._rpc(
+            "public/get_instruments",
             {
                 "currency": currency,
-                "king": kind
+                "kind": kind
+            }
+        )
+
+    async def get_book_summary_by_currency(self, currency: str, kind: str = "option") -> Dict[str, Any]:
+        """ https://docs.deribit.com/#public-get_book_summary_by_currency """
+        return await self._rpc(
+            "public/get_book_summary_by_currency",
+            {
+                "currency": currency,
+                "kind": kind
             }
         )
 
     async def ticker(self, instrument_name: str) -> Dict[str, Any]:
         """  https://docs.deribit.com/#public-ticker """
-        return await self._send_request(
-            "/public/ticker",
+        return await self._rpc(
+            "public/ticker",
             {
                 "instrument_name": instrument_name
             }
@@ -114,8 +280,8 @@ class DeribitClient:
 
     ) -> Dict[str, Any]:
         """ https://docs.deribit.com/#private-buy """
-        return await self._send_request(
-            "/private/buy",
+        return await self._rpc(
+            "private/buy",
             {
                 "instrument_name": instrument_name,
                 "contracts": contracts,
@@ -128,8 +294,8 @@ class DeribitClient:
 
     async def cancel(self, order_id: str) -> Dict[str, Any]:
         """ https://docs.deribit.com/#private-cancel """
-        return await self._send_request(
-            "/private/cancel",
+        return await self._rpc(
+            "private/cancel",
             {
                 "order_id": order_id
             }
@@ -145,8 +311,8 @@ class DeribitClient:
             reduce_only: bool = True,
     ) -> Dict[str, Any]:
         """ https://docs.deribit.com/#private-sell """
-        return await self._send_request(
-            "/private/sell",
+        return await self._rpc(
+            "private/sell",
             {
                 "instrument_name": instrument_name,
                 "contracts": contracts,
@@ -159,8 +325,8 @@ class DeribitClient:
 
     async def edit(self, order_id: str, price: float, contracts: float, **kwargs) -> Dict[str, Any]:
         """ https://docs.deribit.com/#private-edit """
-        return await self._send_request(
-            "/private/edit",
+        return await self._rpc(
+            "private/edit",
             {
                 "order_id": order_id,
                 "price": price,
@@ -171,8 +337,8 @@ class DeribitClient:
 
     async def get_order_state(self, order_id: str) -> Dict[str, Any]:
         """ https://docs.deribit.com/#private-get_order_state """
-        return await self._send_request(
-            "/private/get_order_state",
+        return await self._rpc(
+            "private/get_order_state",
             {
                 "order_id": order_id
             }
@@ -180,8 +346,8 @@ class DeribitClient:
 
     async def get_user_trades_by_currency(self, currency: str, kind: str = "option", **kwargs) -> Dict[str, Any]:
         """ https://docs.deribit.com/#private-get_user_trades_by_currency """
-        return await self._send_request(
-            "/private/get_user_trades_by_currency",
+        return await self._rpc(
+            "private/get_user_trades_by_currency",
             {
                 "currency": currency,
                 "kind": kind,
@@ -191,11 +357,12 @@ class DeribitClient:
 
     async def close_position(self, instrument_name: str, price: float, type: str = "limit") -> Dict[str, Any]:  # noqa
         """ https://docs.deribit.com/#private-close_position """
-        return await self._send_request(
-            "/close_position",
+        return await self._rpc(
+            "private/close_position",
             {
                 "instrument_name": instrument_name,
                 "price": price,
                 "type": type,
             }
         )
+
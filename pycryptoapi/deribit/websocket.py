@@ -0,0 +1,314 @@
+__all__ = ["DeribitWebsocket", "DeribitSocketManager", ]
+
+import asyncio
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import orjson
+from websockets.asyncio.client import ClientConnection
+
+from ..abstract import AbstractSocketManager, AbstractWebsocket
+from ..enums import MarketType
+from ..exceptions import APIException
+from .client import _signature_auth_params
+
+
+class DeribitWebsocket(AbstractWebsocket):
+    """
+    JSON-RPC транспорт Deribit поверх одного вебсокет соединения.
+
+    Подписывается через public/subscribe на каналы "{topic}.{instrument}.{interval}" (book, ticker, trades)
+    и передает в callback параметры уведомлений: {"channel": ..., "data": ...}. Через то же соединение
+    можно выполнять любые JSON-RPC вызовы (request): ответы сопоставляются с запросами по id, поэтому
+    одновременные вызовы не ждут друг друга. Соединение поддерживается heartbeat'ом Deribit
+    (public/set_heartbeat, ответ public/test на test_request).
+
+    Ответы на вызовы и heartbeat обрабатываются сразу при чтении сообщения. Уведомления ставятся в очередь
+    воркеров без ожидания: если очередь заполнена, уведомление отбрасывается, чтобы медленный callback
+    не задерживал ответы и heartbeat (иначе Deribit закроет соединение).
+
+    Если переданы api_key и api_secret, после каждого подключения выполняется public/auth с подписью
+    client_signature (client_secret не передается). Подписка отправляется только после успешного ответа
+    на авторизацию, ошибка авторизации приводит к переподключению. Через авторизованное соединение
+    можно вызывать приватные методы и подписываться на raw каналы.
+    """
+
+    # Каналов в одном сообщении public/subscribe
+    _SUBSCRIBE_CHUNK: int = 100
+
+    def __init__(
+            self,
+            topic: str,
+            callback: Callable[..., Awaitable],
+            tickers: Optional[List[str]] = None,
+            interval: str = "100ms",
+            channels: Optional[List[str]] = None,
+            api_key: Optional[str] = None,
+            api_secret: Optional[str] = None,
+            heartbeat_interval: int = 30,
+            request_timeout: float = 10,
+            testnet: bool = False,
+            **kwargs
+    ) -> None:
+        """
+        :param topic: Тип канала: book, ticker или trades.
+        :param callback: Функция, которая получает уведомления подписки {"channel": ..., "data": ...}.
+        :param tickers: Инструменты, например ["BTC-PERPETUAL", "BTC-27JUN25-100000-C"].
+        :param interval: Частота уведомлений канала: 100ms, agg2 или raw (raw требует авторизации).
+        :param channels: Готовые имена каналов (переопределяют topic, tickers и interval).
+        :param api_key: Client ID для авторизации соединения.
+        :param api_secret: Client secret.
+        :param heartbeat_interval: Интервал heartbeat Deribit (сек, не меньше 10).
+        :param request_timeout: Время ожидания ответа на JSON-RPC вызов (сек).
+        :param testnet: Подключаться к test.deribit.com.
+        """
+        super().__init__(topic=topic, callback=callback, tickers=tickers, **kwargs)
+        self._interval: str = interval
+        self._channels: List[str] = channels if channels is not None else [
+            f"{topic}.{ticker}.{interval}" for ticker in tickers or []]
+        self._api_key: Optional[str] = api_key
+        self._api_secret: Optional[str] = api_secret
+        self._heartbeat_interval: int = max(heartbeat_interval, 10)
+        self._request_timeout: float = request_timeout
+        self._testnet: bool = testnet
+
+        self._ids: Iterator[int] = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._conn: Optional[ClientConnection] = None
+        self._connected: asyncio.Event = asyncio.Event()
+        self._dropped: int = 0  # Уведомления, отброшенные из-за заполненной очереди
+
+    @property
+    def _connection_uri(self) -> str:
+        return "wss://test.deribit.com/ws/api/v2" if self._testnet else "wss://www.deribit.com/ws/api/v2"
+
+    @property
+    def _ping_message(self) -> Optional[str]:
+        pass
+
+    def _message(self, method: str, params: Optional[Dict[str, Any]] = None, id_: Optional[int] = None) -> str:
+        return orjson.dumps({
+            "jsonrpc": "2.0",
+            "id": next(self._ids) if id_ is None else id_,
+            "method": method,
+            "params": params or {},
+        }).decode()
+
+    @property
+    def _subscribe_message(self) -> Optional[Union[str, List[str]]]:
+        messages: List[str] = [self._message("public/set_heartbeat", {"interval": self._heartbeat_interval})]
+        method: str = "private/subscribe" if self._api_key and self._api_secret else "public/subscribe"
+        for i in range(0, len(self._channels), self._SUBSCRIBE_CHUNK):
+            messages.append(self._message(method, {"channels": self._channels[i:i + self._SUBSCRIBE_CHUNK]}))
+        return messages
+
+    async def _subscribe(self, conn: ClientConnection) -> None:
+        self._conn = conn
+        try:
+            if self._api_key and self._api_secret:
+                # Приватная подписка без авторизации будет отклонена: ждем ответ на public/auth
+                await self._call_before_handler(
+                    conn, "public/auth", _signature_auth_params(self._api_key, self._api_secret))
+        except BaseException:
+            self._conn = None
+            raise
+        await super()._subscribe(conn)
+        self._connected.set()
+
+    async def _call_before_handler(self, conn: ClientConnection, method: str, params: Dict[str, Any]) -> Any:
+        """
+        Выполняет JSON-RPC вызов до запуска _handler: сообщения соединения читаются здесь же, пока не придет ответ.
+
+        :raises APIException: Если Deribit вернул ошибку.
+        """
+        id_: int = next(self._ids)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[id_] = future
+        try:
+            await conn.send(self._message(method, params, id_=id_))
+            async with asyncio.timeout(self._request_timeout):
+                while not future.done():
+                    message = await conn.recv()
+                    self._last_message_time = time.time()
+                    await self._dispatch(conn, message)
+            return future.result()
+        finally:
+            self._pending.pop(id_, None)
+
+    async def _dispatch(self, conn: ClientConnection, message: Any) -> None:
+        """Обрабатывает одно сообщение: уведомление подписки, heartbeat или ответ на вызов."""
+        self._logger.trace(f"{self} Received message: {message}")
+        data: Dict[str, Any] = orjson.loads(message)
+        method: Optional[str] = data.get("method")
+
+        if method == "subscription":
+            self._put_nowait(data["params"])
+        elif method == "heartbeat":
+            if data["params"].get("type") == "test_request":
+                await conn.send(self._message("public/test"))
+        elif "id" in data:
+            self._resolve(data)
+
+    async def _handler(self, conn: ClientConnection) -> None:
+        """
+        Разбирает сообщения соединения: ответы на вызовы, heartbeat и уведомления подписок.
+
+        Параметры:
+            conn (ClientConnection): Активное WebSocket соединение.
+        """
+        try:
+            while self._is_active:
+                try:
+                    message = await conn.recv()
+                    self._last_message_time = time.time()
+                    await self._dispatch(conn, message)
+                except orjson.JSONDecodeError:
+                    self._logger.error(f"{self} orjson.JSONDecodeError whilte handling message: {message}")
+                except Exception as e:
+                    self._logger.error(f"{self} Error({type(e)}) while handling message: {e}")
+                    break
+        finally:
+            # Ответы на вызовы, отправленные в это соединение, уже не придут
+            self._connected.clear()
+            self._conn = None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Deribit websocket connection closed"))
+            self._pending.clear()
+
+    def _put_nowait(self, message: Any) -> None:
+        """Ставит уведомление в очередь без ожидания, отбрасывая его, если очередь заполнена."""
+        messages: List[Any] = [message] if self._message_filter is None else self._message_filter(message)
+        for item in messages:
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self._dropped += 1
+                if self._dropped == 1 or self._dropped % 1000 == 0:
+                    self._logger.warning(f"{self} Queue is full, dropped {self._dropped} notifications")
+
+    def _resolve(self, data: Dict[str, Any]) -> None:
+        """Передает ответ ожидающему вызову или логирует ошибку вызова без ожидающего (подписка, heartbeat)."""
+        future: Optional[asyncio.Future] = self._pending.pop(data["id"], None)
+        error: Optional[Dict[str, Any]] = data.get("error")
+        if future is None:
+            if error is not None:
+                self._logger.error(f"{self} JSON-RPC error: {error}")
+            return
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(APIException(code=error.get("code", 0), message=str(error)))
+        else:
+            future.set_result(data.get("result"))
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Выполняет JSON-RPC вызов через вебсокет соединение и возвращает result ответа.
+        Ждет подключения, если соединение еще не установлено.
+
+        :raises APIException: Если Deribit вернул ошибку.
+        :raises ConnectionError: Если соединения нет или оно закрылось до ответа.
+        """
+        await asyncio.wait_for(self._connected.wait(), timeout=self._request_timeout)
+        conn: Optional[ClientConnection] = self._conn
+        if conn is None:
+            raise ConnectionError("Deribit websocket is not connected")
+        id_: int = next(self._ids)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[id_] = future
+        try:
+            try:
+                await conn.send(self._message(method.lstrip("/"), params, id_=id_))
+            except Exception as e:
+                raise ConnectionError(f"Deribit websocket send failed: {type(e).__name__}: {e}") from e
+            return await asyncio.wait_for(future, timeout=self._request_timeout)
+        finally:
+            self._pending.pop(id_, None)
+
+    async def subscribe(self, channels: List[str]) -> List[str]:
+        """Подписывается на дополнительные каналы. Они сохраняются и восстанавливаются при переподключении."""
+        self._channels.extend(channel for channel in channels if channel not in self._channels)
+        method: str = "private/subscribe" if self._api_key and self._api_secret else "public/subscribe"
+        return await self.request(method, {"channels": channels})
+
+    async def unsubscribe(self, channels: List[str]) -> List[str]:
+        """Отписывается от каналов."""
+        self._channels = [channel for channel in self._channels if channel not in channels]
+        method: str = "private/unsubscribe" if self._api_key and self._api_secret else "public/unsubscribe"
+        return await self.request(method, {"channels": channels})
+
+    def __str__(self) -> str:
+        return f"[Ws Deribit {self._topic} {len(self._channels)}Xchannels]"
+
+    def __repr__(self) -> str:
+        return f"<Ws Deribit {self._topic}>"
+
+
+class DeribitSocketManager(AbstractSocketManager):
+
+    @classmethod
+    def liquidations_socket(cls, *args, **kwargs) -> AbstractWebsocket:
+        raise NotImplementedError()
+
+    @classmethod
+    def klines_socket(cls, *args, **kwargs) -> AbstractWebsocket:
+        raise NotImplementedError()
+
+    @classmethod
+    def tickers_socket(
+            cls,
+            tickers: List[str] | Tuple[str, ...],
+            callback: Callable[..., Awaitable],
+            market_type: Optional[MarketType] = None,
+            interval: str = "100ms",
+            **kwargs
+    ) -> DeribitWebsocket:
+        """Канал ticker.{instrument}.{interval}: лучшие цены, mark price, greeks и IV для опционов."""
+        return DeribitWebsocket(
+            topic="ticker",
+            tickers=list(tickers),
+            market_type=market_type,
+            callback=callback,
+            interval=interval,
+            **kwargs
+        )
+
+    @classmethod
+    def aggtrades_socket(
+            cls,
+            tickers: List[str] | Tuple[str, ...],
+            callback: Callable[..., Awaitable],
+            market_type: Optional[MarketType] = None,
+            interval: str = "100ms",
+            **kwargs
+    ) -> DeribitWebsocket:
+        """Канал trades.{instrument}.{interval}: сделки по инструменту."""
+        return DeribitWebsocket(
+            topic="trades",
+            tickers=list(tickers),
+            market_type=market_type,
+            callback=callback,
+            interval=interval,
+            **kwargs
+        )
+
+    @classmethod
+    def book_socket(
+            cls,
+            tickers: List[str] | Tuple[str, ...],
+            callback: Callable[..., Awaitable],
+            market_type: Optional[MarketType] = None,
+            interval: str = "100ms",
+            **kwargs
+    ) -> DeribitWebsocket:
+        """Канал book.{instrument}.{interval}: снимок книги ордеров, затем изменения уровней."""
+        return DeribitWebsocket(
+            topic="book",
+            tickers=list(tickers),
+            market_type=market_type,
+            callback=callback,
+            interval=interval,
+            **kwargs
+        )
@@ -1,4 +1,4 @@
-__all__ = ["MarketType", "Exchange", "Timeframe", "Side"]
+__all__ = ["MarketType", "Exchange", "Timeframe", "Side", "Dataset"]
 
 from enum import StrEnum
 from typing import Dict, Tuple
@@ -182,6 +182,15 @@ class Side(StrEnum):
     SELL = "SELL"
 
 
+class Dataset(StrEnum):
+    """Перечисление наборов рыночных данных по всем тикерам фьючерсного рынка."""
+
+    TICKERS = "tickers"  # Изменение цены и объем за 24ч (futures_ticker_24h)
+    FUNDING_RATE = "funding_rate"  # Ставки финансирования (funding_rate)
+    OPEN_INTEREST = "open_interest"  # Открытый интерес (open_interest)
+    LAST_PRICE = "last_price"  # Последние цены (futures_last_price)
+
+
 # BITMEX: str = "BITMEX"
 # BINGX: str = "BINGX"
 # COINBASE: str = "COINBASE"
@@ -29,9 +29,10 @@ class AdapterException(PyCryptoAPIException):
 
 class APIException(PyCryptoAPIException):
 
-    def __init__(self, code: int, message: Optional[str] = "API Error"):
+    def __init__(self, code: int, message: Optional[str] = "API Error", retry_after: Optional[float] = None):
         super().__init__(message)
         self.code = code
+        self.retry_after = retry_after  # Сколько секунд биржа просит подождать (заголовок Retry-After)
 
     @property
     def is_rate_limit_exception(self) -> bool:
@@ -14,9 +14,10 @@ __all__ = [
 
 import asyncio
 
-import aiohttp
 from loguru import logger
 
+from ..http import get_session
+
 
 class _KcexExchangeInfo:
     logger = logger
@@ -30,16 +31,15 @@ class _KcexExchangeInfo:
         while True:
             try:
                 url = "https://www.kcex.com/fapi/v1/contract/detailV2?client=web"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        data = (await response.json())["data"]
-                        for el in data:
-                            # symbol -> контрактный тикер
-                            # contractSize -> стоимость одного контракта
-                            symbol = el["symbol"]
-                            contract_size = float(el["cs"])
-
-                            self.precisions[symbol] = contract_size
+                async with get_session().get(url) as response:
+                    data = (await response.json())["data"]
+                    for el in data:
+                        # symbol -> контрактный тикер
+                        # contractSize -> стоимость одного контракта
+                        symbol = el["symbol"]
+                        contract_size = float(el["cs"])
+
+                        self.precisions[symbol] = contract_size
 
             except Exception as error:
                 logger.error(f"{type(error)} in async run method for XT: {error}")
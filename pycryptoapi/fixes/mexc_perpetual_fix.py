@@ -7,9 +7,10 @@ __all__ = [
 
 import asyncio
 
-import aiohttp
 from loguru import logger
 
+from ..http import get_session
+
 
 class _MexcExchangeInfo:
     logger = logger
@@ -22,9 +23,8 @@ class _MexcExchangeInfo:
     async def _fetch_contract_sizes(self) -> dict:
         """Fetch contract sizes from MEXC."""
         url = "https://contract.mexc.com/api/v1/contract/detail"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                return await response.json()
+        async with get_session().get(url) as response:
+            return await response.json()
 
     async def _update_contract_sizes_task(self):
         """Background task to periodically update contract sizes."""
@@ -16,9 +16,10 @@ __all__ = [
 import asyncio
 import re
 
-import aiohttp
 from loguru import logger
 
+from ..http import get_session
+
 
 class _OkxExchangeInfo:
     logger = logger
@@ -32,23 +33,22 @@ class _OkxExchangeInfo:
         while True:
             try:
                 url = "https://www.okx.com/api/v5/public/instruments?instType=SWAP"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        data = (await response.json())["data"]
-                        for el in data:
-                            # tick_size = минимальный шаг цены
-                            tick_size = el["tickSz"]
-                            # step_size (теперь ctVal) = стоимость одного контракта
-                            step_size = el["ctVal"]
-
-                            # Определяем точность tick_size
-                            tick_size = list(re.sub("0+$", "", tick_size))
-                            if len(tick_size) == 1:
-                                tick_size = 1
-                            else:
-                                tick_size = len(tick_size) - 2
-
-                            self.precisions[el["instId"]] = [tick_size, float(step_size)]
+                async with get_session().get(url) as response:
+                    data = (await response.json())["data"]
+                    for el in data:
+                        # tick_size = минимальный шаг цены
+                        tick_size = el["tickSz"]
+                        # step_size (теперь ctVal) = стоимость одного контракта
+                        step_size = el["ctVal"]
+
+                        # Определяем точность tick_size
+                        tick_size = list(re.sub("0+$", "", tick_size))
+                        if len(tick_size) == 1:
+                            tick_size = 1
+                        else:
+                            tick_size = len(tick_size) - 2
+
+                        self.precisions[el["instId"]] = [tick_size, float(step_size)]
 
             except Exception as error:
                 logger.error(f"{type(error)} in async run method for OKX: {error}")
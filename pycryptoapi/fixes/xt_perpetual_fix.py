@@ -12,9 +12,10 @@ __all__ = [
 ]
 
 import asyncio
-import aiohttp
 from loguru import logger
 
+from ..http import get_session
+
 
 class _XtExchangeInfo:
     logger = logger
@@ -28,16 +29,15 @@ class _XtExchangeInfo:
         while True:
             try:
                 url = "https://fapi.xt.com/future/market/v3/public/symbol/list"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        data = (await response.json())["result"]["symbols"]
-                        for el in data:
-                            # symbol -> контрактный тикер
-                            # contractSize -> стоимость одного контракта
-                            symbol = el["symbol"]
-                            contract_size = float(el["contractSize"])
-
-                            self.precisions[symbol] = contract_size
+                async with get_session().get(url) as response:
+                    data = (await response.json())["result"]["symbols"]
+                    for el in data:
+                        # symbol -> контрактный тикер
+                        # contractSize -> стоимость одного контракта
+                        symbol = el["symbol"]
+                        contract_size = float(el["contractSize"])
+
+                        self.precisions[symbol] = contract_size
 
             except Exception as error:
                 logger.error(f"{type(error)} in async run method for XT: {error}")
@@ -1,17 +1,23 @@
 __all__ = ["GateClient"]
 
 import time
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, FrozenSet
 
 from typing import Literal
 
 from ..abstract import AbstractClient
+from ..enums import Dataset
 from ..types import JsonLike
 
 
 class GateClient(AbstractClient):
     _BASE_URL: str = "https://api.gateio.ws/api/v4"
 
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS, Dataset.LAST_PRICE}),
+    }
+
     async def klines(self, *args, **kwargs) -> Any:
         raise NotImplementedError()
 
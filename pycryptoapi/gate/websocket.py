@@ -99,7 +99,7 @@ class GateWebsocket(AbstractWebsocket):
                     self._logger.debug(f"Sent pong message: {self._pong_message}")
                 self._last_message_time = time.time()
                 self._logger.trace(f"{self} Received message: {message}")
-                await self._queue.put(orjson.loads(message))
+                await self._put(orjson.loads(message))
             except orjson.JSONDecodeError:
                 if message not in ["ping", "pong"]:
                     self._logger.error(
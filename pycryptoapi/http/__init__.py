@@ -0,0 +1,14 @@
+__all__ = ["TokenBucket", "RateLimiter", "get_rate_limiter", "ResponseCache", "SingleFlight", "RetryPolicy", "SessionManager",
+           "get_session", "is_shared_session", "close_shared_session", "ProxyPool", "ProxyStats",
+           "LatencyWindow", "hedged", "AdaptiveLimiter", "ConcurrencyLimiter", "get_concurrency_limiter",
+           "RequestMetrics", "RequestSample", "EndpointStats", "get_metrics", "ApiKeyPool", ]
+
+from .cache import ResponseCache, SingleFlight
+from .concurrency import AdaptiveLimiter, ConcurrencyLimiter, get_concurrency_limiter
+from .hedge import LatencyWindow, hedged
+from .keys import ApiKeyPool
+from .metrics import RequestMetrics, RequestSample, EndpointStats, get_metrics
+from .proxy import ProxyPool, ProxyStats
+from .retry import RetryPolicy
+from .rate_limit import TokenBucket, RateLimiter, get_rate_limiter
+from .session import SessionManager, get_session, is_shared_session, close_shared_session
@@ -0,0 +1,82 @@
+__all__ = ["ResponseCache", "SingleFlight", ]
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    Кэш ответов с временем жизни записи (TTL) и ограниченным размером.
+
+    При переполнении вытесняется запись, к которой дольше всего не обращались (LRU).
+    Просроченные записи удаляются лениво - при обращении к ним.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """
+        :param maxsize: Максимальное количество записей.
+        """
+        self._maxsize: int = max(maxsize, 1)
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()  # key -> (expires_at, value)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Возвращает значение по ключу или None, если записи нет или она просрочена."""
+        item: Optional[Tuple[float, Any]] = self._data.get(key)
+        if item is None:
+            return None
+        if item[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return item[1]
+
+    def set(self, key: Hashable, value: Any, ttl: int | float) -> None:
+        """Сохраняет значение на ttl секунд."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Объединяет одновременные одинаковые вызовы в один (single-flight).
+
+    Пока вызов с ключом key выполняется, остальные вызовы с тем же ключом ждут его результат, а не
+    запускают свой. Вызов выполняется в отдельной задаче: отмена одного из ожидающих не отменяет
+    запрос для остальных.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Выполняет fn() или присоединяется к уже выполняющемуся вызову с тем же ключом.
+
+        Все ожидающие получают один и тот же объект результата, поэтому fn должна возвращать
+        неизменяемые данные (например, bytes).
+        """
+        task: Optional[asyncio.Task] = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Помечаем исключение обработанным, если все ожидающие были отменены
+
+    def __len__(self) -> int:
+        return len(self._inflight)
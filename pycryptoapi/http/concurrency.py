@@ -0,0 +1,176 @@
+__all__ = ["AdaptiveLimiter", "ConcurrencyLimiter", "get_concurrency_limiter", ]
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class AdaptiveLimiter:
+    """
+    Адаптивное ограничение числа одновременных запросов (AIMD).
+
+    Пока запросы проходят без перегрузки, лимит растет аддитивно: примерно на increase за "окно"
+    (каждый успешный запрос добавляет increase / limit), и только если лимит действительно выбран.
+    При признаках перегрузки лимит умножается на decrease: ответы 429/418, 5xx, таймауты или рост
+    задержки (быстрая EWMA больше медленной в latency_tolerance раз). Уменьшение происходит не чаще
+    одного раза за время ответа, чтобы пачка 429 от уже отправленных запросов не обнулила лимит.
+    """
+
+    __slots__ = ("_limit", "_min_limit", "_max_limit", "_increase", "_decrease", "_latency_tolerance", "_alpha",
+                 "_in_flight", "_waiters", "_latency", "_baseline", "_last_decrease")
+
+    def __init__(
+            self,
+            initial: int = 10,
+            min_limit: int = 1,
+            max_limit: int = 200,
+            increase: float = 1,
+            decrease: float = 0.5,
+            latency_tolerance: float = 2,
+            alpha: float = 0.2,
+    ) -> None:
+        """
+        :param initial: Начальный лимит одновременных запросов.
+        :param min_limit: Минимальный лимит.
+        :param max_limit: Максимальный лимит.
+        :param increase: Прирост лимита за окно запросов без перегрузки.
+        :param decrease: Множитель лимита при перегрузке (0..1).
+        :param latency_tolerance: Во сколько раз задержка может вырасти относительно базовой без уменьшения лимита.
+        :param alpha: Вес нового замера в быстрой EWMA задержки (медленная EWMA в 10 раз инертнее).
+        """
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be in (0, 1)")
+        self._min_limit: float = float(max(min_limit, 1))
+        self._max_limit: float = float(max(max_limit, self._min_limit))
+        self._limit: float = min(max(float(initial), self._min_limit), self._max_limit)
+        self._increase: float = increase
+        self._decrease: float = decrease
+        self._latency_tolerance: float = latency_tolerance
+        self._alpha: float = alpha
+        self._in_flight: int = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latency: Optional[float] = None  # Быстрая EWMA задержки
+        self._baseline: Optional[float] = None  # Медленная EWMA задержки
+        self._last_decrease: float = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        return int(self._max_limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Ждет свободный слот. После запроса обязательно вызвать release() или discard()."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Слот уже выдан, но ожидающий отменен: возвращаем слот следующему
+                self._in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Освобождает слот и корректирует лимит.
+
+        :param latency: Задержка запроса (сек), если ответ получен.
+        :param overloaded: Сервер сообщил о перегрузке (429/418, 5xx, таймаут).
+        """
+        self._in_flight = max(self._in_flight - 1, 0)
+        now: float = time.monotonic()
+
+        if latency is not None:
+            if self._latency is None:
+                self._latency = self._baseline = latency
+            else:
+                self._latency += self._alpha * (latency - self._latency)
+                self._baseline += self._alpha / 10 * (latency - self._baseline)
+            if self._latency > self._baseline * self._latency_tolerance:
+                overloaded = True
+
+        if overloaded:
+            # Не чаще одного раза за время ответа: запросы, отправленные до уменьшения, не считаются
+            if now - self._last_decrease >= (self._latency or 0):
+                self._limit = max(self._limit * self._decrease, self._min_limit)
+                self._last_decrease = now
+        elif self._in_flight + 1 >= self.limit or self._waiters:
+            # Растем, только если лимит выбран полностью
+            self._limit = min(self._limit + self._increase / self._limit, self._max_limit)
+
+        self._wake()
+
+    def discard(self) -> None:
+        """
+        Освобождает слот, не меняя лимит: запрос отменен (например, проигравший дубликат подстраховки)
+        или завершился ошибкой, которая ничего не говорит о нагрузке на сервер.
+        """
+        self._in_flight = max(self._in_flight - 1, 0)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter: asyncio.Future = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def __repr__(self) -> str:
+        return f"<AdaptiveLimiter {self._in_flight}/{self.limit} waiting={len(self._waiters)}>"
+
+
+class ConcurrencyLimiter:
+    """
+    Набор адаптивных ограничителей по хостам бирж.
+
+    Ограничители создаются лениво при первом обращении с параметрами, переданными в конструктор.
+    Общий для процесса экземпляр возвращает get_concurrency_limiter().
+    """
+
+    def __init__(self, **limiter_kwargs) -> None:
+        """
+        :param limiter_kwargs: Параметры AdaptiveLimiter для новых хостов (initial, max_limit и т.д.).
+        """
+        self._limiter_kwargs: Dict = limiter_kwargs
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+        self._max_limit: int = AdaptiveLimiter(**limiter_kwargs).max_limit  # Заодно проверяет параметры
+
+    @property
+    def max_limit(self) -> int:
+        """Максимальный лимит ограничителей: верхняя граница одновременных запросов к одному хосту."""
+        return self._max_limit
+
+    def limiter(self, name: str) -> AdaptiveLimiter:
+        """Возвращает ограничитель с именем name (обычно хост), создавая его при первом обращении."""
+        limiter: Optional[AdaptiveLimiter] = self._limiters.get(name)
+        if limiter is None:
+            limiter = self._limiters[name] = AdaptiveLimiter(**self._limiter_kwargs)
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Возвращает текущий лимит и количество выполняющихся запросов по каждому хосту."""
+        return {
+            name: {"limit": limiter.limit, "in_flight": limiter.in_flight}
+            for name, limiter in self._limiters.items()
+        }
+
+
+_default_concurrency_limiter: ConcurrencyLimiter = ConcurrencyLimiter()
+
+
+def get_concurrency_limiter() -> ConcurrencyLimiter:
+    """Возвращает общий для процесса ConcurrencyLimiter."""
+    return _default_concurrency_limiter
@@ -0,0 +1,69 @@
+__all__ = ["LatencyWindow", "hedged", ]
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyWindow:
+    """Скользящее окно последних задержек для расчета перцентилей."""
+
+    def __init__(self, size: int = 200) -> None:
+        """
+        :param size: Сколько последних замеров хранить.
+        """
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def observe(self, latency: float) -> None:
+        """Добавляет замер (сек)."""
+        self._samples.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Возвращает перцентиль задержки или None, если замеров нет.
+
+        :param q: Перцентиль в диапазоне 0..1 (например, 0.95).
+        """
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+async def hedged(call: Callable[[], Awaitable[T]], delay: float) -> T:
+    """
+    Выполняет запрос с подстраховкой (hedged request).
+
+    Если call() не завершился за delay секунд, запускается дубликат. Возвращается первый успешный
+    результат, второй запрос отменяется. Если первый запрос упал до истечения delay, ошибка
+    пробрасывается сразу (повторы - забота самого call). Ошибка возвращается, только если
+    упали оба запроса.
+
+    :param call: Функция, создающая запрос. Вызывается один или два раза.
+    :param delay: Через сколько секунд отправлять дубликат.
+    """
+    tasks: Set[asyncio.Future] = {asyncio.ensure_future(call())}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return done.pop().result()
+
+        tasks.add(asyncio.ensure_future(call()))
+        error: Optional[BaseException] = None
+        pending: Set[asyncio.Future] = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,72 @@
+__all__ = ["ApiKeyPool", ]
+
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .rate_limit import TokenBucket
+
+
+class ApiKeyPool:
+    """
+    Пул API ключей с собственным лимитом запросов у каждого ключа.
+
+    Каждому ключу соответствует корзина токенов (capacity запросов за period секунд). Запрос получает
+    ключ, у которого раньше всего освободится лимит (при равенстве - с наибольшим запасом токенов),
+    и резервирует на нем токен. Поэтому параллельные запросы распределяются по ключам, а когда лимит
+    исчерпан у всех ключей - ждут ближайший свободный, а не отправляются в 429.
+    """
+
+    def __init__(self, api_keys: Iterable[str], capacity: int | float = 40, period: int | float = 60) -> None:
+        """
+        :param api_keys: API ключи.
+        :param capacity: Лимит запросов одного ключа за period.
+        :param period: Период лимита (сек).
+        """
+        self._buckets: Dict[str, TokenBucket] = {key: TokenBucket(capacity, period) for key in dict.fromkeys(api_keys)}
+        if not self._buckets:
+            raise ValueError("api_keys must not be empty")
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._buckets)
+
+    def reserve(self) -> Tuple[str, float]:
+        """
+        Выбирает ключ и резервирует на нем один запрос без ожидания.
+
+        :return: Ключ и сколько секунд нужно подождать перед запросом.
+        """
+        now: float = time.monotonic()
+        key: str = min(self._buckets, key=lambda k: self._wait(self._buckets[k], now))
+        return key, self._buckets[key].reserve()
+
+    async def acquire(self) -> str:
+        """Ждет ключ с доступным лимитом и возвращает его."""
+        key, wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return key
+
+    def penalize(self, key: str, seconds: int | float) -> None:
+        """Блокирует ключ на seconds секунд (например, после 429 с заголовком Retry-After)."""
+        bucket: Optional[TokenBucket] = self._buckets.get(key)
+        if bucket is not None:
+            bucket.penalize(seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """Возвращает доступные запросы по ключам (отрицательное значение - очередь)."""
+        return {key: bucket.available for key, bucket in self._buckets.items()}
+
+    @staticmethod
+    def _wait(bucket: TokenBucket, now: float) -> Tuple[float, float]:
+        """Ключ сортировки: время ожидания запроса на корзине, затем запас токенов (больше - лучше)."""
+        available: float = bucket.available
+        wait: float = max(0.0, (1 - available) * bucket.period / bucket.capacity)
+        return max(wait, bucket.blocked_until - now), -available
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __repr__(self) -> str:
+        return f"<ApiKeyPool keys={len(self._buckets)}>"
@@ -0,0 +1,202 @@
+__all__ = ["RequestMetrics", "RequestSample", "EndpointStats", "get_metrics", ]
+
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple, TypedDict
+
+# Верхние границы корзин гистограммы задержки (сек). Последняя корзина - все, что дольше.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf"))
+
+
+class RequestSample(TypedDict):
+    """Замер одной попытки HTTP запроса."""
+    method: str
+    host: str
+    path: str
+    status: Optional[int]  # HTTP статус, None - ответ не получен (таймаут, обрыв)
+    attempt: int  # Номер попытки (с 1), больше 1 - повтор
+    latency: float  # Полное время попытки (сек)
+    ttfb: Optional[float]  # Время до получения заголовков ответа (сек)
+    body_time: Optional[float]  # Время чтения и разбора тела ответа (сек)
+    size: Optional[int]  # Размер тела ответа (байт)
+    error: Optional[str]  # Тип ошибки, если попытка не удалась
+    headroom: Optional[float]  # Доля оставшегося лимита запросов (0..1) после попытки
+
+
+class EndpointStats(TypedDict):
+    """Накопленная статистика эндпоинта."""
+    count: int  # Попыток всего
+    errors: int  # Неудачных попыток
+    retries: int  # Повторных попыток
+    statuses: Dict[int, int]  # HTTP статус -> количество
+    latency_avg: float  # Средняя задержка (сек)
+    latency_max: float  # Максимальная задержка (сек)
+    latency_p50: float  # Перцентили по гистограмме (верхняя граница корзины, сек)
+    latency_p90: float
+    latency_p99: float
+    histogram: Dict[float, int]  # Верхняя граница корзины (сек) -> количество
+    ttfb_avg: float  # Среднее время до заголовков (сек)
+    body_avg: float  # Среднее время чтения тела (сек)
+    size_avg: float  # Средний размер ответа (байт)
+    headroom: Optional[float]  # Доля оставшегося лимита после последнего запроса
+
+
+class _Endpoint:
+    """Счетчики одного эндпоинта."""
+
+    __slots__ = ("count", "errors", "retries", "statuses", "histogram", "latency_sum", "latency_max",
+                 "ttfb_sum", "ttfb_count", "body_sum", "body_count", "size_sum", "size_count", "headroom")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.errors: int = 0
+        self.retries: int = 0
+        self.statuses: Dict[int, int] = {}
+        self.histogram: List[int] = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum: float = 0.0
+        self.latency_max: float = 0.0
+        self.ttfb_sum: float = 0.0
+        self.ttfb_count: int = 0
+        self.body_sum: float = 0.0
+        self.body_count: int = 0
+        self.size_sum: int = 0
+        self.size_count: int = 0
+        self.headroom: Optional[float] = None
+
+    def add(self, sample: RequestSample) -> None:
+        self.count += 1
+        if sample["error"] is not None:
+            self.errors += 1
+        if sample["attempt"] > 1:
+            self.retries += 1
+        if sample["status"] is not None:
+            self.statuses[sample["status"]] = self.statuses.get(sample["status"], 0) + 1
+        latency: float = sample["latency"]
+        self.histogram[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        if sample["ttfb"] is not None:
+            self.ttfb_sum += sample["ttfb"]
+            self.ttfb_count += 1
+        if sample["body_time"] is not None:
+            self.body_sum += sample["body_time"]
+            self.body_count += 1
+        if sample["size"] is not None:
+            self.size_sum += sample["size"]
+            self.size_count += 1
+        if sample["headroom"] is not None:
+            self.headroom = sample["headroom"]
+
+    def percentile(self, q: float) -> float:
+        target: float = q * self.count
+        seen: int = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.histogram):
+            seen += count
+            if seen >= target:
+                return bound if bound != float("inf") else self.latency_max
+        return self.latency_max
+
+    def stats(self) -> EndpointStats:
+        return EndpointStats(
+            count=self.count,
+            errors=self.errors,
+            retries=self.retries,
+            statuses=dict(self.statuses),
+            latency_avg=self.latency_sum / self.count if self.count else 0.0,
+            latency_max=self.latency_max,
+            latency_p50=self.percentile(0.5),
+            latency_p90=self.percentile(0.9),
+            latency_p99=self.percentile(0.99),
+            histogram=dict(zip(LATENCY_BUCKETS, self.histogram)),
+            ttfb_avg=self.ttfb_sum / self.ttfb_count if self.ttfb_count else 0.0,
+            body_avg=self.body_sum / self.body_count if self.body_count else 0.0,
+            size_avg=self.size_sum / self.size_count if self.size_count else 0.0,
+            headroom=self.headroom,
+        )
+
+
+class RequestMetrics:
+    """
+    Метрики HTTP запросов по хостам и эндпоинтам.
+
+    Каждая попытка запроса (включая повторы) обновляет счетчики эндпоинта: O(1) операций без
+    блокировок и без хранения отдельных замеров. Хуки вызываются с RequestSample каждой попытки и
+    позволяют передавать замеры в систему мониторинга (Prometheus, StatsD и т.д.). Хук должен быть
+    быстрым: он выполняется в event loop на каждом запросе. Исключения в хуках игнорируются.
+
+    По умолчанию все клиенты процесса пишут в общий экземпляр (см. get_metrics).
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[Tuple[str, str], _Endpoint] = {}
+        self._hooks: List[Callable[[RequestSample], None]] = []
+
+    def add_hook(self, hook: Callable[[RequestSample], None]) -> None:
+        """Добавляет функцию, которая получает замер каждой попытки запроса."""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestSample], None]) -> None:
+        """Удаляет хук, добавленный через add_hook."""
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    def record(self, sample: RequestSample) -> None:
+        """Учитывает замер попытки запроса."""
+        key: Tuple[str, str] = (sample["host"], sample["path"])
+        endpoint: Optional[_Endpoint] = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _Endpoint()
+        endpoint.add(sample)
+        for hook in self._hooks:
+            try:
+                hook(sample)
+            except Exception:  # Мониторинг не должен ломать запросы
+                pass
+
+    def stats(self, host: Optional[str] = None) -> Dict[str, EndpointStats]:
+        """
+        Возвращает статистику по эндпоинтам (ключ - host + path).
+
+        :param host: Вернуть только эндпоинты этого хоста.
+        """
+        return {
+            f"{endpoint_host}{path}": endpoint.stats()
+            for (endpoint_host, path), endpoint in self._endpoints.items()
+            if host is None or endpoint_host == host
+        }
+
+    def host_stats(self) -> Dict[str, EndpointStats]:
+        """Возвращает статистику, просуммированную по хостам."""
+        hosts: Dict[str, _Endpoint] = {}
+        for (host, _), endpoint in self._endpoints.items():
+            total: Optional[_Endpoint] = hosts.get(host)
+            if total is None:
+                total = hosts[host] = _Endpoint()
+            total.count += endpoint.count
+            total.errors += endpoint.errors
+            total.retries += endpoint.retries
+            for status, count in endpoint.statuses.items():
+                total.statuses[status] = total.statuses.get(status, 0) + count
+            total.histogram = [a + b for a, b in zip(total.histogram, endpoint.histogram)]
+            total.latency_sum += endpoint.latency_sum
+            total.latency_max = max(total.latency_max, endpoint.latency_max)
+            total.ttfb_sum += endpoint.ttfb_sum
+            total.ttfb_count += endpoint.ttfb_count
+            total.body_sum += endpoint.body_sum
+            total.body_count += endpoint.body_count
+            total.size_sum += endpoint.size_sum
+            total.size_count += endpoint.size_count
+            if endpoint.headroom is not None:
+                total.headroom = endpoint.headroom if total.headroom is None else min(total.headroom, endpoint.headroom)
+        return {host: total.stats() for host, total in hosts.items()}
+
+    def reset(self) -> None:
+        """Сбрасывает накопленную статистику."""
+        self._endpoints.clear()
+
+
+_default_metrics: RequestMetrics = RequestMetrics()
+
+
+def get_metrics() -> RequestMetrics:
+    """Возвращает общий для процесса RequestMetrics."""
+    return _default_metrics
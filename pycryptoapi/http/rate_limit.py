@@ -0,0 +1,136 @@
+__all__ = ["TokenBucket", "RateLimiter", "get_rate_limiter", ]
+
+import asyncio
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class TokenBucket:
+    """
+    Корзина токенов (token bucket) для ограничения частоты запросов.
+
+    Токены восстанавливаются равномерно: capacity токенов за period секунд. Каждый запрос списывает
+    свой вес. Если токенов не хватает, запрос резервирует их "в долг" и ждет, пока долг не погасится.
+    Резервирование происходит сразу при вызове acquire(), поэтому запросы обслуживаются строго в
+    порядке поступления (FIFO), а тяжелый запрос не голодает за потоком легких.
+    """
+
+    __slots__ = ("_capacity", "_period", "_rate", "_tokens", "_updated", "_blocked_until")
+
+    def __init__(self, capacity: int | float, period: int | float) -> None:
+        """
+        :param capacity: Вместимость корзины (например, лимит веса за минуту).
+        :param period: Период восстановления полной корзины в секундах.
+        """
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self._capacity: float = float(capacity)
+        self._period: float = float(period)
+        self._rate: float = self._capacity / self._period  # Токенов в секунду
+        self._tokens: float = self._capacity
+        self._updated: float = time.monotonic()
+        self._blocked_until: float = 0.0
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    @property
+    def period(self) -> float:
+        return self._period
+
+    @property
+    def blocked_until(self) -> float:
+        """Момент (time.monotonic()), до которого корзина заблокирована через penalize()."""
+        return self._blocked_until
+
+    @property
+    def available(self) -> float:
+        """Текущее количество доступных токенов (отрицательное значение - долг очереди)."""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self, weight: int | float = 1) -> float:
+        """
+        Резервирует weight токенов без ожидания.
+
+        :return: Сколько секунд нужно подождать, прежде чем выполнять запрос.
+        """
+        now: float = time.monotonic()
+        self._refill(now)
+        self._tokens -= min(float(weight), self._capacity)
+        wait: float = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        return max(wait, self._blocked_until - now)
+
+    async def acquire(self, weight: int | float = 1) -> None:
+        """Ждет, пока в корзине не будет weight токенов, и списывает их."""
+        wait: float = self.reserve(weight)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def reconcile(self, used: int | float) -> None:
+        """
+        Сверяет локальный счетчик с использованием, которое сообщила биржа (например, x-mbx-used-weight-1m).
+
+        Локальная оценка только уменьшается: если биржа насчитала больше (другие процессы с того же IP,
+        расхождение окон), доступные токены срезаются до capacity - used.
+        """
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, self._capacity - float(used))
+
+    def penalize(self, seconds: int | float) -> None:
+        """Блокирует корзину на seconds секунд (например, после 429 с заголовком Retry-After)."""
+        now: float = time.monotonic()
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+        self._blocked_until = max(self._blocked_until, now + float(seconds))
+
+    def __repr__(self) -> str:
+        return f"<TokenBucket {self.available:.1f}/{self._capacity:g} per {self._period:g}s>"
+
+
+class RateLimiter:
+    """
+    Набор именованных корзин токенов.
+
+    Корзины создаются лениво при первом обращении. Лимиты бирж считаются по IP, поэтому по умолчанию
+    все клиенты процесса используют один общий RateLimiter (см. get_rate_limiter).
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, name: str, capacity: int | float, period: int | float) -> TokenBucket:
+        """Возвращает корзину с именем name, создавая ее при первом обращении."""
+        bucket: Optional[TokenBucket] = self._buckets.get(name)
+        if bucket is None:
+            bucket = self._buckets[name] = TokenBucket(capacity, period)
+        return bucket
+
+    async def acquire(self, buckets: Iterable[Tuple[TokenBucket, int | float]]) -> None:
+        """
+        Резервирует токены сразу во всех корзинах и ждет самую долгую из них.
+
+        :param buckets: Пары (корзина, вес запроса).
+        """
+        wait: float = 0.0
+        for bucket, weight in buckets:
+            wait = max(wait, bucket.reserve(weight))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def stats(self) -> Dict[str, float]:
+        """Возвращает количество доступных токенов по каждой корзине."""
+        return {name: bucket.available for name, bucket in self._buckets.items()}
+
+
+_default_rate_limiter: RateLimiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Возвращает общий для процесса RateLimiter."""
+    return _default_rate_limiter
@@ -0,0 +1,109 @@
+__all__ = ["RetryPolicy", ]
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, FrozenSet, Optional
+
+import aiohttp
+
+from ..exceptions import APIException
+
+
+class RetryPolicy:
+    """
+    Политика повторных попыток HTTP запросов.
+
+    Повторяются только временные ошибки: таймауты, обрывы соединения и ответы со статусами из
+    retry_statuses (429, 418, 5xx шлюзов). Задержка растет экспоненциально со случайным разбросом
+    (full jitter), чтобы клиенты не повторяли запросы синхронно. Если биржа прислала Retry-After,
+    задержка не меньше него. Общее время на запрос с повторами ограничено total_timeout.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            base_delay: float = 0.1,
+            max_delay: float = 10,
+            multiplier: float = 2,
+            jitter: bool = True,
+            total_timeout: Optional[float] = 60,
+            retry_statuses: FrozenSet[int] = frozenset({418, 429, 500, 502, 503, 504}),
+    ) -> None:
+        """
+        :param max_attempts: Максимальное количество попыток (включая первую).
+        :param base_delay: Задержка перед первым повтором (сек).
+        :param max_delay: Максимальная задержка между попытками (сек), не считая Retry-After.
+        :param multiplier: Множитель роста задержки.
+        :param jitter: Случайная задержка в диапазоне [0, backoff] вместо фиксированной.
+        :param total_timeout: Бюджет времени на все попытки (сек). None - без ограничения.
+        :param retry_statuses: HTTP статусы, при которых запрос повторяется.
+        """
+        self.max_attempts: int = max(max_attempts, 1)
+        self.base_delay: float = max(base_delay, 0)
+        self.max_delay: float = max_delay
+        self.multiplier: float = multiplier
+        self.jitter: bool = jitter
+        self.total_timeout: Optional[float] = total_timeout
+        self.retry_statuses: FrozenSet[int] = retry_statuses
+
+    def replace(self, **changes: Any) -> "RetryPolicy":
+        """Возвращает копию политики с измененными параметрами, например replace(max_attempts=1)."""
+        params: Dict[str, Any] = {
+            "max_attempts": self.max_attempts,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "multiplier": self.multiplier,
+            "jitter": self.jitter,
+            "total_timeout": self.total_timeout,
+            "retry_statuses": self.retry_statuses,
+        }
+        return RetryPolicy(**{**params, **changes})
+
+    def deadline(self) -> Optional[float]:
+        """Возвращает момент (time.monotonic), после которого повторять запрос нельзя."""
+        return None if self.total_timeout is None else time.monotonic() + self.total_timeout
+
+    def status(self, error: BaseException) -> Optional[int]:
+        """Возвращает HTTP статус ошибки, если он есть."""
+        if isinstance(error, APIException):
+            return error.code
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status
+        return None
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Возвращает True, если ошибка временная и запрос имеет смысл повторить."""
+        status: Optional[int] = self.status(error)
+        if status is not None:
+            return status in self.retry_statuses
+        # Таймауты, обрывы соединения (ServerDisconnectedError, ClientOSError: connection reset и т.д.)
+        return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError, asyncio.TimeoutError))
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """Возвращает задержку из Retry-After (сек), если биржа ее прислала."""
+        if isinstance(error, APIException):
+            return error.retry_after
+        if isinstance(error, aiohttp.ClientResponseError) and error.headers:
+            try:
+                return float(error.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                return None
+        return None
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Возвращает задержку перед следующей попыткой.
+
+        :param attempt: Номер неудачной попытки (с 1).
+        :param retry_after: Задержка, которую запросила биржа.
+        """
+        backoff: float = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return max(backoff, retry_after or 0)
+
+    def __repr__(self) -> str:
+        return (f"<RetryPolicy attempts={self.max_attempts} base={self.base_delay}s max={self.max_delay}s "
+                f"budget={self.total_timeout}s>")
@@ -0,0 +1,87 @@
+__all__ = ["SessionManager", "get_session", "is_shared_session", "close_shared_session", ]
+
+import asyncio
+import weakref
+from typing import Optional
+
+import aiohttp
+
+
+class SessionManager:
+    """
+    Общая aiohttp.ClientSession с настроенным пулом соединений.
+
+    Все клиенты и фоновые задачи fixes, которым не передали свою сессию, используют одну сессию
+    на процесс. Соединения с биржами переиспользуются (keep-alive), поэтому TLS рукопожатие и
+    DNS запрос выполняются один раз на соединение, а не на каждый запрос или клиент.
+
+    Сессия создается лениво при первом обращении внутри запущенного event loop и пересоздается,
+    если была закрыта. Сессия привязана к своему event loop, поэтому у каждого event loop своя сессия:
+    сессии других event loop (например, в других потоках) не трогаются.
+    """
+
+    def __init__(
+            self,
+            limit: int = 200,
+            limit_per_host: int = 50,
+            ttl_dns_cache: int = 300,
+            keepalive_timeout: float = 60,
+            timeout: Optional[aiohttp.ClientTimeout] = None,
+    ) -> None:
+        """
+        :param limit: Максимальное количество одновременных соединений.
+        :param limit_per_host: Максимальное количество одновременных соединений к одному хосту.
+        :param ttl_dns_cache: Время жизни кэша DNS (сек).
+        :param keepalive_timeout: Сколько секунд держать неиспользуемое соединение открытым.
+        :param timeout: Таймауты запросов. По умолчанию 30 секунд на запрос.
+        """
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._ttl_dns_cache: int = ttl_dns_cache
+        self._keepalive_timeout: float = keepalive_timeout
+        self._timeout: aiohttp.ClientTimeout = timeout or aiohttp.ClientTimeout(total=30)
+        # Сессия каждого event loop. Запись удаляется вместе с event loop
+        self._sessions: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession] = \
+            weakref.WeakKeyDictionary()
+
+    def get(self) -> aiohttp.ClientSession:
+        """Возвращает общую сессию текущего event loop, создавая ее при необходимости. Вызывать внутри event loop."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        session: Optional[aiohttp.ClientSession] = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=self._ttl_dns_cache,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            session = self._sessions[loop] = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+        return session
+
+    def is_shared(self, session: aiohttp.ClientSession) -> bool:
+        """Возвращает True, если session - общая сессия этого менеджера (любого event loop)."""
+        return any(session is shared for shared in self._sessions.values())
+
+    async def close(self) -> None:
+        """Закрывает общую сессию текущего event loop (например, при завершении приложения)."""
+        session: Optional[aiohttp.ClientSession] = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+_default_session_manager: SessionManager = SessionManager()
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Возвращает общую для процесса сессию."""
+    return _default_session_manager.get()
+
+
+def is_shared_session(session: aiohttp.ClientSession) -> bool:
+    """Возвращает True, если session - общая для процесса сессия."""
+    return _default_session_manager.is_shared(session)
+
+
+async def close_shared_session() -> None:
+    """Закрывает общую для процесса сессию."""
+    await _default_session_manager.close()
@@ -1,5 +1,7 @@
-__all__ = ["HyperliquidClient", "HyperliquidSocketManager", "HyperliquidWebsocket", "HyperliquidAdapter", ]
+__all__ = ["HyperliquidClient", "HyperliquidSocketManager", "HyperliquidWebsocket", "HyperliquidAdapter",
+           "HyperliquidMarketSnapshot", "HyperliquidSnapshotProvider", ]
 
 from .adapter import HyperliquidAdapter
 from .client import HyperliquidClient
+from .snapshot import HyperliquidMarketSnapshot, HyperliquidSnapshotProvider
 from .websocket import HyperliquidWebsocket, HyperliquidSocketManager
@@ -1,25 +1,27 @@
-import time
 from typing import Any, Dict, List
 
 from ..abstract import AbstractAdapter
 from ..types import TickerDailyItem, OpenInterestDict, KlineDict, AggTradeDict, DepthDict, LiquidationDict
 from ..exceptions import AdapterException
+from .snapshot import HyperliquidMarketSnapshot
 
 
 class HyperliquidAdapter(AbstractAdapter):
 
     @staticmethod
-    def futures_last_price(raw_data: Any) -> Any:
+    def _snapshot(raw_data: Any | HyperliquidMarketSnapshot) -> HyperliquidMarketSnapshot:
+        """Возвращает снимок как есть или разбирает сырой ответ metaAndAssetCtxs."""
+        if isinstance(raw_data, HyperliquidMarketSnapshot):
+            return raw_data
+        return HyperliquidMarketSnapshot.from_raw(raw_data)
+
+    @staticmethod
+    def futures_last_price(raw_data: Any | HyperliquidMarketSnapshot) -> Dict[str, float]:
         """
-        Возвращает последнюю цену по фьючерсам.
-        raw_data = data[1] из metaAndAssetCtxs (список метрик).
+        Возвращает последнюю цену (markPx) по фьючерсам.
+        raw_data - ответ metaAndAssetCtxs или HyperliquidMarketSnapshot.
         """
-        try:
-            universe = raw_data[0]["universe"]
-            stats = raw_data[1]
-            return {asset["name"]: float(stat["markPx"]) for asset, stat in zip(universe, stats)}
-        except Exception as e:
-            raise AdapterException(f"Error adapting futures last price: {e}")
+        return HyperliquidAdapter._snapshot(raw_data).futures_last_price()
 
     @staticmethod
     def liquidation_message(raw_msg: Any) -> List[LiquidationDict]:
@@ -42,24 +44,19 @@ class HyperliquidAdapter(AbstractAdapter):
         raise NotImplementedError()
 
     @staticmethod
-    def open_interest(raw_data: Any) -> OpenInterestDict:
+    def open_interest(raw_data: Any | HyperliquidMarketSnapshot) -> OpenInterestDict:
         """
         Возвращает словарь: {symbol: {"t": timestamp, "v": oi}}
         """
-        try:
-            universe = raw_data[0]["universe"]
-            stats = raw_data[1]
-
-            return {
-                asset["name"]: {"t": int(time.time() * 1000), "v": float(stat["openInterest"])}
-                for asset, stat in zip(universe, stats)
-            }
-        except Exception as e:
-            raise AdapterException(f"Error adapting open interest: {e}")
+        return HyperliquidAdapter._snapshot(raw_data).open_interest()
 
     @staticmethod
-    def funding_rate(raw_data: Any, **kwargs) -> Dict[str, float]:
-        raise NotImplementedError()
+    def funding_rate(raw_data: Any | HyperliquidMarketSnapshot, **kwargs) -> Dict[str, float]:
+        """
+        Возвращает словарь: {symbol: funding rate в процентах}.
+        Hyperliquid начисляет финансирование каждый час, значение - часовая ставка.
+        """
+        return HyperliquidAdapter._snapshot(raw_data).funding_rate()
 
     @staticmethod
     def aggtrades_message(raw_msg: Any) -> List[AggTradeDict]:
@@ -77,35 +74,25 @@ class HyperliquidAdapter(AbstractAdapter):
             raise AdapterException(f"Error adapting aggtrades message: {e}")
 
     @staticmethod
-    def futures_ticker_24h(raw_data: Any, only_usdt: bool = True) -> Dict[str, TickerDailyItem]:
+    def futures_ticker_24h(
+            raw_data: Any | HyperliquidMarketSnapshot,
+            only_usdt: bool = True,
+    ) -> Dict[str, TickerDailyItem]:
         """
         Возвращает словарь вида:
         { "BTC": {"p": ..., "v": ...}, "ETH": {...}, ... }
         где p — изменение цены % за 24ч, v — дневной объём
         """
-        try:
-            universe = raw_data[0]["universe"]
-            stats = raw_data[1]
-
-            result: Dict[str, TickerDailyItem] = {}
-            for asset, stat in zip(universe, stats):
-                name = asset["name"]
-                mark = float(stat["markPx"])
-                prev = float(stat["prevDayPx"])
-                p = ((mark - prev) / prev) * 100 if prev != 0 else 0.0
-                v = float(stat["dayNtlVlm"])
-                result[name] = {"p": round(p, 2), "v": round(v, 2)}
-
-            return result
-        except Exception as e:
-            raise AdapterException(f"Error adapting futures tickers 24h: {e}")
+        return HyperliquidAdapter._snapshot(raw_data).futures_ticker_24h()
 
     @staticmethod
     def tickers(raw_data: Any, only_usdt: bool = True) -> List[str]:
         pass
 
     @staticmethod
-    def futures_tickers(raw_data: Any, only_usdt: bool = True) -> List[str]:
+    def futures_tickers(raw_data: Any | HyperliquidMarketSnapshot, only_usdt: bool = True) -> List[str]:
+        if isinstance(raw_data, HyperliquidMarketSnapshot):
+            return raw_data.futures_tickers()
         try:
             return [item["name"] for item in raw_data[0]["universe"]]
         except Exception as e:
@@ -1,6 +1,7 @@
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 from ..abstract import AbstractClient
+from ..enums import Dataset
 
 
 class HyperliquidClient(AbstractClient):
@@ -11,6 +12,29 @@ class HyperliquidClient(AbstractClient):
         "Accept": "application/json",
     }
 
+    # open_interest() без аргументов отдает открытый интерес по всем тикерам
+    _OPEN_INTEREST_BULK: bool = True
+
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS, Dataset.FUNDING_RATE, Dataset.OPEN_INTEREST, Dataset.LAST_PRICE}),
+    }
+
+    # Info эндпоинт принимает только POST и ничего не изменяет, поэтому одинаковые запросы объединяются
+    _COALESCE_METHODS: FrozenSet[str] = frozenset({"GET", "POST"})
+
+    # Лимит на IP: 1200 единиц веса в минуту
+    _RATE_LIMITS: Dict[str, Tuple[int, float]] = {"*": (1200, 60)}
+
+    def _request_weight(
+            self,
+            method: str,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Большинство info запросов (в т.ч. metaAndAssetCtxs) весят 20."""
+        return 20
+
     async def futures_last_price(self, *args, **kwargs) -> Any:
         return await self.futures_ticker()
 
@@ -32,8 +56,7 @@ class HyperliquidClient(AbstractClient):
     async def futures_ticker(self) -> Dict:
         """https://hyperliquid.gitbook.io/hyperliquid-docs/for-developers/api/info-endpoint/perpetuals#retrieve-perpetuals-asset-contexts-includes-mark-price-current-funding-open-interest-etc"""
         json_data = {"type": "metaAndAssetCtxs"}
-        async with self._session.post(self._BASE_URL, json=json_data, headers=self._BASE_HEADERS) as response:
-            return await response.json()
+        return await self._make_request(method="POST", url=self._BASE_URL, data=json_data, headers=self._BASE_HEADERS)
 
     async def ticker(self, *args, **kwargs) -> Any:
         raise NotImplementedError()
@@ -0,0 +1,154 @@
+__all__ = ["HyperliquidMarketSnapshot", "HyperliquidSnapshotProvider", ]
+
+import asyncio
+import math
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+from ..exceptions import AdapterException
+from ..types import OpenInterestDict, OpenInterestItem, TickerDailyItem
+
+_NAN: float = float("nan")
+
+
+class HyperliquidMarketSnapshot:
+    """
+    Разобранный ответ metaAndAssetCtxs Hyperliquid.
+
+    Ответ разбирается один раз в выровненные массивы (name, markPx, prevDayPx, dayNtlVlm, openInterest,
+    funding): i-й элемент каждого массива относится к тикеру names[i]. Унифицированные представления
+    (тикеры за 24ч, открытый интерес, последние цены, ставки финансирования) строятся из массивов
+    без повторного разбора сырого ответа. Адаптер HyperliquidAdapter принимает снимок вместо сырого ответа.
+
+    Отсутствующие значения (нет поля или null) - nan. Представление пропускает тикеры, у которых
+    нет нужных ему значений, поэтому неполные данные одного тикера не ломают снимок целиком.
+    """
+
+    __slots__ = ("t", "names", "mark_px", "prev_day_px", "day_ntl_vlm", "oi", "funding")
+
+    def __init__(
+            self,
+            t: int,
+            names: List[str],
+            mark_px: array,
+            prev_day_px: array,
+            day_ntl_vlm: array,
+            oi: array,
+            funding: array,
+    ) -> None:
+        self.t: int = t  # Время получения ответа (мс)
+        self.names: List[str] = names
+        self.mark_px: array = mark_px
+        self.prev_day_px: array = prev_day_px
+        self.day_ntl_vlm: array = day_ntl_vlm
+        self.oi: array = oi
+        self.funding: array = funding
+
+    @classmethod
+    def from_raw(cls, raw_data: Any, t: Optional[int] = None) -> "HyperliquidMarketSnapshot":
+        """
+        Разбирает сырой ответ metaAndAssetCtxs: [{"universe": [...]}, [asset_ctx, ...]].
+
+        :param raw_data: Сырой ответ.
+        :param t: Время получения ответа (мс). По умолчанию текущее.
+        """
+        try:
+            universe: List[Dict[str, Any]] = raw_data[0]["universe"]
+            stats: List[Dict[str, Any]] = raw_data[1]
+            names: List[str] = []
+            mark_px, prev_day_px, day_ntl_vlm, oi, funding = (array("d") for _ in range(5))
+            for asset, stat in zip(universe, stats):
+                names.append(asset["name"])
+                mark_px.append(_float(stat.get("markPx")))
+                prev_day_px.append(_float(stat.get("prevDayPx")))
+                day_ntl_vlm.append(_float(stat.get("dayNtlVlm")))
+                oi.append(_float(stat.get("openInterest")))
+                funding.append(_float(stat.get("funding")))
+        except Exception as e:
+            raise AdapterException(f"Error parsing metaAndAssetCtxs: {e}")
+        return cls(
+            t=int(time.time() * 1000) if t is None else t,
+            names=names,
+            mark_px=mark_px,
+            prev_day_px=prev_day_px,
+            day_ntl_vlm=day_ntl_vlm,
+            oi=oi,
+            funding=funding,
+        )
+
+    def futures_tickers(self) -> List[str]:
+        return list(self.names)
+
+    def futures_ticker_24h(self) -> Dict[str, TickerDailyItem]:
+        """Изменение цены (%) и объем (USD) за 24ч."""
+        result: Dict[str, TickerDailyItem] = {}
+        for name, mark, prev, volume in zip(self.names, self.mark_px, self.prev_day_px, self.day_ntl_vlm):
+            if math.isnan(mark) or math.isnan(prev) or math.isnan(volume):
+                continue
+            p: float = ((mark - prev) / prev) * 100 if prev != 0 else 0.0
+            result[name] = TickerDailyItem(p=round(p, 2), v=round(volume, 2))
+        return result
+
+    def open_interest(self) -> OpenInterestDict:
+        """Открытый интерес (монеты) на момент получения ответа."""
+        return {name: OpenInterestItem(t=self.t, v=oi) for name, oi in zip(self.names, self.oi) if not math.isnan(oi)}
+
+    def futures_last_price(self) -> Dict[str, float]:
+        """Mark price по тикерам."""
+        return {name: mark for name, mark in zip(self.names, self.mark_px) if not math.isnan(mark)}
+
+    def funding_rate(self) -> Dict[str, float]:
+        """Часовая ставка финансирования в процентах."""
+        return {name: rate * 100 for name, rate in zip(self.names, self.funding) if not math.isnan(rate)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"<HyperliquidMarketSnapshot tickers={len(self.names)} t={self.t}>"
+
+
+class HyperliquidSnapshotProvider:
+    """
+    Источник HyperliquidMarketSnapshot с временем жизни.
+
+    Ответ metaAndAssetCtxs запрашивается и разбирается не чаще одного раза за ttl секунд. Одновременные
+    вызовы get() во время обновления ждут один и тот же запрос.
+
+    Пример:
+        provider = HyperliquidSnapshotProvider(await HyperliquidClient.create(), ttl=1)
+        snapshot = await provider.get()
+        HyperliquidAdapter.futures_ticker_24h(snapshot)
+        HyperliquidAdapter.open_interest(snapshot)
+    """
+
+    def __init__(self, client: Any, ttl: float = 1) -> None:
+        """
+        :param client: HyperliquidClient.
+        :param ttl: Время жизни снимка (сек).
+        """
+        self._client = client
+        self._ttl: float = ttl
+        self._snapshot: Optional[HyperliquidMarketSnapshot] = None
+        self._expires_at: float = 0.0
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def get(self) -> HyperliquidMarketSnapshot:
+        """Возвращает актуальный снимок, обновляя его при необходимости."""
+        if self._snapshot is not None and time.monotonic() < self._expires_at:
+            return self._snapshot
+        async with self._lock:
+            # Пока ждали блокировку, снимок мог обновить другой вызов
+            if self._snapshot is None or time.monotonic() >= self._expires_at:
+                raw_data = await self._client.futures_ticker()
+                self._snapshot = HyperliquidMarketSnapshot.from_raw(raw_data)
+                self._expires_at = time.monotonic() + self._ttl
+        return self._snapshot
+
+    def __repr__(self) -> str:
+        return f"<HyperliquidSnapshotProvider ttl={self._ttl}s snapshot={self._snapshot!r}>"
+
+
+def _float(value: Any) -> float:
+    return _NAN if value is None else float(value)
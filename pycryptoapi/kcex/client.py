@@ -1,9 +1,18 @@
-from typing import Any
+from typing import Any, Dict, FrozenSet
 
 from ..abstract import AbstractClient
+from ..enums import Dataset
 
 
 class KcexClient(AbstractClient):
+    # open_interest() без аргументов отдает открытый интерес по всем тикерам
+    _OPEN_INTEREST_BULK: bool = True
+
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS, Dataset.FUNDING_RATE, Dataset.OPEN_INTEREST, Dataset.LAST_PRICE}),
+    }
+
     async def futures_last_price(self) -> Any:
         return await self.futures_ticker()
 
@@ -23,9 +32,8 @@ class KcexClient(AbstractClient):
         return await self.futures_ticker()
 
     async def futures_ticker(self, *args, **kwargs) -> Any:
-        url = "https://www.kcex.com/fapi/v1/contract/ticker?"
-        async with self._session.get(url) as response:
-            return await response.json()
+        url = "https://www.kcex.com/fapi/v1/contract/ticker"
+        return await self._make_request(method="GET", url=url)
 
     async def ticker(self, *args, **kwargs) -> Any:
         raise NotImplementedError()
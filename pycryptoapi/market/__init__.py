@@ -0,0 +1,4 @@
+__all__ = ["MarketSnapshotAggregator", "plan_endpoints", "derive", ]
+
+from .aggregator import MarketSnapshotAggregator
+from .planner import derive, plan_endpoints
@@ -0,0 +1,169 @@
+__all__ = ["MarketSnapshotAggregator", ]
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import loguru
+from loguru._logger import Logger  # noqa
+
+from ..abstract import AbstractAdapter, AbstractClient
+from ..enums import Dataset, Exchange
+from ..fixes import kcex_perpetual_open_interest_fix, mexc_perpetual_open_interest_fix, \
+    mexc_perpetual_ticker_daily_fix, okx_perpetual_ticker_daily_fix
+from ..hyperliquid import HyperliquidMarketSnapshot
+from ..mappers import ADAPTERS_MAPPER, CLIENTS_MAPPER
+from ..types import EndpointPlan, ExchangeSnapshot, MarketSnapshot
+from .planner import derive, plan_endpoints
+
+# Наборы данных снимка по умолчанию
+DATASETS: Tuple[Dataset, ...] = (Dataset.TICKERS, Dataset.FUNDING_RATE, Dataset.OPEN_INTEREST)
+
+# Исправления сырых ответов (контракты вместо монет): биржа -> набор данных -> функция из pycryptoapi.fixes.
+# Исправления одной биржи изменяют разные поля ответа, поэтому их можно применять к общему ответу.
+_FIXES: Dict[Exchange, Dict[Dataset, Callable[[Any], Any]]] = {
+    Exchange.OKX: {Dataset.TICKERS: okx_perpetual_ticker_daily_fix},
+    Exchange.MEXC: {Dataset.TICKERS: mexc_perpetual_ticker_daily_fix,
+                    Dataset.OPEN_INTEREST: mexc_perpetual_open_interest_fix},
+    Exchange.KCEX: {Dataset.OPEN_INTEREST: kcex_perpetual_open_interest_fix},
+}
+
+
+class MarketSnapshotAggregator:
+    """
+    Снимок рынка по всем биржам: тикеры за 24ч, ставки финансирования, открытый интерес и последние цены.
+
+    Для каждой биржи планировщик (plan_endpoints) выбирает минимальный набор запросов, из ответов
+    которых получаются все нужные наборы данных: например, Bybit и Hyperliquid отдают все одним запросом.
+    Биржи и запросы выполняются параллельно. Каждая биржа ограничена бюджетом времени timeout:
+    запросы, не успевшие выполниться, отменяются и попадают в errors, поэтому медленная биржа
+    не задерживает снимок. При ошибке в снимке остаются прошлые данные, их свежесть видна по updated.
+
+    Наборы данных, которые биржа не отдает по всем тикерам одним запросом, не запрашиваются.
+
+    Пример:
+        aggregator = MarketSnapshotAggregator(timeout=3)
+        snapshot = await aggregator.snapshot()
+        snapshot["exchanges"][Exchange.BINANCE]["tickers"]["BTCUSDT"]
+    """
+
+    def __init__(
+            self,
+            exchanges: Optional[Iterable[Exchange]] = None,
+            clients: Optional[Dict[Exchange, AbstractClient]] = None,
+            datasets: Iterable[Dataset] = DATASETS,
+            timeout: float = 5,
+            apply_fixes: bool = False,
+            logger: logging.Logger | Logger = loguru.logger,
+    ) -> None:
+        """
+        :param exchanges: Биржи снимка. По умолчанию все биржи из CLIENTS_MAPPER.
+        :param clients: Готовые клиенты бирж. Для остальных бирж клиенты создаются с настройками по умолчанию.
+        :param datasets: Наборы данных снимка.
+        :param timeout: Бюджет времени на одну биржу (сек).
+        :param apply_fixes: Применять исправления pycryptoapi.fixes к ответам OKX, MEXC и KCEX.
+            Перед использованием нужно вызвать init_fixes для этих бирж.
+        :param logger: Логгер.
+        """
+        self._clients: Dict[Exchange, AbstractClient] = dict(clients or {})
+        for exchange in (exchanges or CLIENTS_MAPPER):
+            if exchange not in self._clients:
+                self._clients[exchange] = CLIENTS_MAPPER[exchange](logger=logger)
+        self._datasets: Tuple[Dataset, ...] = tuple(Dataset(dataset) for dataset in datasets)
+        self._timeout: float = timeout
+        self._apply_fixes: bool = apply_fixes
+        self._logger: logging.Logger | Logger = logger
+        self._plans: Dict[Exchange, EndpointPlan] = {
+            exchange: plan_endpoints(client, self._datasets) for exchange, client in self._clients.items()
+        }
+        self._snapshots: Dict[Exchange, ExchangeSnapshot] = {
+            exchange: ExchangeSnapshot(
+                tickers={}, funding_rate={}, open_interest={}, last_price={}, updated={}, errors={}, latency=0)
+            for exchange in self._clients
+        }
+
+    def plans(self) -> Dict[Exchange, EndpointPlan]:
+        """Возвращает план запросов по биржам."""
+        return dict(self._plans)
+
+    def _adapt(self, exchange: Exchange, datasets: List[Dataset], raw_data: Any) -> None:
+        """Применяет исправления к общему ответу и получает из него наборы данных."""
+        snapshot: ExchangeSnapshot = self._snapshots[exchange]
+        adapter: AbstractAdapter = ADAPTERS_MAPPER[exchange]
+
+        if self._apply_fixes:
+            fixes: Dict[Dataset, Callable[[Any], Any]] = _FIXES.get(exchange, {})
+            for fix in dict.fromkeys(fixes[dataset] for dataset in datasets if dataset in fixes):
+                raw_data = fix(raw_data)
+
+        if exchange == Exchange.HYPERLIQUID and len(datasets) > 1:
+            # Ответ metaAndAssetCtxs разбирается один раз, наборы данных строятся из разобранного снимка
+            try:
+                raw_data = HyperliquidMarketSnapshot.from_raw(raw_data)
+            except Exception as e:
+                for dataset in datasets:
+                    snapshot["errors"][dataset] = f"{type(e).__name__}: {e}"
+                return
+
+        for dataset in datasets:
+            try:
+                snapshot[dataset] = derive(adapter, dataset, raw_data)
+                snapshot["updated"][dataset] = int(time.time() * 1000)
+                snapshot["errors"].pop(dataset, None)
+            except Exception as e:
+                snapshot["errors"][dataset] = f"{type(e).__name__}: {e}"
+
+    async def _refresh(self, exchange: Exchange) -> None:
+        """Обновляет данные биржи в пределах бюджета времени."""
+        client: AbstractClient = self._clients[exchange]
+        snapshot: ExchangeSnapshot = self._snapshots[exchange]
+        endpoints: Dict[str, List[Dataset]] = self._plans[exchange]["endpoints"]
+        if not endpoints:
+            return
+
+        started: float = time.monotonic()
+        tasks: Dict[asyncio.Task, str] = {asyncio.create_task(getattr(client, method)()): method for method in endpoints}
+        done, pending = await asyncio.wait(tasks, timeout=self._timeout)
+        for task in pending:
+            task.cancel()
+            for dataset in endpoints[tasks[task]]:
+                snapshot["errors"][dataset] = f"TimeoutError: no response in {self._timeout}s"
+        for task in done:
+            datasets: List[Dataset] = endpoints[tasks[task]]
+            error: Optional[BaseException] = task.exception()
+            if error is None:
+                self._adapt(exchange, datasets, task.result())
+            else:
+                for dataset in datasets:
+                    snapshot["errors"][dataset] = f"{type(error).__name__}: {error}"
+        snapshot["latency"] = time.monotonic() - started
+
+        if snapshot["errors"]:
+            self._logger.warning(f"{self} {exchange} snapshot errors: {snapshot['errors']}")
+
+    async def snapshot(self) -> MarketSnapshot:
+        """Обновляет данные всех бирж параллельно и возвращает снимок рынка."""
+        await asyncio.gather(*(self._refresh(exchange) for exchange in self._clients))
+        return MarketSnapshot(
+            t=int(time.time() * 1000),
+            exchanges={
+                exchange: ExchangeSnapshot(
+                    tickers=snapshot["tickers"],
+                    funding_rate=snapshot["funding_rate"],
+                    open_interest=snapshot["open_interest"],
+                    last_price=snapshot["last_price"],
+                    updated=dict(snapshot["updated"]),
+                    errors=dict(snapshot["errors"]),
+                    latency=snapshot["latency"],
+                )
+                for exchange, snapshot in self._snapshots.items()
+            },
+        )
+
+    async def close(self) -> None:
+        """Закрывает клиентов бирж."""
+        await asyncio.gather(*(client.close() for client in self._clients.values()))
+
+    def __repr__(self) -> str:
+        return f"<MarketSnapshotAggregator exchanges={len(self._clients)} timeout={self._timeout}s>"
@@ -0,0 +1,49 @@
+__all__ = ["plan_endpoints", "derive", ]
+
+from typing import Any, Dict, FrozenSet, Iterable, Set, Type
+
+from ..abstract import AbstractAdapter, AbstractClient
+from ..enums import Dataset
+from ..types import EndpointPlan
+
+# Набор данных -> метод адаптера, который получает его из сырого ответа
+_VIEWS: Dict[Dataset, str] = {
+    Dataset.TICKERS: "futures_ticker_24h",
+    Dataset.FUNDING_RATE: "funding_rate",
+    Dataset.OPEN_INTEREST: "open_interest",
+    Dataset.LAST_PRICE: "futures_last_price",
+}
+
+
+def plan_endpoints(client: AbstractClient | Type[AbstractClient], datasets: Iterable[Dataset]) -> EndpointPlan:
+    """
+    Выбирает минимальный набор запросов, который покрывает нужные наборы данных.
+
+    Многие биржи отдают несколько наборов данных в одном ответе (например, тикеры Bybit v5 содержат
+    ставку финансирования и открытый интерес, а metaAndAssetCtxs Hyperliquid - вообще все). Жадный
+    алгоритм покрытия на каждом шаге берет метод из client._BULK_ENDPOINTS, который покрывает больше
+    всего еще не покрытых наборов данных (при равенстве - объявленный раньше).
+
+    :param client: Клиент биржи или его класс.
+    :param datasets: Нужные наборы данных.
+    :return: EndpointPlan: метод клиента -> наборы данных из его ответа, и наборы данных, которые получить нельзя.
+    """
+    endpoints: Dict[str, FrozenSet[Dataset]] = client._BULK_ENDPOINTS
+    uncovered: Set[Dataset] = {Dataset(dataset) for dataset in datasets}
+    plan: EndpointPlan = EndpointPlan(endpoints={}, unsupported=[])
+
+    while uncovered:
+        method: str = max(endpoints, key=lambda m: len(endpoints[m] & uncovered), default="")
+        covered: FrozenSet[Dataset] = endpoints.get(method, frozenset()) & uncovered
+        if not covered:
+            break
+        plan["endpoints"][method] = [dataset for dataset in Dataset if dataset in covered]
+        uncovered -= covered
+
+    plan["unsupported"] = [dataset for dataset in Dataset if dataset in uncovered]
+    return plan
+
+
+def derive(adapter: Type[AbstractAdapter], dataset: Dataset, raw_data: Any) -> Any:
+    """Получает набор данных из сырого ответа с помощью адаптера биржи."""
+    return getattr(adapter, _VIEWS[Dataset(dataset)])(raw_data)
@@ -3,7 +3,7 @@ from typing import Any, List, Dict
 from ..abstract import AbstractAdapter
 from ..exceptions import AdapterException
 from ..types import TickerDailyItem, KlineDict, AggTradeDict, LiquidationDict, OpenInterestDict, OpenInterestItem, \
-    DepthDict
+    DepthDict, DepthArrays
 
 
 class MexcAdapter(AbstractAdapter):
@@ -247,9 +247,9 @@ class MexcAdapter(AbstractAdapter):
         raise NotImplementedError("Not implemented yet...")
 
     @staticmethod
-    def depth(raw_data: Any) -> DepthDict:
+    def depth(raw_data: Any, as_arrays: bool = False) -> DepthDict | DepthArrays:
         try:
-            return AbstractAdapter._parse_and_sort_depth(raw_data["asks"], raw_data["bids"])
+            return AbstractAdapter._parse_and_sort_depth(raw_data["asks"], raw_data["bids"], as_arrays)
         except Exception as e:
             raise AdapterException(f"BybitAdapter error: {e}")
 
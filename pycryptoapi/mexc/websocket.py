@@ -2,12 +2,12 @@ __all__ = ["MexcWebsocket", "MexcSocketManager", ]
 
 import json
 import time
-from typing import Optional, Union, List, Literal, Callable, Awaitable, Dict, Tuple
+from typing import Optional, Union, List, Literal, Callable, Awaitable, Dict, Tuple, Any
 
 from websockets.asyncio.client import ClientConnection
 import orjson
 
-from ..abstract import AbstractWebsocket, AbstractSocketManager
+from ..abstract import AbstractWebsocket, AbstractSocketManager, ClosedKlineBoundaryFilter
 from ..enums import MarketType, Timeframe, Exchange
 from ..exceptions import MarketException, TimeframeException
 from .spot_proto import PushDataV3ApiWrapper
@@ -62,6 +62,19 @@ class MexcWebsocket(AbstractWebsocket):
         else:
             raise ValueError("Invalid exchange type. Choose either 'spot' or 'future'.")
 
+    @staticmethod
+    def _kline_key(raw_msg: Any) -> Optional[Tuple[str, int]]:
+        """Возвращает (тикер, время открытия свечи) из сообщения kline (None, если это не свеча)."""
+        # Фьючерсы (JSON)
+        if isinstance(raw_msg, dict):
+            if raw_msg.get("channel") != "push.kline":
+                return None
+            data = raw_msg["data"]
+            return data["symbol"], int(data["t"])
+        # Спот (protobuf)
+        window_start = raw_msg.publicSpotKline.windowStart
+        return (raw_msg.symbol, window_start) if window_start else None
+
     @property
     def _ping_message(self) -> Optional[str]:
         if self._market_type == MarketType.SPOT:
@@ -82,13 +95,13 @@ class MexcWebsocket(AbstractWebsocket):
                 self._last_message_time = time.time()
                 self._logger.trace(f"{self} Received message: {message}")
                 if self._market_type == MarketType.FUTURES:
-                    await self._queue.put(orjson.loads(message))
+                    await self._put(orjson.loads(message))
                 else:
                     try:
                         if isinstance(message, bytes):
                             wrapper = PushDataV3ApiWrapper()  # noqa
                             wrapper.ParseFromString(message)
-                            await self._queue.put(wrapper)
+                            await self._put(wrapper)
                         else:
                             self._logger.debug(f"{self} pb recieved string: {message}")
                     except Exception as e:
@@ -134,8 +147,15 @@ class MexcSocketManager(AbstractSocketManager):
             timeframe: Timeframe,
             market_type: MarketType,
             callback: Callable[..., Awaitable],
+            closed_only: bool = False,
             **kwargs
     ) -> MexcWebsocket:
+        """
+        :param closed_only: Если True, в callback попадают только закрытые свечи. MEXC не передает флаг
+            закрытия, поэтому свеча считается закрытой, когда приходит обновление следующей свечи.
+        """
+        if closed_only:
+            kwargs["message_filter"] = ClosedKlineBoundaryFilter(MexcWebsocket._kline_key)
         if market_type == MarketType.SPOT:
             topic: str = "spot@public.kline.v3.api.pb"
         elif market_type == MarketType.FUTURES:
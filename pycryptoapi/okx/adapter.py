@@ -3,7 +3,7 @@ from typing import Any, List, Dict, Union
 from ..abstract import AbstractAdapter
 from ..exceptions import AdapterException
 from ..types import TickerDailyItem, KlineDict, OpenInterestItem, AggTradeDict, LiquidationDict, OpenInterestDict, \
-    DepthDict
+    DepthDict, DepthArrays
 
 
 class OkxAdapter(AbstractAdapter):
@@ -236,12 +236,12 @@ class OkxAdapter(AbstractAdapter):
         raise NotImplementedError("Not implemented yet...")
 
     @staticmethod
-    def depth(raw_data: Any) -> DepthDict:
+    def depth(raw_data: Any, as_arrays: bool = False) -> DepthDict | DepthArrays:
         try:
             data = raw_data["data"][0]
             asks = [(p, s) for p, s, *_ in data["asks"]]
             bids = [(p, s) for p, s, *_ in data["bids"]]
-            return AbstractAdapter._parse_and_sort_depth(asks, bids)
+            return AbstractAdapter._parse_and_sort_depth(asks, bids, as_arrays)
         except Exception as e:
             raise AdapterException(f"BybitAdapter error: {e}")
 
@@ -1,13 +1,23 @@
 __all__ = ["OkxClient"]
 
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet
 
 from ..abstract import AbstractClient
+from ..enums import Dataset
 
 
 class OkxClient(AbstractClient):
     _BASE_URL: str = "https://www.okx.com"
 
+    # open_interest() без аргументов отдает открытый интерес по всем тикерам
+    _OPEN_INTEREST_BULK: bool = True
+
+    # Методы без аргументов, отдающие данные по всем тикерам -> наборы данных, получаемые из их ответа
+    _BULK_ENDPOINTS: Dict[str, FrozenSet[Dataset]] = {
+        "futures_ticker": frozenset({Dataset.TICKERS, Dataset.LAST_PRICE}),
+        "open_interest": frozenset({Dataset.OPEN_INTEREST}),
+    }
+
     async def klines(self, *args, **kwargs) -> Any:
         raise NotImplementedError()
 
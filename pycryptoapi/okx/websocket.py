@@ -3,7 +3,7 @@ __all__ = ["OkxWebsocket", "OkxSocketManager"]
 import json
 from typing import Optional, List, Callable, Awaitable, Tuple
 
-from ..abstract import AbstractWebsocket, AbstractSocketManager
+from ..abstract import AbstractWebsocket, AbstractSocketManager, ClosedKlineFlagFilter
 from ..enums import Timeframe, Exchange
 from ..exceptions import TickersException
 
@@ -49,6 +49,14 @@ class OkxWebsocket(AbstractWebsocket):
     def _ping_message(self) -> Optional[str]:
         return None
 
+    @staticmethod
+    def _kline_is_closed(raw_msg: dict) -> Optional[List[bool]]:
+        """Возвращает флаги закрытия свечей сообщения candle по элементам data (None, если это не свеча)."""
+        if "data" not in raw_msg or not raw_msg["arg"]["channel"].startswith("candle"):
+            return None
+        # [ts, o, h, l, c, vol, volCcy, volCcyQuote, confirm]
+        return [kline[8] == "1" for kline in raw_msg["data"]]
+
 
 class OkxSocketManager(AbstractSocketManager):
 
@@ -72,8 +80,14 @@ class OkxSocketManager(AbstractSocketManager):
             tickers: List[str] | Tuple[str, ...],
             timeframe: Timeframe,
             callback: Callable[..., Awaitable],
+            closed_only: bool = False,
             **kwargs
     ) -> OkxWebsocket:
+        """
+        :param closed_only: Если True, в callback попадают только закрытые свечи (по полю "confirm").
+        """
+        if closed_only:
+            kwargs["message_filter"] = ClosedKlineFlagFilter(OkxWebsocket._kline_is_closed)
         return OkxWebsocket(
             topic=f"candle{timeframe.to_exchange_format(Exchange.OKX)}",
             tickers=tickers,
@@ -1,6 +1,7 @@
-from typing import TypedDict, Optional, Union, List, Dict, TypeAlias, Literal
+from array import array
+from typing import Any, TypedDict, Optional, Union, List, Dict, TypeAlias, Literal
 
-from .enums import Side
+from .enums import Dataset, Exchange, Side
 
 JsonLike: TypeAlias = Union[Dict, List]
 
@@ -56,3 +57,39 @@ type size = float
 class DepthDict(TypedDict):
     asks: List[tuple[price, size]]  # Идет от ближней цены к дальней
     bids: List[tuple[price, size]]  # Идет от ближней цены к дальней
+
+
+class DepthArrays(TypedDict):
+    """Стакан в виде плоских массивов float64: [price0, size0, price1, size1, ...] (Nx2 построчно).
+    Для numpy: np.frombuffer(depth["asks"]).reshape(-1, 2)"""
+    asks: array  # Идет от ближней цены к дальней
+    bids: array  # Идет от ближней цены к дальней
+
+
+class BulkResult(TypedDict):
+    """Результат пакетного запроса по списку тикеров. Ошибка по одному тикеру не ломает весь результат."""
+    data: Dict[str, Any]  # symbol -> унифицированные данные по тикеру
+    errors: Dict[str, str]  # symbol -> описание ошибки
+
+
+class ExchangeSnapshot(TypedDict):
+    """Рыночные данные одной биржи. Если обновление набора данных не удалось, остаются прошлые данные."""
+    tickers: Dict[str, TickerDailyItem]  # symbol -> изменение цены и объем за 24ч
+    funding_rate: Dict[str, float]  # symbol -> ставка финансирования
+    open_interest: OpenInterestDict  # symbol -> открытый интерес
+    last_price: Dict[str, float]  # symbol -> последняя цена
+    updated: Dict[str, int]  # набор данных -> время последнего успешного обновления (мс)
+    errors: Dict[str, str]  # набор данных -> ошибка последнего обновления
+    latency: float  # длительность обновления биржи (сек)
+
+
+class MarketSnapshot(TypedDict):
+    """Снимок рынка по всем биржам."""
+    t: int  # время снимка (мс)
+    exchanges: Dict[Exchange, ExchangeSnapshot]  # биржа -> данные биржи
+
+
+class EndpointPlan(TypedDict):
+    """План запросов: минимальный набор методов клиента, из ответов которых получаются нужные наборы данных."""
+    endpoints: Dict[str, List[Dataset]]  # метод клиента -> наборы данных, получаемые из его ответа
+    unsupported: List[Dataset]  # наборы данных, которые биржа не отдает по всем тикерам одним запросом
@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+from pycryptoapi import BinanceClient, KlineDownloader
+from pycryptoapi.enums import Exchange, MarketType, Timeframe
+from pycryptoapi.types import KlineDict
+
+
+async def sink(symbol: str, klines: list[KlineDict]):
+    print(f"{symbol}: {len(klines)} candles, {klines[0]['t']} -> {klines[-1]['t']}")
+
+
+async def main():
+    client = await BinanceClient.create()
+    downloader = KlineDownloader(
+        client=client,
+        exchange=Exchange.BINANCE,
+        market_type=MarketType.FUTURES,
+        timeframe=Timeframe.MIN_1,
+        max_concurrency=5,
+        checkpoint_path="klines.checkpoint.json",
+    )
+    end = int(time.time() * 1000)
+    start = end - 7 * 86400 * 1000
+    try:
+        result = await downloader.download(["BTCUSDT", "ETHUSDT"], start=start, end=end, sink=sink)
+        print(result)
+    finally:
+        await client.close()
+
+
+asyncio.run(main())
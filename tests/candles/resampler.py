@@ -0,0 +1,35 @@
+import asyncio
+
+from pycryptoapi import BinanceSocketManager, BinanceAdapter, KlineResampler
+from pycryptoapi.enums import MarketType, Timeframe
+from pycryptoapi.exceptions import AdapterException
+
+resampler = KlineResampler(
+    base=Timeframe.MIN_1,
+    targets=[Timeframe.MIN_5, Timeframe.MIN_15, Timeframe.HOUR_1, Timeframe.HOUR_4],
+)
+
+
+async def callback(msg):
+    try:
+        for kline in BinanceAdapter.kline_message(raw_msg=msg):
+            for higher in resampler.update(kline):
+                if higher["x"]:
+                    print("CLOSED", higher)
+                else:
+                    print(higher["s"], higher["i"], higher["c"])
+    except AdapterException as e:
+        print(f"Can not adapt message ({e}): {msg}")
+
+
+async def main():
+    socket = BinanceSocketManager.klines_socket(
+        market_type=MarketType.FUTURES,
+        tickers=["BTCUSDT", "ETHUSDT"],
+        timeframe=Timeframe.MIN_1,
+        callback=callback,
+    )
+    await socket.start()
+
+
+asyncio.run(main())
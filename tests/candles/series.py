@@ -0,0 +1,33 @@
+import asyncio
+
+from pycryptoapi import BinanceClient, KlineSeries
+from pycryptoapi.enums import Exchange, MarketType, Timeframe
+from pycryptoapi.types import KlineDict
+
+
+async def callback(klines: list[KlineDict]):
+    if len(klines) > 1:
+        print(f"{klines[0]['s']}: history loaded, {len(klines)} candles, last: {klines[-1]}")
+    else:
+        print(klines[0])
+
+
+async def main():
+    client = await BinanceClient.create()
+    series = KlineSeries(
+        exchange=Exchange.BINANCE,
+        market_type=MarketType.FUTURES,
+        tickers=["BTCUSDT", "ETHUSDT", "SOLUSDT"],
+        timeframe=Timeframe.MIN_1,
+        callback=callback,
+        client=client,
+        history=500,
+        max_concurrency=5,
+    )
+    try:
+        await series.start()
+    finally:
+        await client.close()
+
+
+asyncio.run(main())
@@ -0,0 +1,26 @@
+import asyncio
+
+from pycryptoapi import trade_klines_socket
+from pycryptoapi.enums import Exchange, MarketType, Timeframe
+from pycryptoapi.types import KlineDict
+
+
+async def callback(klines: list[KlineDict]):
+    for kline in klines:
+        print(kline)
+
+
+async def main():
+    # У Gate нет kline вебсокета, поэтому свечи собираются из потока сделок
+    socket = trade_klines_socket(
+        exchange=Exchange.GATE,
+        market_type=MarketType.SPOT,
+        tickers=["BTC_USDT", "ETH_USDT"],
+        timeframe=Timeframe.MIN_1,
+        callback=callback,
+        emit_updates=False,
+    )
+    await socket.start()
+
+
+asyncio.run(main())
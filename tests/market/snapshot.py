@@ -0,0 +1,21 @@
+import asyncio
+
+from pycryptoapi import MarketSnapshotAggregator, close_shared_session
+
+
+async def main():
+    aggregator = MarketSnapshotAggregator(timeout=3)
+    try:
+        for _ in range(3):
+            snapshot = await aggregator.snapshot()
+            for exchange, data in snapshot["exchanges"].items():
+                print(f"{exchange}: tickers={len(data['tickers'])} funding={len(data['funding_rate'])} "
+                      f"oi={len(data['open_interest'])} latency={data['latency']:.2f}s "
+                      f"updated={data['updated']} errors={data['errors']}")
+            await asyncio.sleep(5)
+    finally:
+        await close_shared_session()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())